@@ -16,15 +16,25 @@
 # the License.
 #
 from __future__ import print_function, unicode_literals
-import compileall
+import contextlib
+import copy
+import hashlib
+import json
+import multiprocessing
 import os
+import py_compile
 import re
+import struct
 import subprocess
 import shutil
+import stat
 import glob
 import fnmatch
 import sys
+import time
 import zipfile
+import zlib
+import bundle
 from logging import (critical as crit, error as eror,
                      info, debug as debg)
 
@@ -36,6 +46,28 @@ VERSION = {
     "lib": ""
 }
 
+# the time stamp of all zip entries, for the same zips from the same files.
+ZIP_DATE_TIME = time.gmtime(int(os.environ.get("SOURCE_DATE_EPOCH",
+                                               315532800)))[:6]
+
+# the entry of a delta zip listing the files removed.
+DELETED_LIST = ".deleted"
+
+# (pattern, compress_type, level) of zip entries, the 1st match is used.
+# .so and .pyc are deflated to 40% and 36%, they are not stored.
+COMPRESSION = [
+    ("*.zip", zipfile.ZIP_STORED, 0),
+    ("*.egg", zipfile.ZIP_STORED, 0),
+    ("*.jar", zipfile.ZIP_STORED, 0),
+    ("*.gz", zipfile.ZIP_STORED, 0),
+    ("*.tgz", zipfile.ZIP_STORED, 0),
+    ("*.bz2", zipfile.ZIP_STORED, 0),
+    ("*.png", zipfile.ZIP_STORED, 0),
+    ("*.jpg", zipfile.ZIP_STORED, 0),
+    ("*.gif", zipfile.ZIP_STORED, 0),
+    ("*", zipfile.ZIP_DEFLATED, 9),
+]
+
 
 class cfg:
     fExtra = fLib = fScripts = fBin = False
@@ -43,6 +75,10 @@ class cfg:
     dest = "python_arm"
     path_jni = "python/obj/local"
     path_bin = os.path.join(path_jni, "armeabi")
+    jobs = multiprocessing.cpu_count()
+    # stripped binaries keyed by the sha1 of their unstripped contents.
+    path_cache = ".build-cache"
+    timings = []
 
 
 def options():
@@ -64,9 +100,18 @@ def options():
             cfg.fScripts = True
         elif arg in ("bin", ):
             cfg.fBin = True
+        elif arg.startswith("-j"):
+            cfg.jobs = max(int(arg[2:]), 1)
     assert cfg.fExtra or cfg.fLib or cfg.fScripts or cfg.fBin
 
 def main():
+    if "delta" in sys.argv:
+        # build.py delta old.zip new.zip [delta.zip]
+        import logging
+        logging.getLogger("").setLevel(logging.INFO)
+        i = sys.argv.index("delta")
+        zipdelta(*sys.argv[i + 1:i + 4])
+        return
     options()
 
     # get version
@@ -81,14 +126,54 @@ def main():
     pwd = os.getcwd()
     cfg.dest = os.path.abspath(os.path.join(pwd, cfg.dest))
     cfg.path_bin = os.path.abspath(os.path.join(pwd, cfg.path_bin)) + "/"
+    cfg.path_cache = os.path.abspath(os.path.join(pwd, cfg.path_cache))
+
+    with timed("total"):
+        if cfg.fLib:
+            with timed("lib"):
+                zipup_libs(pwd)
+        if cfg.fExtra:
+            with timed("extra"):
+                zipup_extra(pwd)
+        # zipup_cleanup()
+        if cfg.fBin:
+            with timed("bin"):
+                zipup_bin(pwd)
+        if cfg.fScripts:
+            with timed("scripts"):
+                zipup_script(pwd)
+    for name, sec in cfg.timings:
+        info("%-24s %8.2fs" % (name, sec))
+    info('Done.')
 
-    cfg.fLib and zipup_libs(pwd)
 
-    cfg.fExtra and zipup_extra(pwd)
-    # zipup_cleanup()
-    cfg.fBin and zipup_bin(pwd)
-    cfg.fScripts and zipup_script(pwd)
-    info('Done.')
+@contextlib.contextmanager
+def timed(name):
+    t = time.time()
+    yield
+    cfg.timings.append((name, time.time() - t))
+
+
+def pmap(fn, items):
+    """map() over cfg.jobs processes, fn must be a module level one."""
+    items = list(items)
+    if cfg.jobs < 2 or len(items) < 2:
+        return list(map(fn, items))
+    pool = multiprocessing.Pool(cfg.jobs)
+    try:
+        chunk = max(len(items) // cfg.jobs // 4, 1)
+        return pool.map(fn, items, chunksize=chunk)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def digest(path):
+    h = hashlib.sha1()
+    with open(path, "rb") as fp:
+        for block in iter(lambda: fp.read(65536), b""):
+            h.update(block)
+    return h.hexdigest()
 
 
 def run(cmd, exit=True, cwd=None):
@@ -145,7 +230,7 @@ def rm(path):
         pass
 
 
-def strip(path):
+def strip_command(path):
     ndkpath = os.environ["NDK_PATH"]
     toolchain = os.path.join(
         ndkpath, "toolchains/arm-linux-androideabi-4.9/prebuilt/"
@@ -154,29 +239,264 @@ def strip(path):
         toolchain = os.path.join(
             ndkpath, "toolchains/x86-4.9/prebuilt/"
                      "linux-x86_64/i686-linux-android")
-    run('%s/bin/strip %s' % (toolchain, path))
+    return '%s/bin/strip %s' % (toolchain, path)
+
+
+def strip(path):
+    run(strip_command(path))
+
+
+def _call(cmd):
+    return subprocess.call(cmd.split())
+
+
+def strip_all(paths):
+    """strips binaries in parallel, reusing the cached strip results."""
+    # strip the targets of symlinks once.
+    paths = [path for path in paths if not os.path.islink(path)]
+    if not os.path.isdir(cfg.path_cache):
+        os.makedirs(cfg.path_cache)
+    todo = []
+    for path, sha1 in zip(paths, pmap(digest, paths)):
+        cached = os.path.join(cfg.path_cache, sha1)
+        if os.path.isfile(cached):
+            debg("strip: %s from cache" % path)
+            shutil.copy2(cached, path)
+        else:
+            todo.append((path, cached))
+    info("strip: %d binaries, %d from cache" % (len(paths),
+                                                len(paths) - len(todo)))
+    cmds = [strip_command(path) for path, cached in todo]
+    for (path, cached), cmd, ret in zip(todo, cmds, pmap(_call, cmds)):
+        debg(cmd)
+        if ret != 0:
+            crit('Failed!')
+            sys.exit(1)
+        shutil.copy2(path, cached)
+        # stripping a stripped one gives the same.
+        shutil.copy2(path, os.path.join(cfg.path_cache, digest(path)))
 
 
-def zipup(out_path, in_path, top, exclude=None, prefix=''):
+def _compile(path):
+    try:
+        py_compile.compile(path, doraise=True)
+    except py_compile.PyCompileError as ex:
+        return ex.msg
+    return None
+
+
+def compile_dir(root):
+    """compileall.compile_dir() in parallel, the up-to-date ones skipped."""
+    paths = []
+    for path in find(root, r"\.py$")[0]:
+        out = path + ("c" if __debug__ else "o")
+        if (not os.path.isfile(out) or
+                os.stat(out).st_mtime < os.stat(path).st_mtime):
+            paths.append(path)
+    info("compile: %d modules in %s" % (len(paths), root))
+    for msg in pmap(_compile, paths):
+        if msg is not None:
+            eror(msg)
+
+
+def compression(arcname):
+    for pat, compress_type, level in COMPRESSION:
+        if fnmatch.fnmatch(arcname, pat):
+            return compress_type, level
+    return zipfile.ZIP_DEFLATED, zlib.Z_DEFAULT_COMPRESSION
+
+
+def _deflate(args):
+    path, compress_type, level = args
+    with open(path, "rb") as fp:
+        data = fp.read()
+    data_z = data
+    if compress_type == zipfile.ZIP_DEFLATED:
+        co = zlib.compressobj(level, zlib.DEFLATED, -15)
+        data_z = co.compress(data) + co.flush()
+    return zlib.crc32(data) & 0xffffffff, len(data), data_z
+
+
+def read_raw(zip_file, zinfo):
+    """compressed bytes of an entry, as they are stored in the zip."""
+    fp = zip_file.fp
+    fp.seek(zinfo.header_offset)
+    header = fp.read(zipfile.sizeFileHeader)
+    fname_len, extra_len = struct.unpack("<HH", header[26:30])
+    fp.seek(zinfo.header_offset + zipfile.sizeFileHeader +
+            fname_len + extra_len)
+    return fp.read(zinfo.compress_size)
+
+
+# write_raw appends the compressed bytes by the private _writecheck and
+# _didModify of ZipFile, which are checked with the zipfile of python 2.7
+# (2.7.8 and later, as the host python).  the zipfile of other versions
+# keeps more state of the writes, the data is recompressed by writestr().
+_raw_writes = (sys.version_info[:2] == (2, 7) and
+               hasattr(zipfile.ZipFile, "_writecheck"))
+
+
+def write_raw(zip_file, zinfo, data):
+    """ZipFile.writestr() of data already compressed, zinfo.CRC,
+    file_size and compress_size must be set.
+    """
+    if not _raw_writes:
+        if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+            data = zlib.decompress(data, -15)
+        zip_file.writestr(zinfo, data)
+        return
+    zinfo.header_offset = zip_file.fp.tell()
+    zip_file._writecheck(zinfo)
+    zip_file._didModify = True
+    zip64 = (zinfo.file_size > zipfile.ZIP64_LIMIT or
+             zinfo.compress_size > zipfile.ZIP64_LIMIT)
+    zip_file.fp.write(zinfo.FileHeader(zip64))
+    zip_file.fp.write(data)
+    zip_file.filelist.append(zinfo)
+    zip_file.NameToInfo[zinfo.filename] = zinfo
+
+
+def zipup(out_path, in_path, top, exclude=None, prefix='', skip=()):
+    with timed("zipup: %s" % os.path.basename(out_path)):
+        _zipup(out_path, in_path, top, exclude, prefix, set(skip))
+
+
+def _zipup(out_path, in_path, top, exclude, prefix, skip):
+    """zips in_path up, skipping the work for files not changed.
+
+    out_path.manifest records the size, mtime and sha1 of each entry,
+    entries of the same sha1 are copied from the previous zip without
+    recompression and the others are deflated in parallel.  the manifest
+    also records ZIP_DATE_TIME and COMPRESSION, all the entries are
+    made again when one of them changed.
+
+    entries are sorted, stamped with ZIP_DATE_TIME and compressed as
+    COMPRESSION says, so the same files make the same zip.
+    """
     info("zipup: %s" % out_path)
-    # Remove an existing zip file.
-    rm(out_path)
+    manifest_path = out_path + ".manifest"
+    settings = {"date_time": list(ZIP_DATE_TIME),
+                "compression": [list(i) for i in COMPRESSION]}
+    old = {}
+    if os.path.isfile(out_path) and os.path.isfile(manifest_path):
+        try:
+            with open(manifest_path) as fp:
+                saved = json.load(fp)
+        except ValueError:
+            saved = {}
+        if saved.get("settings") == settings:
+            old = saved["entries"]
+        else:
+            info("zipup: %s was made with other settings" % out_path)
 
-    zip_file = zipfile.ZipFile(out_path, 'w', compression=zipfile.ZIP_DEFLATED)
+    entries = []
     for path in find(in_path, exclude=exclude)[0]:
+        if os.path.isdir(path) and not os.path.islink(path):
+            continue
+        if path in skip:
+            continue
+        arcname = prefix + path[len(top):].lstrip('/')
+        entries.append((arcname, path, os.lstat(path)))
+    entries.sort()
+
+    manifest, changed = {}, []
+    for arcname, path, st in entries:
+        prev = old.get(arcname)
+        if os.path.islink(path):
+            manifest[arcname] = [0, 0, "->" + os.readlink(path)]
+        elif prev and prev[:2] == [st.st_size, st.st_mtime]:
+            manifest[arcname] = prev
+        else:
+            changed.append((arcname, path, st))
+    for (arcname, path, st), sha1 in zip(
+            changed, pmap(digest, [i[1] for i in changed])):
+        manifest[arcname] = [st.st_size, st.st_mtime, sha1]
+    if manifest == old:
+        info("zipup: %s is up to date" % out_path)
+        return
+
+    old_zip = zipfile.ZipFile(out_path) if old else None
+    reuse = set(arcname for arcname, v in manifest.items()
+                if arcname in old and old[arcname][2] == v[2] and
+                arcname in old_zip.NameToInfo and
+                old_zip.NameToInfo[arcname].compress_type ==
+                compression(arcname)[0])
+    todo = [(path, ) + compression(arcname) for arcname, path, st in entries
+            if arcname not in reuse and not os.path.islink(path)]
+    info("zipup: %d entries, %d to compress" % (len(entries), len(todo)))
+    deflated = dict(zip([i[0] for i in todo], pmap(_deflate, todo)))
+
+    tmp_path = out_path + ".tmp"
+    zip_file = zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED)
+    for arcname, path, st in entries:
         if os.path.islink(path):
-                dest = os.readlink(path)
-                attr = zipfile.ZipInfo()
-                attr.filename = prefix + path[len(top):].lstrip('/')
-                attr.create_system = 3
-                # long type of hex say, symlink attr magic...
-                attr.external_attr = 0xA1ED0000L
-                zip_file.writestr(attr, dest)
-        elif not os.path.isdir(path):
-            arcname = prefix + path[len(top):].lstrip('/')
-            debg('Adding %s to %s' % (arcname, out_path))
-            zip_file.write(path, arcname)
+            dest = os.readlink(path)
+            attr = zipfile.ZipInfo(arcname, ZIP_DATE_TIME)
+            attr.create_system = 3
+            # long type of hex say, symlink attr magic...
+            attr.external_attr = 0xA1ED0000L
+            zip_file.writestr(attr, dest)
+            continue
+        debg('Adding %s to %s' % (arcname, out_path))
+        zinfo = zipfile.ZipInfo(arcname, ZIP_DATE_TIME)
+        zinfo.create_system = 3
+        mode = 0o755 if st.st_mode & 0o111 else 0o644
+        zinfo.external_attr = (stat.S_IFREG | mode) << 16
+        zinfo.compress_type = compression(arcname)[0]
+        if arcname in reuse:
+            prev = old_zip.getinfo(arcname)
+            zinfo.CRC, zinfo.file_size = prev.CRC, prev.file_size
+            data = read_raw(old_zip, prev)
+        else:
+            zinfo.CRC, zinfo.file_size, data = deflated[path]
+        zinfo.compress_size = len(data)
+        write_raw(zip_file, zinfo, data)
+    zip_file.close()
+    old_zip and old_zip.close()
+
+    os.rename(tmp_path, out_path)
+    with open(manifest_path, "w") as fp:
+        json.dump({"settings": settings, "entries": manifest}, fp,
+                  indent=0, sort_keys=True)
+
+
+def zipdelta(old_path, new_path, out_path=None):
+    """zips up the entries of new_path changed from old_path.
+
+    the entries removed are listed in DELETED_LIST of the delta, update
+    the files of old_path to new_path by:
+        unzip -o delta.zip && xargs rm -f < .deleted && rm .deleted
+    """
+    if out_path is None:
+        out_path = "%s_from_%s" % (os.path.splitext(new_path)[0],
+                                   os.path.basename(old_path))
+    info("zipdelta: %s" % out_path)
+    old_zip = zipfile.ZipFile(old_path)
+    new_zip = zipfile.ZipFile(new_path)
+    olds = dict((i.filename, (i.CRC, i.file_size, i.external_attr))
+                for i in old_zip.infolist())
+    zip_file = zipfile.ZipFile(out_path, 'w')
+    names = set()
+    for zinfo in new_zip.infolist():
+        names.add(zinfo.filename)
+        if olds.get(zinfo.filename) == (zinfo.CRC, zinfo.file_size,
+                                        zinfo.external_attr):
+            continue
+        debg('Adding %s to %s' % (zinfo.filename, out_path))
+        data = read_raw(new_zip, zinfo)
+        zinfo = copy.copy(zinfo)
+        write_raw(zip_file, zinfo, data)
+    deleted = sorted(set(olds) - names)
+    attr = zipfile.ZipInfo(DELETED_LIST, ZIP_DATE_TIME)
+    attr.create_system = 3
+    attr.external_attr = (stat.S_IFREG | 0o644) << 16
+    zip_file.writestr(attr, "".join(i + "\n" for i in deleted).encode("utf-8"))
+    info("zipdelta: %d changed, %d deleted" % (len(zip_file.filelist) - 1,
+                                               len(deleted)))
     zip_file.close()
+    new_zip.close()
+    old_zip.close()
+    return out_path
 
 
 def install_py4a(pwd):                                      # {{{1
@@ -274,12 +594,19 @@ def zipup_extra(pwd):                                       # {{{1
             os.remove(fdest)
         shutil.copy2(fname, fdest)
 
-    compileall.compile_dir(root, quiet=True)
+    with timed("extra: compile"):
+        compile_dir(root)
     map(rename_pyo_pyc, find(root, ".pyo")[0])
 
+    # pure python modules are imported from python27.zip, see python2.sh.
+    with timed("extra: bundle"):
+        bundled = bundle.bundle(os.path.join(root, "python"),
+                                os.path.join(root, "python", "python27.zip"))
+    info("bundle: %d modules in python27.zip" % len(bundled))
+
     zipup('python_extras%s.zip' % VERSION["extra"],
           root, root,
-          exclude=["*.exe", "*.py", "*.pyo"])
+          exclude=["*.exe", "*.py", "*.pyo"], skip=bundled)
 
 
 def zipup_cleanup(pwd):                                     # {{{1
@@ -344,14 +671,14 @@ def zipup_bin(pwd):                                         # {{{1
     copyre(cfg.path_bin, "^lib.*\.so.*$", outlib)
     copyre(cfg.path_bin, "^(?!lib).*\.so*$", output)
 
-    info('Strip them...')
-    map(strip, find(root, '\.so$')[0])      # make 8M => 3M
-    strip(root + '/python/bin/python')
-
     info('Removing unecessary files and directories from installation.')
     # Locale not supported on Android.
     map(rm, find(output, '_locale.so$')[0])
 
+    info('Strip them...')
+    with timed("bin: strip"):              # make 8M => 3M
+        strip_all(find(root, '\.so$')[0] + [root + '/python/bin/python'])
+
     zipup('python%s%s.zip' % (VERSION[""], cfg.plat),
           root, root)
     # exclude=['*.pyc',  '*.py'], prefix="python/")
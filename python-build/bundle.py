@@ -0,0 +1,112 @@
+#!env python
+#
+# Copyright (C) 2026 Shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+#
+"""packs the compiled pure python modules of a library tree into a zip.
+
+with the zip in PYTHONPATH, zipimport finds a module in the central
+directory read once at the 1st import, instead of stat()ing the
+directories of sdcard for every import.
+
+only top level modules and packages of .pyc files are packed, packages
+with data files or extension modules, site-packages and test packages
+stay in the tree.  .pyc must be in the legacy place (compileall -b for
+python3).
+
+usage: python bundle.py [--remove] root out.zip
+    --remove: delete the packed files from root.
+"""
+from __future__ import print_function
+import os
+import sys
+import time
+import zipfile
+
+# not packed: found by site.py as a directory, or tests.
+EXCLUDE = ("site-packages", "test", "tests")
+
+# the time stamp of the zip entries, see build.py.
+ZIP_DATE_TIME = time.gmtime(int(os.environ.get("SOURCE_DATE_EPOCH",
+                                               315532800)))[:6]
+
+
+def is_pure(path):
+    """a package dir only of python code, without tests."""
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [i for i in dirs
+                   if i not in EXCLUDE and i != "__pycache__"]
+        for fname in files:
+            if os.path.splitext(fname)[1] not in (".py", ".pyc", ".pyo"):
+                return False
+    return True
+
+
+def modules(root):
+    """yields (arcname, path) of the .pyc to be packed."""
+    for name in sorted(os.listdir(root)):
+        path = os.path.join(root, name)
+        if os.path.isfile(path):
+            if name.endswith(".pyc"):
+                yield name, path
+            continue
+        if (name in EXCLUDE or
+                not os.path.isfile(os.path.join(path, "__init__.pyc")) or
+                not is_pure(path)):
+            continue
+        for top, dirs, files in os.walk(path):
+            dirs[:] = sorted(i for i in dirs if i not in EXCLUDE and
+                             os.path.isfile(os.path.join(top, i,
+                                                         "__init__.pyc")))
+            for fname in sorted(files):
+                if fname.endswith(".pyc"):
+                    fpath = os.path.join(top, fname)
+                    yield os.path.relpath(fpath, root), fpath
+
+
+def bundle(root, out_path):
+    """writes out_path, returns the list of paths packed."""
+    paths = []
+    zip_file = zipfile.ZipFile(out_path, "w", zipfile.ZIP_DEFLATED)
+    for arcname, path in modules(root):
+        zinfo = zipfile.ZipInfo(arcname.replace(os.sep, "/"), ZIP_DATE_TIME)
+        zinfo.create_system = 3
+        zinfo.external_attr = 0o100644 << 16
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        with open(path, "rb") as fp:
+            zip_file.writestr(zinfo, fp.read())
+        paths.append(path)
+    zip_file.close()
+    return paths
+
+
+def main():
+    args = sys.argv[1:]
+    remove = "--remove" in args
+    if remove:
+        args.remove("--remove")
+    if len(args) != 2:
+        print(__doc__)
+        sys.exit(1)
+    root, out_path = args
+    paths = bundle(root, out_path)
+    print("bundle: %d modules in %s" % (len(paths), out_path))
+    if remove:
+        for path in paths:
+            os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function
+import atexit
 import sysconfig
+import threading
 from distutils import sysconfig as dstconfig
 import os
 
@@ -43,24 +45,54 @@ if cross_compiling:
         dstconfig.get_config_vars()[override[0]] = v
 
 
+# optimization profiles {{{1
+# PY4A_PROFILE selects one, python-modules/profile.mk tags the wheels.
+_armv5 = ("-D__ARM_ARCH_5__ -D__ARM_ARCH_5T__ -D__ARM_ARCH_5E__"
+          " -D__ARM_ARCH_5TE__ -march=armv5te -mtune=xscale -msoft-float"
+          " -mthumb")
+PROFILES = {
+    "size": {"target": "arm-linux-androideabi", "arch": _armv5,
+             "opt": "-Os -finline-limit=64", "ldflags": ""},
+    "speed": {"target": "arm-linux-androideabi", "arch": _armv5,
+              "opt": "-O2 -finline-limit=64", "ldflags": ""},
+    "armv7-neon": {"target": "arm-linux-androideabi",
+                   "arch": "-march=armv7-a -mfloat-abi=softfp -mfpu=neon"
+                           " -mthumb",
+                   "opt": "-O2 -ftree-vectorize",
+                   "ldflags": " -Wl,--fix-cortex-a8"},
+    "x86-sse": {"target": "i686-linux-android",
+                "arch": "-march=i686 -mtune=atom -mssse3 -mfpmath=sse",
+                "opt": "-O2 -ftree-vectorize", "ldflags": ""},
+}
+# flags of all profiles.
+_cflags = (" -MMD -MP -MF -fpic -ffunction-sections -funwind-tables"
+           " -fstack-protector -Wno-psabi"
+           " -fomit-frame-pointer -fno-strict-aliasing"
+           " -DANDROID  -Wa,--noexecstack -DNDEBUG -g")
+
+
+def profile():
+    """returns the profile selected by PY4A_PROFILE (default: speed)."""
+    name = os.environ.get("PY4A_PROFILE", "speed")
+    try:
+        return PROFILES[name]
+    except KeyError:
+        raise SystemExit("py4a: unknown PY4A_PROFILE %s, select from %s" % (
+                         name, ", ".join(sorted(PROFILES))))
+
+
+# compilers {{{1
 def customize_compiler36(compiler):
+    prof = profile()
     sysroot = " --sysroot=%s" % os.environ["ANDROID_SYSROOT"]
-    cflags = ("-I%s" % os.environ["PY4A_INC"] +
-              " -MMD -MP -MF -fpic -ffunction-sections -funwind-tables"
-              " -fstack-protector"
-              " -D__ARM_ARCH_5__ -D__ARM_ARCH_5T__ -D__ARM_ARCH_5E__"
-              " -D__ARM_ARCH_5TE__"
-              " -Wno-psabi -march=armv5te -mtune=xscale -msoft-float"
-              " -mthumb -Os"
-              " -fomit-frame-pointer -fno-strict-aliasing -finline-limit=64"
-              " -DANDROID  -Wa,--noexecstack -O2 -DNDEBUG -g" +
-              sysroot)
-    cc = "arm-linux-androideabi-gcc"
+    cflags = ("-I%s" % os.environ["PY4A_INC"] + _cflags +
+              " %(arch)s %(opt)s" % prof + sysroot)
+    cc = "%(target)s-gcc" % prof
     os.environ["CC"] = cc
-    cxx = "arm-linux-androideabi-g++"
-    cpp = "arm-linux-androideabi-cpp"
+    cxx = "%(target)s-g++" % prof
+    cpp = "%(target)s-cpp" % prof
     ldshared = "%s -shared" % cxx
-    ldshared += sysroot
+    ldshared += sysroot + prof["ldflags"]
     # removed -lsupc++
     ldshared += (" -lc -lstdc++ -lm -lpython3.6m"
                  " -Wl,--no-undefined -Wl,-z,noexecstack")
@@ -95,6 +127,141 @@ def customize_compiler2(compiler):
     sysroot = " --sysroot=%s" % os.environ["ANDROID_SYSROOT"]
 
 
+# object cache and parallel compile {{{1
+# PY4A_CACHE: directory of the cached objects, "off" to disable.
+# PY4A_JOBS: number of the sources compiled at once (default: cpus).
+cache_dir = os.environ.get("PY4A_CACHE",
+                           os.path.expanduser("~/.cache/py4a"))
+cache_stats = {"hit": 0, "miss": 0}
+# cache_stats is counted from the compile threads.
+_stats_lock = threading.Lock()
+
+
+def _jobs():
+    try:
+        return int(os.environ["PY4A_JOBS"])
+    except KeyError:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+
+
+def _compiler_id(exe):
+    """identifies the compiler binary by its path, size and mtime."""
+    from distutils.spawn import find_executable
+    path = find_executable(exe) or exe
+    try:
+        st = os.stat(path)
+    except OSError:
+        return path
+    return "%s %d %d" % (path, st.st_size, int(st.st_mtime))
+
+
+def _cache_key(compiler, src, cc_args, extra_postargs):
+    """sha1 of the preprocessed source (headers expanded) and flags."""
+    import hashlib
+    import subprocess
+    cmd = (compiler.compiler_so + [i for i in cc_args if i != "-c"] +
+           ["-E", src] + extra_postargs)
+    try:
+        out = subprocess.check_output(cmd)
+    except (OSError, subprocess.CalledProcessError):
+        return None     # let the real compile report the error.
+    h = hashlib.sha1(out)
+    h.update(_compiler_id(compiler.compiler_so[0]).encode("utf-8"))
+    h.update("\0".join(compiler.compiler_so + cc_args +
+                       extra_postargs).encode("utf-8"))
+    return h.hexdigest()
+
+
+def cached_compile(compiler):
+    """wraps compiler._compile with a content-addressed object cache."""
+    import shutil
+    from distutils import log
+    orig = compiler._compile
+
+    def _compile(obj, src, ext, cc_args, extra_postargs, pp_opts):
+        key = _cache_key(compiler, src, cc_args, extra_postargs)
+        if key is None:
+            return orig(obj, src, ext, cc_args, extra_postargs, pp_opts)
+        cached = os.path.join(cache_dir, key[:2], key[2:] + ".o")
+        if os.path.exists(cached):
+            log.info("py4a cache: %s", src)
+            with _stats_lock:
+                cache_stats["hit"] += 1
+            shutil.copy(cached, obj)
+            return
+        with _stats_lock:
+            cache_stats["miss"] += 1
+        orig(obj, src, ext, cc_args, extra_postargs, pp_opts)
+        if not os.path.isdir(os.path.dirname(cached)):
+            try:
+                os.makedirs(os.path.dirname(cached))
+            except OSError:
+                pass    # made by other job.
+        tmp = "%s.%d.tmp" % (cached, os.getpid())
+        shutil.copy(obj, tmp)
+        os.rename(tmp, cached)
+
+    compiler._compile = _compile
+
+
+def parallel_compile(compiler, jobs):
+    """replaces compiler.compile with one running _compile in threads."""
+    from multiprocessing.pool import ThreadPool
+
+    def compile(sources, output_dir=None, macros=None, include_dirs=None,
+                debug=0, extra_preargs=None, extra_postargs=None,
+                depends=None):
+        macros, objects, extra_postargs, pp_opts, build = \
+            compiler._setup_compile(output_dir, macros, include_dirs,
+                                    sources, depends, extra_postargs)
+        cc_args = compiler._get_cc_args(pp_opts, debug, extra_preargs)
+
+        def one(obj):
+            if obj not in build:
+                return      # up to date.
+            src, ext = build[obj]
+            compiler._compile(obj, src, ext, cc_args, extra_postargs,
+                              pp_opts)
+
+        pool = ThreadPool(jobs)
+        try:
+            pool.map(one, objects)
+        finally:
+            pool.close()
+            pool.join()
+        return objects
+
+    compiler.compile = compile
+
+
+def _plain_compile(compiler):
+    """True if compiler.compile is the one of distutils.
+
+    numpy.distutils replaces CCompiler.compile with its own, which
+    handles the fortran sources and dependencies; it still calls
+    _compile for each object, so the object cache works with it.
+    """
+    fn = compiler.__class__.compile     # an old style class in python2.
+    fn = getattr(fn, "__func__", fn)
+    return fn.__module__ in ("distutils.ccompiler",
+                             "setuptools._distutils.ccompiler")
+
+
+def wrap_compiler(compiler):
+    """adds the object cache and parallel compile to the compiler."""
+    if cache_dir != "off":
+        cached_compile(compiler)
+    jobs = _jobs()
+    if jobs > 1 and _plain_compile(compiler):
+        parallel_compile(compiler, jobs)
+
+
+def _report_cache():
+    if cache_stats["hit"] or cache_stats["miss"]:
+        print("py4a cache: %(hit)d hits, %(miss)d misses" % cache_stats)
+
+
 def patch_distutils():
     import os
     from distutils import sysconfig
@@ -109,19 +276,17 @@ def patch_distutils():
     setattr(sysconfig, 'get_python_inc', get_python_inc)
 
     def customize_compiler(compiler):
+        sysroot = " --sysroot=%s" % os.environ["ANDROID_SYSROOT"]
+        prof = profile()
         cflags = "-I%s/python2.7" % os.environ["PY4A_INC"]
-        cflags+=" -MMD -MP -MF -fpic -ffunction-sections -funwind-tables -fstack-protector"
-        cflags+=" -D__ARM_ARCH_5__ -D__ARM_ARCH_5T__ -D__ARM_ARCH_5E__ -D__ARM_ARCH_5TE__"
-        cflags+=" -Wno-psabi -march=armv5te -mtune=xscale -msoft-float -mthumb -Os"
-        cflags+=" -fomit-frame-pointer -fno-strict-aliasing -finline-limit=64"
-        cflags+=" -DANDROID  -Wa,--noexecstack -O2 -DNDEBUG -g"
+        cflags += _cflags + " %(arch)s %(opt)s" % prof
         cflags += sysroot
-        cc = "arm-linux-androideabi-gcc"
+        cc = "%(target)s-gcc" % prof
         os.environ["CC"] = cc
-        cxx = "arm-linux-androideabi-g++"
-        cpp = "arm-linux-androideabi-cpp"
+        cxx = "%(target)s-g++" % prof
+        cpp = "%(target)s-cpp" % prof
         ldshared= "%s -shared" % cxx
-        ldshared += sysroot
+        ldshared += sysroot + prof["ldflags"]
         # removed -lsupc++
         ldshared += (" -lc -lstdc++ -lm -lpython2.7"
                      " -Wl,--no-undefined -Wl,-z,noexecstack")
@@ -154,7 +319,12 @@ def patch_distutils():
         pass
     else:
         customize_compiler = customize_compiler36
-    setattr(sysconfig, 'customize_compiler', customize_compiler)
+
+    def customize_wrapped(compiler):
+        customize_compiler(compiler)
+        wrap_compiler(compiler)
+    setattr(sysconfig, 'customize_compiler', customize_wrapped)
+    atexit.register(_report_cache)
 
     def get_config_h_filename():
         inc_dir = os.environ["PY4A_INC"]
@@ -0,0 +1,56 @@
+# Copyright 2026 Shimoda (kuri65536 at hotmail dot com)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# optimization profiles of python3 modules, included by */Makefile
+# after the arm settings.  the flags are in PROFILES of py4a.
+#   make PY=3 PY4A_PROFILE=armv7-neon
+#
+# size:       armv5te thumb, -Os.
+# speed:      armv5te thumb, -O2 (default).
+# armv7-neon: armv7-a with NEON, -O2 and vectorized loops.
+# x86-sse:    i686 with SSSE3, built against python3-alpha/python3_x86.
+#
+# not included for PY=2: the python2 rules do not run setup.py through
+# py4a, have no platform tag to extend and the x86-sse paths are the ones
+# of python3.  `python -m py4a setup.py` of python2 reads PY4A_PROFILE by
+# itself.
+export PY4A_PROFILE ?= speed
+
+ifeq (x$(PY4A_PROFILE),xx86-sse)
+    ARCH := x86
+    TARGET := i686-linux-android
+    tabi := x86-4.9
+    _ANDROID_ARCH = arch-x86
+    PYTHON_PLATNAME := linux-i686
+
+    export _PYTHON_HOST_PLATFORM := $(TARGET)
+    export EXT_SUFFIX := .cpython-36m-$(_PYTHON_HOST_PLATFORM).so
+    export SOABI := cpython-36m-$(_PYTHON_HOST_PLATFORM)
+    pylib := $(PY4A_SRC)/python3-alpha/python3_$(ARCH)/python3/lib
+    PY4A := $(PY4A_SRC)/python3-alpha/python3_$(ARCH)/python3
+    export PY4A_INC := $(PY4A)/include/python$(VER_MAJ)m
+    export PY4A_LIB := $(PY4A)/lib
+    export PYTHONSRC := $(PY4A_SRC)/python3-alpha/python-src_$(ARCH)
+endif
+
+# the wheels of profiles are told apart by the platform tag,
+# pycrypto-2.6.1-cp36-cp36m-linux_armv7l_armv7_neon.whl
+ifneq (x$(PY4A_PROFILE),xspeed)
+    PYTHON_PLATNAME := $(PYTHON_PLATNAME)-$(PY4A_PROFILE)
+endif
+
+# objects of the other profiles are not up to date.
+opt_build := build --build-base=build.$(PY4A_PROFILE)
+
+# vi: ft=make:ts=4:et:nowrap:fdm=marker
@@ -9,6 +9,8 @@ Support for generic select()able objects.
 Maintainer: Itamar Shtull-Trauring
 """
 
+from collections import deque
+
 from zope.interface import implements
 
 # Twisted Imports
@@ -113,6 +115,14 @@ class FileDescriptor(_ConsumerMixin):
     This is an abstract superclass of all objects which may be notified when
     they are readable or writable; e.g. they have a file-descriptor that is
     valid to be passed to select(2).
+
+    @ivar dataBuffer: The string being written, from C{offset}.
+    @ivar _tempDataBuffer: A C{deque} of the strings written after
+        C{dataBuffer}.  Strings of C{SEND_LIMIT} bytes or more are sent
+        from where they are, through C{buffer} slices; smaller ones are
+        joined up to C{SEND_LIMIT} bytes, so no data is copied more than
+        once whatever the amount pending.
+    @ivar _tempDataLen: The number of bytes in C{_tempDataBuffer}.
     """
     connected = 0
     disconnected = 0
@@ -137,7 +147,7 @@ class FileDescriptor(_ConsumerMixin):
         if not reactor:
             from twisted.internet import reactor
         self.reactor = reactor
-        self._tempDataBuffer = [] # will be added to dataBuffer in doWrite
+        self._tempDataBuffer = deque() # will become dataBuffer in doWrite
         self._tempDataLen = 0
 
     def connectionLost(self, reason):
@@ -193,13 +203,9 @@ class FileDescriptor(_ConsumerMixin):
         indicates no write was done, and a result of None indicates that a
         write was done.
         """
-        if len(self.dataBuffer) - self.offset < self.SEND_LIMIT:
-            # If there is currently less than SEND_LIMIT bytes left to send
-            # in the string, extend it with the array data.
-            self.dataBuffer = buffer(self.dataBuffer, self.offset) + "".join(self._tempDataBuffer)
-            self.offset = 0
-            self._tempDataBuffer = []
-            self._tempDataLen = 0
+        if self.offset == len(self.dataBuffer) and self._tempDataBuffer:
+            # The string has been sent, take the next one.
+            self._nextDataBuffer()
 
         # Send as much data as you can.
         if self.offset:
@@ -222,6 +228,7 @@ class FileDescriptor(_ConsumerMixin):
         if self.offset == len(self.dataBuffer) and not self._tempDataLen:
             self.dataBuffer = ""
             self.offset = 0
+            self._tempDataBuffer.clear()
             # stop writing.
             self.stopWriting()
             # If I've got a producer who is supposed to supply me with data,
@@ -241,6 +248,34 @@ class FileDescriptor(_ConsumerMixin):
                 return result
         return result
 
+    def _nextDataBuffer(self):
+        """
+        Move the next strings of C{_tempDataBuffer} to C{dataBuffer}.
+
+        Small strings are joined up to C{SEND_LIMIT} bytes, to send them by
+        one call of C{writeSomeData}; a bigger one becomes C{dataBuffer}
+        as it is.
+        """
+        queue = self._tempDataBuffer
+        self.offset = 0
+        if self._tempDataLen <= self.SEND_LIMIT:
+            # All of it is sent at once.
+            self.dataBuffer = "".join(queue)
+            self._tempDataLen = 0
+            queue.clear()
+            return
+        chunks = [queue.popleft()]
+        size = len(chunks[0])
+        while queue and size + len(queue[0]) <= self.SEND_LIMIT:
+            chunk = queue.popleft()
+            chunks.append(chunk)
+            size += len(chunk)
+        self._tempDataLen -= size
+        if len(chunks) == 1:
+            self.dataBuffer = chunks[0]
+        else:
+            self.dataBuffer = "".join(chunks)
+
     def _postLoseConnection(self):
         """Called after a loseConnection(), when all data has been written.
 
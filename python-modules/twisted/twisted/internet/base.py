@@ -10,6 +10,7 @@ import socket # needed only for sync-dns
 from zope.interface import implements, classImplements
 
 import sys
+import math
 import warnings
 from heapq import heappush, heappop, heapify
 
@@ -206,6 +207,120 @@ class DelayedCall(styles.Ephemeral):
 
 
 
+class TimingWheel(object):
+    """
+    A hashed timing wheel of L{DelayedCall}s, for coarse timeouts.
+
+    Time is cut into ticks of C{resolution} seconds and a call is put in
+    the slot of the tick at or after its time, so scheduling, resetting
+    and cancelling a call take constant time whatever the number of calls.
+    Calls run in a batch at the end of their tick, never before their time
+    but up to C{resolution} seconds late.
+
+    Resetting a call to a later time, as
+    L{twisted.protocols.policies.TimeoutMixin.resetTimeout} does on every
+    read, only records the delay; the call is moved when its old
+    tick expires.
+
+    @ivar seconds: A no-argument callable returning the current time.
+    @ivar resolution: The length of a tick, in seconds.
+    @ivar _slots: A list of sets of L{DelayedCall}s, the calls of tick
+        C{n} are in C{_slots[n % len(_slots)]}.
+    @ivar _ticks: A dict mapping the scheduled L{DelayedCall}s to their
+        tick.
+    @ivar _tick: The last tick expired.
+    """
+
+    def __init__(self, seconds=runtimeSeconds, resolution=1.0, slots=512):
+        self.seconds = seconds
+        self.resolution = resolution
+        self._slots = [set() for i in xrange(slots)]
+        self._ticks = {}
+        self._tick = int(seconds() // resolution)
+
+
+    def callLater(self, _seconds, _f, *args, **kw):
+        """
+        Schedule C{_f} on the wheel, like L{IReactorTime.callLater}.
+
+        @return: A L{DelayedCall}.
+        """
+        call = DelayedCall(self.seconds() + _seconds, _f, args, kw,
+                           self._remove, self._move, seconds=self.seconds)
+        self._add(call)
+        return call
+
+
+    def _add(self, call):
+        tick = max(int(math.ceil(call.time / self.resolution)),
+                   self._tick + 1)
+        self._ticks[call] = tick
+        self._slots[tick % len(self._slots)].add(call)
+
+
+    def _remove(self, call):
+        tick = self._ticks.pop(call, None)
+        if tick is not None:
+            self._slots[tick % len(self._slots)].discard(call)
+
+
+    def _move(self, call):
+        self._remove(call)
+        self._add(call)
+
+
+    def nextTime(self):
+        """
+        The time at which L{expire} should be called next, or C{None} if
+        there are no calls on the wheel.
+        """
+        if not self._ticks:
+            return None
+        return (self._tick + 1) * self.resolution
+
+
+    def expire(self, now=None):
+        """
+        Take the calls due at C{now} off the wheel and yield them in order
+        of their time.
+
+        A call is checked again just before it is yielded, so the calls of
+        a batch may cancel or reset the others: cancelled calls are
+        skipped and calls reset to a later time are put back on the wheel.
+        """
+        if now is None:
+            now = self.seconds()
+        current = int(now // self.resolution)
+        first, self._tick = self._tick + 1, max(self._tick, current)
+        due = []
+        nslots = len(self._slots)
+        for tick in xrange(first, min(current, first + nslots - 1) + 1):
+            slot = self._slots[tick % nslots]
+            expired = [call for call in slot if self._ticks[call] <= current]
+            for call in expired:
+                slot.remove(call)
+                del self._ticks[call]
+            due.extend(expired)
+        due.sort()
+        for call in due:
+            if call.cancelled or call in self._ticks:
+                continue
+            if call.delayed_time > 0:
+                call.activate_delay()
+                if call.time > now:
+                    self._add(call)
+                    continue
+            yield call
+
+
+    def getDelayedCalls(self):
+        """
+        Return the calls on the wheel, in no particular order.
+        """
+        return self._ticks.keys()
+
+
+
 class ThreadedResolver(object):
     """
     L{ThreadedResolver} uses a reactor, a threadpool, and
@@ -468,6 +583,7 @@ class ReactorBase(object):
         self._pendingTimedCalls = []
         self._newTimedCalls = []
         self._cancellations = 0
+        self._timingWheel = None
         self.running = False
         self._started = False
         self._justStopped = False
@@ -698,6 +814,36 @@ class ReactorBase(object):
         self._newTimedCalls.append(tple)
         return tple
 
+    def useTimingWheel(self, resolution=1.0, slots=512):
+        """
+        Schedule the calls of L{callLaterCoarse} on a L{TimingWheel}.
+
+        The wheel suits timeouts which are reset or cancelled far more often
+        than they fire, like those of thousands of idle connections: they
+        run up to C{resolution} seconds late, but touching them does not
+        churn the heap of L{callLater}.
+
+        @param resolution: The length of a tick of the wheel, in seconds.
+        @param slots: The number of slots of the wheel.
+        """
+        if self._timingWheel is not None and self._timingWheel._ticks:
+            raise RuntimeError("The timing wheel has scheduled calls.")
+        self._timingWheel = TimingWheel(self.seconds, resolution, slots)
+
+
+    def callLaterCoarse(self, _seconds, _f, *args, **kw):
+        """
+        Like L{callLater}, on the timing wheel if L{useTimingWheel} was
+        called.
+        """
+        if self._timingWheel is None:
+            return self.callLater(_seconds, _f, *args, **kw)
+        assert callable(_f), "%s is not callable" % _f
+        assert sys.maxint >= _seconds >= 0, \
+               "%s is not greater than or equal to 0 seconds" % (_seconds,)
+        return self._timingWheel.callLater(_seconds, _f, *args, **kw)
+
+
     def _moveCallLaterSooner(self, tple):
         # Linear time find: slow.
         heap = self._pendingTimedCalls
@@ -727,7 +873,10 @@ class ReactorBase(object):
         They are returned in no particular order.
         This method is not efficient -- it is really only meant for
         test cases."""
-        return [x for x in (self._pendingTimedCalls + self._newTimedCalls) if not x.cancelled]
+        calls = [x for x in (self._pendingTimedCalls + self._newTimedCalls) if not x.cancelled]
+        if self._timingWheel is not None:
+            calls.extend(self._timingWheel.getDelayedCalls())
+        return calls
 
     def _insertNewDelayedCalls(self):
         for call in self._newTimedCalls:
@@ -742,10 +891,20 @@ class ReactorBase(object):
         # insert new delayed calls to make sure to include them in timeout value
         self._insertNewDelayedCalls()
 
+        if self._timingWheel is None:
+            wheelTime = None
+        else:
+            wheelTime = self._timingWheel.nextTime()
+
         if not self._pendingTimedCalls:
-            return None
+            if wheelTime is None:
+                return None
+            return max(0, wheelTime - self.seconds())
 
-        return max(0, self._pendingTimedCalls[0].time - self.seconds())
+        nextTime = self._pendingTimedCalls[0].time
+        if wheelTime is not None:
+            nextTime = min(nextTime, wheelTime)
+        return max(0, nextTime - self.seconds())
 
 
     def runUntilCurrent(self):
@@ -784,20 +943,11 @@ class ReactorBase(object):
                 heappush(self._pendingTimedCalls, call)
                 continue
 
-            try:
-                call.called = 1
-                call.func(*call.args, **call.kw)
-            except:
-                log.deferr()
-                if hasattr(call, "creator"):
-                    e = "\n"
-                    e += " C: previous exception occurred in " + \
-                         "a DelayedCall created here:\n"
-                    e += " C:"
-                    e += "".join(call.creator).rstrip().replace("\n","\n C:")
-                    e += "\n"
-                    log.msg(e)
+            self._runDelayedCall(call)
 
+        if self._timingWheel is not None:
+            for call in self._timingWheel.expire(now):
+                self._runDelayedCall(call)
 
         if (self._cancellations > 50 and
              self._cancellations > len(self._pendingTimedCalls) >> 1):
@@ -810,6 +960,21 @@ class ReactorBase(object):
             self._justStopped = False
             self.fireSystemEvent("shutdown")
 
+    def _runDelayedCall(self, call):
+        try:
+            call.called = 1
+            call.func(*call.args, **call.kw)
+        except:
+            log.deferr()
+            if hasattr(call, "creator"):
+                e = "\n"
+                e += " C: previous exception occurred in " + \
+                     "a DelayedCall created here:\n"
+                e += " C:"
+                e += "".join(call.creator).rstrip().replace("\n","\n C:")
+                e += "\n"
+                log.msg(e)
+
     # IReactorProcess
 
     def _checkProcessArgs(self, args, env):
@@ -1339,6 +1339,32 @@ class IHalfCloseableProtocol(Interface):
         """
 
 
+class IBufferProtocol(Interface):
+    """
+    Implemented by protocols which take the data read by a transport as a
+    C{memoryview} of a buffer the transport reuses.
+
+    TCP and UNIX connections of such protocols read with C{recv_into} into
+    a buffer allocated once per connection.  Other transports keep calling
+    C{dataReceived}, see L{twisted.internet.protocol.BufferProtocol}.
+
+    This is not a faster C{dataReceived}: with CPython 2.7 the view made
+    for each read costs about what the string does, see the read suite of
+    tools/bench_twisted.py.
+    """
+
+    def bufferReceived(data):
+        """
+        Called whenever data is received.
+
+        @param data: A C{memoryview} of the bytes received.  It is valid
+            only until this method returns, the transport reads the next
+            data into the same memory: copy out what must be kept, with
+            C{data[start:end].tobytes()}.
+        """
+
+
+
 class IProtocolFactory(Interface):
     """
     Interface for protocol factories.
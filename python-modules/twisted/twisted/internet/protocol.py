@@ -501,6 +501,28 @@ class Protocol(BaseProtocol):
         """
 
 
+class BufferProtocol(Protocol):
+    """
+    Base class of L{interfaces.IBufferProtocol} providers.
+
+    Subclasses override C{bufferReceived}.  Transports which do not read
+    into a buffer call C{dataReceived}, which passes a C{memoryview} of the
+    string on.  Not faster than L{Protocol}, see
+    L{interfaces.IBufferProtocol}.
+    """
+
+    implements(interfaces.IBufferProtocol)
+
+    def dataReceived(self, data):
+        self.bufferReceived(memoryview(data))
+
+    def bufferReceived(self, data):
+        """
+        Called whenever data is received, see
+        L{interfaces.IBufferProtocol.bufferReceived}.
+        """
+
+
 class ProtocolToConsumerAdapter(components.Adapter):
     implements(interfaces.IConsumer)
 
@@ -789,6 +811,7 @@ class FileWrapper:
 
 
 __all__ = ["Factory", "ClientFactory", "ReconnectingClientFactory", "connectionDone",
-           "Protocol", "ProcessProtocol", "FileWrapper", "ServerFactory",
+           "Protocol", "BufferProtocol", "ProcessProtocol", "FileWrapper",
+           "ServerFactory",
            "AbstractDatagramProtocol", "DatagramProtocol", "ConnectedDatagramProtocol",
            "ClientCreator"]
@@ -377,6 +377,11 @@ class Connection(abstract.FileDescriptor, _SocketCloser):
     implements(interfaces.ITCPTransport, interfaces.ISystemHandle)
 
     TLS = 0
+    # the read buffer of IBufferProtocol providers, see doRead.
+    _readProtocol = None
+    _readInto = False
+    _readBuffer = None
+    _readView = None
 
     def __init__(self, skt, protocol, reactor=None):
         abstract.FileDescriptor.__init__(self, reactor=reactor)
@@ -447,7 +452,17 @@ class Connection(abstract.FileDescriptor, _SocketCloser):
         calls self.dataReceived(data) to process it.  If the connection is not
         lost through an error in the physical recv(), this function will return
         the result of the dataReceived call.
+
+        A protocol providing L{interfaces.IBufferProtocol} gets the data by
+        C{bufferReceived} instead, read into a buffer kept by the connection
+        (unless the connection uses TLS).
         """
+        protocol = self.protocol
+        if protocol is not self._readProtocol:
+            self._readProtocol = protocol
+            self._readInto = interfaces.IBufferProtocol.providedBy(protocol)
+        if self._readInto and not self.TLS:
+            return self._doReadInto()
         try:
             data = self.socket.recv(self.bufferSize)
         except socket.error, se:
@@ -457,7 +472,27 @@ class Connection(abstract.FileDescriptor, _SocketCloser):
                 return main.CONNECTION_LOST
         if not data:
             return main.CONNECTION_DONE
-        return self.protocol.dataReceived(data)
+        return protocol.dataReceived(data)
+
+
+    def _doReadInto(self):
+        """
+        Read into the buffer of this connection and call
+        C{self.protocol.bufferReceived} with a view of the bytes read.
+        """
+        if self._readBuffer is None:
+            self._readBuffer = bytearray(self.bufferSize)
+            self._readView = memoryview(self._readBuffer)
+        try:
+            n = self.socket.recv_into(self._readBuffer)
+        except socket.error, se:
+            if se.args[0] == EWOULDBLOCK:
+                return
+            else:
+                return main.CONNECTION_LOST
+        if not n:
+            return main.CONNECTION_DONE
+        return self.protocol.bufferReceived(self._readView[:n])
 
 
     def writeSomeData(self, data):
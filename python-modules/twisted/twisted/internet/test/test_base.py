@@ -15,6 +15,7 @@ from twisted.python.util import setIDFunction
 from twisted.internet.interfaces import IReactorTime, IReactorThreads
 from twisted.internet.error import DNSLookupError
 from twisted.internet.base import ThreadedResolver, DelayedCall
+from twisted.internet.base import TimingWheel
 from twisted.internet.task import Clock
 from twisted.trial.unittest import TestCase
 
@@ -270,3 +271,141 @@ class DelayedCallTests(TestCase):
         self.assertTrue(self.zero != self.one)
         self.assertFalse(self.zero != self.zero)
         self.assertFalse(self.one != self.one)
+
+
+
+class TimingWheelTests(TestCase):
+    """
+    Tests for L{TimingWheel}.
+    """
+    def setUp(self):
+        """
+        Create a L{TimingWheel} of 8 slots of 1 second on a L{Clock}.
+        """
+        self.clock = Clock()
+        self.wheel = TimingWheel(self.clock.seconds, 1.0, 8)
+        self.calls = []
+
+
+    def _advance(self, amount):
+        """
+        Move the clock forward and run the calls which are due.
+        """
+        self.clock.advance(amount)
+        for call in self.wheel.expire():
+            call.called = 1
+            call.func(*call.args, **call.kw)
+
+
+    def test_callLater(self):
+        """
+        A call runs at the end of the tick of its time, not before.
+        """
+        self.wheel.callLater(1.5, self.calls.append, "a")
+        self._advance(1.5)
+        self.assertEquals(self.calls, [])
+        self.assertEquals(self.wheel.nextTime(), 2.0)
+        self._advance(0.5)
+        self.assertEquals(self.calls, ["a"])
+        self.assertEquals(self.wheel.nextTime(), None)
+
+
+    def test_order(self):
+        """
+        The calls of a tick run in order of their time.
+        """
+        self.wheel.callLater(0.9, self.calls.append, "b")
+        self.wheel.callLater(0.1, self.calls.append, "a")
+        self._advance(1)
+        self.assertEquals(self.calls, ["a", "b"])
+
+
+    def test_cancel(self):
+        """
+        A cancelled call is taken off the wheel and does not run.
+        """
+        call = self.wheel.callLater(1, self.calls.append, "a")
+        call.cancel()
+        self.assertEquals(self.wheel.getDelayedCalls(), [])
+        self._advance(2)
+        self.assertEquals(self.calls, [])
+
+
+    def test_resetLater(self):
+        """
+        A call reset to a later time runs at the new time only.
+        """
+        call = self.wheel.callLater(2, self.calls.append, "a")
+        self._advance(1)
+        call.reset(3)
+        self._advance(2)
+        self.assertEquals(self.calls, [])
+        self.assertTrue(call.active())
+        self._advance(1)
+        self.assertEquals(self.calls, ["a"])
+
+
+    def test_resetSooner(self):
+        """
+        A call reset to a sooner time is moved to the tick of that time.
+        """
+        call = self.wheel.callLater(5, self.calls.append, "a")
+        call.reset(1)
+        self._advance(1)
+        self.assertEquals(self.calls, ["a"])
+
+
+    def test_rounds(self):
+        """
+        A call more slots away than the wheel has waits for its round.
+        """
+        self.wheel.callLater(10, self.calls.append, "a")
+        self._advance(2)
+        self.assertEquals(self.calls, [])
+        self._advance(7)
+        self.assertEquals(self.calls, [])
+        self._advance(1)
+        self.assertEquals(self.calls, ["a"])
+
+
+    def test_jump(self):
+        """
+        When the clock jumps over more ticks than the wheel has slots, all
+        the calls due run at once.
+        """
+        for i in range(20):
+            self.wheel.callLater(i, self.calls.append, i)
+        self._advance(100)
+        self.assertEquals(self.calls, range(20))
+
+
+    def test_cancelInBatch(self):
+        """
+        A call may cancel another call of the same batch, which then does
+        not run.
+        """
+        calls = []
+        def cancel():
+            calls[1].cancel()
+        calls.append(self.wheel.callLater(0.1, cancel))
+        calls.append(self.wheel.callLater(0.2, self.calls.append, "b"))
+        self._advance(1)
+        self.assertEquals(self.calls, [])
+        self.assertEquals(self.wheel.getDelayedCalls(), [])
+
+
+    def test_resetInBatch(self):
+        """
+        A call reset by another call of the same batch is put back on the
+        wheel.
+        """
+        calls = []
+        def reset():
+            calls[1].reset(2)
+        calls.append(self.wheel.callLater(0.1, reset))
+        calls.append(self.wheel.callLater(0.2, self.calls.append, "b"))
+        self._advance(1)
+        self.assertEquals(self.calls, [])
+        self.assertEquals(self.wheel.getDelayedCalls(), [calls[1]])
+        self._advance(2)
+        self.assertEquals(self.calls, ["b"])
@@ -23,4 +23,45 @@ class TimeTestsBuilder(ReactorBuilder):
         reactor.run()
 
 
+    def test_callLaterCoarse(self):
+        """
+        Without a timing wheel, L{callLaterCoarse} schedules the call as
+        C{callLater} does.
+        """
+        reactor = self.buildReactor()
+        call = reactor.callLaterCoarse(0, reactor.stop)
+        self.assertIn(call, reactor.getDelayedCalls())
+        reactor.run()
+        self.assertFalse(call.active())
+
+
+    def test_timingWheel(self):
+        """
+        After C{useTimingWheel}, the calls of L{callLaterCoarse} are on the
+        wheel, are returned by C{getDelayedCalls} and run in the main loop.
+        """
+        reactor = self.buildReactor()
+        reactor.useTimingWheel(0.01)
+        called = []
+        call = reactor.callLaterCoarse(0.02, called.append, True)
+        reactor.callLaterCoarse(0.03, reactor.stop)
+        self.assertIn(call, reactor._timingWheel.getDelayedCalls())
+        self.assertIn(call, reactor.getDelayedCalls())
+        reactor.run()
+        self.assertEquals(called, [True])
+        self.assertEquals(reactor.getDelayedCalls(), [])
+
+
+    def test_timingWheelCancel(self):
+        """
+        A call cancelled on the timing wheel does not run.
+        """
+        reactor = self.buildReactor()
+        reactor.useTimingWheel(0.01)
+        call = reactor.callLaterCoarse(0.01, self.fail, "cancelled call")
+        reactor.callLaterCoarse(0.02, reactor.stop)
+        call.cancel()
+        reactor.run()
+
+
 globals().update(TimeTestsBuilder.makeTestCaseClasses())
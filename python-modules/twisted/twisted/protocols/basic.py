@@ -525,6 +525,8 @@ class LineReceiver(protocol.Protocol, _PauseableMixin):
     """
     line_mode = 1
     __buffer = ''
+    __start = 0
+    __pending = None
     delimiter = '\r\n'
     MAX_LENGTH = 16384
 
@@ -535,8 +537,12 @@ class LineReceiver(protocol.Protocol, _PauseableMixin):
         @return: All of the cleared buffered data.
         @rtype: C{str}
         """
-        b = self.__buffer
+        b = self.__buffer[self.__start:]
+        if self.__pending:
+            b += "".join(self.__pending)
         self.__buffer = ""
+        self.__start = 0
+        self.__pending = None
         return b
 
 
@@ -545,29 +551,46 @@ class LineReceiver(protocol.Protocol, _PauseableMixin):
         Protocol.dataReceived.
         Translates bytes into lines, and calls lineReceived (or
         rawDataReceived, depending on mode.)
+
+        The lines are found from an offset into the buffer, so the rest of
+        the buffer is not copied for each line.  The data received while
+        paused is kept in a list and joined when resumed.
         """
-        self.__buffer = self.__buffer+data
+        if self.paused:
+            if data:
+                if self.__pending is None:
+                    self.__pending = []
+                self.__pending.append(data)
+            return
+        if self.__pending:
+            self.__pending.append(data)
+            data = "".join(self.__pending)
+            self.__pending = None
+        self.__buffer = self.__buffer[self.__start:] + data
+        self.__start = 0
+        # lineReceived may change the buffer, by clearLineBuffer or by
+        # calling dataReceived again, so it is read for each line.
         while self.line_mode and not self.paused:
-            try:
-                line, self.__buffer = self.__buffer.split(self.delimiter, 1)
-            except ValueError:
-                if len(self.__buffer) > self.MAX_LENGTH:
-                    line, self.__buffer = self.__buffer, ''
-                    return self.lineLengthExceeded(line)
+            buffer, start = self.__buffer, self.__start
+            end = buffer.find(self.delimiter, start)
+            if end == -1:
+                if len(buffer) - start > self.MAX_LENGTH:
+                    self.__buffer, self.__start = '', 0
+                    return self.lineLengthExceeded(buffer[start:])
+                self.__buffer, self.__start = buffer[start:], 0
                 break
-            else:
-                linelength = len(line)
-                if linelength > self.MAX_LENGTH:
-                    exceeded = line + self.__buffer
-                    self.__buffer = ''
-                    return self.lineLengthExceeded(exceeded)
-                why = self.lineReceived(line)
-                if why or self.transport and self.transport.disconnecting:
-                    return why
+            self.__start = end + len(self.delimiter)
+            if end - start > self.MAX_LENGTH:
+                exceeded = buffer[start:end] + buffer[self.__start:]
+                self.__buffer, self.__start = '', 0
+                return self.lineLengthExceeded(exceeded)
+            why = self.lineReceived(buffer[start:end])
+            if why or self.transport and self.transport.disconnecting:
+                return why
         else:
             if not self.paused:
-                data=self.__buffer
-                self.__buffer=''
+                data = self.__buffer[self.__start:]
+                self.__buffer, self.__start = '', 0
                 if data:
                     return self.rawDataReceived(data)
 
@@ -647,6 +670,25 @@ class StringTooLongError(AssertionError):
 
 
 
+class _RecvdCompatHack(object):
+    """
+    Emulates the C{recvd} attribute of L{IntNStringReceiver}, the data
+    received and not processed yet.
+
+    This is not a data descriptor: assigning C{recvd} puts the new buffer
+    in the instance dictionary, where L{IntNStringReceiver.dataReceived}
+    takes it from.
+    """
+
+    def __get__(self, oself, type=None):
+        if oself is None:
+            return self
+        if oself._chunks is not None:
+            return "".join(oself._chunks)
+        return oself._unprocessed[oself._compatibilityOffset:]
+
+
+
 class IntNStringReceiver(protocol.Protocol, _PauseableMixin):
     """
     Generic class for length prefixed protocols.
@@ -661,9 +703,28 @@ class IntNStringReceiver(protocol.Protocol, _PauseableMixin):
     @ivar prefixLength: length of the prefix, in bytes. Define it in subclass,
         using C{struct.calcsize(structFormat)}
     @type prefixLength: C{int}
+
+    @ivar _unprocessed: data received and not processed yet, from
+        C{_compatibilityOffset}.
+    @type _unprocessed: C{str}
+
+    @ivar _compatibilityOffset: the offset of the data not processed yet in
+        C{_unprocessed} while L{stringReceived} is called, for C{recvd}.
+    @type _compatibilityOffset: C{int}
+
+    @ivar _chunks: the chunks of a string not received completely, or
+        C{None}.  They are joined when C{_waiting} more bytes arrive.
+    @type _chunks: C{list} of C{str}
+
+    @ivar _waiting: the number of bytes missing from C{_chunks}.
+    @type _waiting: C{int}
     """
     MAX_LENGTH = 99999
-    recvd = ""
+    recvd = _RecvdCompatHack()
+    _unprocessed = ""
+    _compatibilityOffset = 0
+    _chunks = None
+    _waiting = 0
 
     def stringReceived(self, string):
         """
@@ -691,19 +752,59 @@ class IntNStringReceiver(protocol.Protocol, _PauseableMixin):
     def dataReceived(self, recd):
         """
         Convert int prefixed strings into calls to stringReceived.
-        """
-        self.recvd = self.recvd + recd
-        while len(self.recvd) >= self.prefixLength and not self.paused:
-            length ,= struct.unpack(
-                self.structFormat, self.recvd[:self.prefixLength])
+
+        The strings are sliced from an offset into the received data, which
+        is copied once per call.  The chunks of a string longer than the
+        data received so far are kept in a list and joined when all of it
+        has arrived.
+        """
+        if 'recvd' in self.__dict__:
+            # recvd was set outside of stringReceived.
+            self._unprocessed = self.__dict__.pop('recvd')
+            self._chunks, self._waiting = None, 0
+        if self._chunks is not None:
+            self._chunks.append(recd)
+            self._waiting -= len(recd)
+            if self._waiting > 0:
+                return
+            alldata = "".join(self._chunks)
+            self._chunks, self._waiting = None, 0
+        else:
+            alldata = self._unprocessed[self._compatibilityOffset:] + recd
+            self._compatibilityOffset = 0
+        self._unprocessed = alldata
+        offset = 0
+        prefixLength = self.prefixLength
+        structFormat = self.structFormat
+        while len(alldata) >= offset + prefixLength and not self.paused:
+            start = offset + prefixLength
+            length ,= struct.unpack(structFormat, alldata[offset:start])
             if length > self.MAX_LENGTH:
+                self._unprocessed = alldata[offset:]
                 self.lengthLimitExceeded(length)
                 return
-            if len(self.recvd) < length + self.prefixLength:
-                break
-            packet = self.recvd[self.prefixLength:length + self.prefixLength]
-            self.recvd = self.recvd[length + self.prefixLength:]
-            self.stringReceived(packet)
+            end = start + length
+            if len(alldata) < end:
+                self._chunks = [alldata[offset:]]
+                self._waiting = end - len(alldata)
+                self._unprocessed = ""
+                return
+            offset = end
+            self._compatibilityOffset = offset
+            self.stringReceived(alldata[start:end])
+            self._compatibilityOffset = 0
+            if 'recvd' in self.__dict__:
+                # the application took the rest of the data, as
+                # amp.BinaryBoxProtocol does when switching protocols.
+                alldata = self._unprocessed = self.__dict__.pop('recvd')
+                offset = 0
+            elif self._unprocessed is not alldata:
+                # stringReceived called dataReceived again (by
+                # resumeProducing), which processed the rest of the data.
+                if self._chunks is not None:
+                    return
+                alldata, offset = self._unprocessed, 0
+        self._unprocessed = alldata[offset:]
 
 
     def sendString(self, string):
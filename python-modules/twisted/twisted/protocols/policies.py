@@ -492,9 +492,13 @@ class TimeoutFactory(WrappingFactory):
     def callLater(self, period, func):
         """
         Wrapper around L{reactor.callLater} for test purpose.
+
+        The timeout goes to the timing wheel of the reactor, if it has one
+        (see L{twisted.internet.base.ReactorBase.useTimingWheel}).
         """
         from twisted.internet import reactor
-        return reactor.callLater(period, func)
+        callLater = getattr(reactor, "callLaterCoarse", reactor.callLater)
+        return callLater(period, func)
 
 
 
@@ -611,9 +615,13 @@ class TimeoutMixin:
     def callLater(self, period, func):
         """
         Wrapper around L{reactor.callLater} for test purpose.
+
+        The timeout goes to the timing wheel of the reactor, if it has one
+        (see L{twisted.internet.base.ReactorBase.useTimingWheel}).
         """
         from twisted.internet import reactor
-        return reactor.callLater(period, func)
+        callLater = getattr(reactor, "callLaterCoarse", reactor.callLater)
+        return callLater(period, func)
 
 
     def resetTimeout(self):
@@ -12,7 +12,7 @@ for more details.
 @author: Glyph Lefkowitz
 """
 
-import copy, cStringIO, struct
+import copy, cStringIO, re, struct
 
 from twisted.internet import protocol
 from twisted.persisted import styles
@@ -31,6 +31,22 @@ def int2b128(integer, stream):
         integer = integer >> 7
 
 
+def _int2b128(integer):
+    """
+    Encode a non-negative integer in base 128, as L{int2b128} does, to a
+    C{str} instead of writing it byte by byte.
+    """
+    if integer < 128:
+        return _SMALL_INTS[integer]
+    digits = []
+    while integer:
+        digits.append(chr(integer & 0x7f))
+        integer = integer >> 7
+    return "".join(digits)
+
+_SMALL_INTS = [chr(i) for i in range(128)]
+
+
 def b1282int(st):
     """
     Convert an integer represented as a base 128 string into an C{int} or
@@ -65,6 +81,9 @@ VOCAB    = chr(0x87)
 
 HIGH_BIT_SET = chr(0x80)
 
+# finds the type byte which ends the prefix of an element.
+_TYPE_BYTE = re.compile('[\x80-\xff]')
+
 def setPrefixLimit(limit):
     """
     Set the limit on the prefix length for all Banana connections
@@ -153,75 +172,91 @@ class Banana(protocol.Protocol, styles.Ephemeral):
             self.callExpressionReceived(item)
 
     buffer = ''
+    _chunks = None
+    _waiting = 0
 
     def dataReceived(self, chunk):
-        buffer = self.buffer + chunk
+        """
+        Decode the elements in C{chunk}, and call L{gotItem} with each.
+
+        The elements are parsed from an offset into the data received, and
+        the data left is kept in C{self.buffer}.  The chunks of a string
+        longer than the data received so far are kept in C{self._chunks}
+        until the C{self._waiting} bytes missing arrive, and joined once.
+        """
+        if self._chunks is not None:
+            self._chunks.append(chunk)
+            self._waiting -= len(chunk)
+            if self._waiting > 0:
+                return
+            buffer = "".join(self._chunks)
+            self._chunks, self._waiting = None, 0
+        else:
+            buffer = self.buffer + chunk
         listStack = self.listStack
         gotItem = self.gotItem
-        while buffer:
-            assert self.buffer != buffer, "This ain't right: %s %s" % (repr(self.buffer), repr(buffer))
-            self.buffer = buffer
-            pos = 0
-            for ch in buffer:
-                if ch >= HIGH_BIT_SET:
-                    break
-                pos = pos + 1
+        prefixLimit = self.prefixLimit
+        search = _TYPE_BYTE.search
+        offset = 0
+        end = len(buffer)
+        while offset < end:
+            # a prefix one byte too long is still found, to tell it apart
+            # from a partial one.
+            match = search(buffer, offset, offset + prefixLimit + 2)
+            if match is None:
+                if end - offset > prefixLimit:
+                    raise BananaError("Security precaution: more than %d bytes of prefix" % (prefixLimit,))
+                break
+            pos = match.start()
+            if pos - offset > prefixLimit:
+                raise BananaError("Security precaution: longer than %d bytes worth of prefix" % (prefixLimit,))
+            if pos - offset == 1:
+                num = ord(buffer[offset])
             else:
-                if pos > self.prefixLimit:
-                    raise BananaError("Security precaution: more than %d bytes of prefix" % (self.prefixLimit,))
-                return
-            num = buffer[:pos]
+                num = b1282int(buffer[offset:pos])
             typebyte = buffer[pos]
-            rest = buffer[pos+1:]
-            if len(num) > self.prefixLimit:
-                raise BananaError("Security precaution: longer than %d bytes worth of prefix" % (self.prefixLimit,))
+            rest = pos + 1
             if typebyte == LIST:
-                num = b1282int(num)
                 if num > SIZE_LIMIT:
                     raise BananaError("Security precaution: List too long.")
                 listStack.append((num, []))
-                buffer = rest
+                offset = rest
             elif typebyte == STRING:
-                num = b1282int(num)
                 if num > SIZE_LIMIT:
                     raise BananaError("Security precaution: String too long.")
-                if len(rest) >= num:
-                    buffer = rest[num:]
-                    gotItem(rest[:num])
-                else:
+                if end - rest < num:
+                    self._chunks = [buffer[offset:]]
+                    self._waiting = rest + num - end
+                    self.buffer = ''
                     return
+                offset = rest + num
+                gotItem(buffer[rest:offset])
             elif typebyte == INT:
-                buffer = rest
-                num = b1282int(num)
+                offset = rest
                 gotItem(num)
             elif typebyte == LONGINT:
-                buffer = rest
-                num = b1282int(num)
+                offset = rest
                 gotItem(num)
             elif typebyte == LONGNEG:
-                buffer = rest
-                num = b1282int(num)
+                offset = rest
                 gotItem(-num)
             elif typebyte == NEG:
-                buffer = rest
-                num = -b1282int(num)
-                gotItem(num)
+                offset = rest
+                gotItem(-num)
             elif typebyte == VOCAB:
-                buffer = rest
-                num = b1282int(num)
+                offset = rest
                 gotItem(self.incomingVocabulary[num])
             elif typebyte == FLOAT:
-                if len(rest) >= 8:
-                    buffer = rest[8:]
-                    gotItem(struct.unpack("!d", rest[:8])[0])
-                else:
-                    return
+                if end - rest < 8:
+                    break
+                offset = rest + 8
+                gotItem(struct.unpack("!d", buffer[rest:offset])[0])
             else:
                 raise NotImplementedError(("Invalid Type Byte %r" % (typebyte,)))
             while listStack and (len(listStack[-1][1]) == listStack[-1][0]):
                 item = listStack.pop()[1]
                 gotItem(item)
-        self.buffer = ''
+        self.buffer = buffer[offset:]
 
 
     def expressionReceived(self, lst):
@@ -280,52 +315,49 @@ class Banana(protocol.Protocol, styles.Ephemeral):
         self.isClient = isClient
 
     def sendEncoded(self, obj):
-        io = cStringIO.StringIO()
-        self._encode(obj, io.write)
-        value = io.getvalue()
-        self.transport.write(value)
+        """
+        Encode C{obj} and write it to the transport at once.
+
+        The elements are appended to one list, joined for the write.
+        """
+        buf = []
+        self._encode(obj, buf.append)
+        self.transport.write("".join(buf))
 
     def _encode(self, obj, write):
-        if isinstance(obj, (list, tuple)):
+        if isinstance(obj, str):
+            # TODO: an API for extending banana...
+            if self.currentDialect == "pb" and obj in self.outgoingSymbols:
+                symbolID = self.outgoingSymbols[obj]
+                write(_int2b128(symbolID) + VOCAB)
+            else:
+                if len(obj) > SIZE_LIMIT:
+                    raise BananaError(
+                        "string is too long to send (%d)" % (len(obj),))
+                write(_int2b128(len(obj)) + STRING)
+                write(obj)
+        elif isinstance(obj, (list, tuple)):
             if len(obj) > SIZE_LIMIT:
                 raise BananaError(
                     "list/tuple is too long to send (%d)" % (len(obj),))
-            int2b128(len(obj), write)
-            write(LIST)
+            write(_int2b128(len(obj)) + LIST)
+            encode = self._encode
             for elem in obj:
-                self._encode(elem, write)
+                encode(elem, write)
         elif isinstance(obj, (int, long)):
             if obj < self._smallestLongInt or obj > self._largestLongInt:
                 raise BananaError(
                     "int/long is too large to send (%d)" % (obj,))
             if obj < self._smallestInt:
-                int2b128(-obj, write)
-                write(LONGNEG)
+                write(_int2b128(-obj) + LONGNEG)
             elif obj < 0:
-                int2b128(-obj, write)
-                write(NEG)
+                write(_int2b128(-obj) + NEG)
             elif obj <= self._largestInt:
-                int2b128(obj, write)
-                write(INT)
+                write(_int2b128(obj) + INT)
             else:
-                int2b128(obj, write)
-                write(LONGINT)
+                write(_int2b128(obj) + LONGINT)
         elif isinstance(obj, float):
-            write(FLOAT)
-            write(struct.pack("!d", obj))
-        elif isinstance(obj, str):
-            # TODO: an API for extending banana...
-            if self.currentDialect == "pb" and obj in self.outgoingSymbols:
-                symbolID = self.outgoingSymbols[obj]
-                int2b128(symbolID, write)
-                write(VOCAB)
-            else:
-                if len(obj) > SIZE_LIMIT:
-                    raise BananaError(
-                        "string is too long to send (%d)" % (len(obj),))
-                int2b128(len(obj), write)
-                write(STRING)
-                write(obj)
+            write(FLOAT + struct.pack("!d", obj))
         else:
             raise BananaError("could not send object: %r" % (obj,))
 
@@ -354,5 +386,6 @@ def decode(st):
         _i.dataReceived(st)
     finally:
         _i.buffer = ''
+        _i._chunks, _i._waiting = None, 0
         del _i.expressionReceived
     return l[0]
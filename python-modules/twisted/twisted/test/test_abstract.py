@@ -7,7 +7,7 @@ Tests for generic file descriptor based reactor support code.
 
 from twisted.trial.unittest import TestCase
 
-from twisted.internet.abstract import isIPAddress
+from twisted.internet.abstract import isIPAddress, FileDescriptor
 
 
 class AddressTests(TestCase):
@@ -81,3 +81,118 @@ class AddressTests(TestCase):
         self.assertFalse(isIPAddress('0.0.256.0'))
         self.assertFalse(isIPAddress('0.0.0.256'))
         self.assertFalse(isIPAddress('256.256.256.256'))
+
+
+
+class FakeReactor(object):
+    """
+    A reactor which only records the writers added.
+    """
+    def __init__(self):
+        self.writers = set()
+
+
+    def addWriter(self, writer):
+        self.writers.add(writer)
+
+
+    def removeWriter(self, writer):
+        self.writers.discard(writer)
+
+
+
+class MemoryDescriptor(FileDescriptor):
+    """
+    A L{FileDescriptor} writing to a list, C{accept} bytes at a time.
+
+    @ivar writes: The objects given to C{writeSomeData}, as strings.
+    @ivar views: The number of C{buffer} objects among them.
+    """
+    connected = 1
+
+    def __init__(self, accept=2 ** 20):
+        FileDescriptor.__init__(self, FakeReactor())
+        self.accept = accept
+        self.writes = []
+        self.views = 0
+
+
+    def writeSomeData(self, data):
+        if isinstance(data, buffer):
+            self.views += 1
+        data = str(data)[:self.accept]
+        self.writes.append(data)
+        return len(data)
+
+
+    def flush(self):
+        """
+        Call C{doWrite} while the descriptor wants to write.
+        """
+        while self in self.reactor.writers:
+            self.doWrite()
+        return "".join(self.writes)
+
+
+
+class WriteBufferTests(TestCase):
+    """
+    Tests for the write buffer of L{FileDescriptor}.
+    """
+    def test_joinSmallWrites(self):
+        """
+        Small writes are joined, up to C{SEND_LIMIT} bytes a send.
+        """
+        fd = MemoryDescriptor()
+        fd.SEND_LIMIT = 10
+        for i in range(6):
+            fd.write("abc")
+        self.assertEquals(fd.flush(), "abc" * 6)
+        self.assertEquals(fd.writes, ["abc" * 3, "abc" * 3])
+
+
+    def test_bigWriteNotCopied(self):
+        """
+        A write bigger than C{SEND_LIMIT} is sent from where it is, by
+        C{buffer} slices after a partial send.
+        """
+        fd = MemoryDescriptor(accept=4)
+        fd.SEND_LIMIT = 4
+        data = "x" * 10
+        fd.write("ab")
+        fd.write(data)
+        fd.doWrite()
+        fd.doWrite()
+        self.assertIdentical(fd.dataBuffer, data)
+        self.assertEquals(fd.flush(), "ab" + data)
+        self.assertEquals(fd.writes, ["ab", "xxxx", "xxxx", "xx"])
+        self.assertEquals(fd.views, 2)
+
+
+    def test_partialWrites(self):
+        """
+        Data written while a string is partially sent follows it.
+        """
+        fd = MemoryDescriptor(accept=3)
+        fd.write("abcde")
+        fd.doWrite()
+        fd.write("fgh")
+        fd.writeSequence(["ij", "", "k"])
+        self.assertEquals(fd.flush(), "abcdefghijk")
+        self.assertEquals(fd.dataBuffer, "")
+        self.assertEquals(len(fd._tempDataBuffer), 0)
+        self.assertEquals(fd._tempDataLen, 0)
+
+
+    def test_stopWriting(self):
+        """
+        When all data is sent the descriptor stops writing, and starts
+        again on the next write.
+        """
+        fd = MemoryDescriptor()
+        fd.write("abc")
+        self.assertIn(fd, fd.reactor.writers)
+        fd.doWrite()
+        self.assertNotIn(fd, fd.reactor.writers)
+        fd.write("def")
+        self.assertEquals(fd.flush(), "abcdef")
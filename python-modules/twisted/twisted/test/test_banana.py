@@ -21,6 +21,15 @@ class MathTestCase(unittest.TestCase):
             y = banana.b1282int(v)
             assert y == i, "y = %s; i = %s" % (y,i)
 
+    def test_int2b128String(self):
+        """
+        L{banana._int2b128} returns the bytes L{banana.int2b128} writes.
+        """
+        for i in range(0, 300) + [1000000, 1024 ** 10l]:
+            x = StringIO.StringIO()
+            banana.int2b128(i, x.write)
+            self.assertEqual(banana._int2b128(i), x.getvalue())
+
 class BananaTestCase(unittest.TestCase):
 
     encClass = banana.Banana
@@ -180,6 +189,64 @@ class BananaTestCase(unittest.TestCase):
             self.enc.dataReceived(byte)
         assert self.result == foo, "%s!=%s" % (repr(self.result), repr(foo))
 
+    def test_chunks(self):
+        """
+        A list of strings, ints and floats decodes the same when it is
+        received in chunks splitting its elements.
+        """
+        foo = [["x" * 1000, i, -i, i * 0.5] for i in range(100)]
+        self.enc.sendEncoded(foo)
+        data = self.io.getvalue()
+        for size in (7, 1000, 4096):
+            self.result = None
+            for i in range(0, len(data), size):
+                self.enc.dataReceived(data[i:i + size])
+            self.assertEqual(self.result, foo)
+            self.assertEqual(self.enc.buffer, '')
+
+
+    def test_longString(self):
+        """
+        A string longer than the data received so far is delivered once
+        all of it arrives, and the data after it is decoded.
+        """
+        self.enc.sendEncoded(["a" * 100000, "b"])
+        data = self.io.getvalue()
+        self.enc.dataReceived(data[:10])
+        self.enc.dataReceived(data[10:50000])
+        self.assertFalse(hasattr(self, "result"))
+        self.enc.dataReceived(data[50000:] + '\x01')
+        self.assertEqual(self.result, ["a" * 100000, "b"])
+        self.assertEqual(self.enc.buffer, '\x01')
+
+
+    def test_deepNesting(self):
+        """
+        Lists nested deeper than the recursion limit are decoded.
+        """
+        depth = sys.getrecursionlimit() + 100
+        data = '\x01\x80' * depth + '\x00\x80'
+        self.enc.dataReceived(data)
+        result = self.result
+        for i in range(depth):
+            self.assertEqual(len(result), 1)
+            result = result[0]
+        self.assertEqual(result, [])
+
+
+    def test_sendEncodedOneWrite(self):
+        """
+        L{banana.Banana.sendEncoded} writes the encoded object to the
+        transport at once.
+        """
+        writes = []
+        self.enc.transport.write = writes.append
+        self.enc.sendEncoded([1, "two", [3.0, -4], 2 ** 40])
+        self.assertEqual(len(writes), 1)
+        self.enc.dataReceived(writes[0])
+        self.assertEqual(self.result, [1, "two", [3.0, -4], 2 ** 40])
+
+
     def feed(self, data):
         for byte in data:
             self.enc.dataReceived(byte)
@@ -309,6 +309,71 @@ a'''
         self.assertEqual(protocol.rest, '')
 
 
+    def test_manyLines(self):
+        """
+        All the lines of a chunk of data are delivered in order, and the
+        partial line at its end is kept for the next chunk.
+        """
+        a = LineTester()
+        a.makeConnection(proto_helpers.StringTransport())
+        lines = ['line %d' % (i,) for i in range(10000)]
+        a.dataReceived('\n'.join(lines) + '\nlast')
+        self.assertEqual(a.received, lines)
+        a.dataReceived(' line\n')
+        self.assertEqual(a.received[-1], 'last line')
+
+
+    def test_lineLengthExceededAfterLines(self):
+        """
+        C{lineLengthExceeded} gets the too long line, without its delimiter,
+        and the rest of the buffer, but not the lines before it.
+        """
+        exceeded = []
+        a = LineTester()
+        a.lineLengthExceeded = exceeded.append
+        a.makeConnection(proto_helpers.StringTransport())
+        a.dataReceived('foo\n' + 'x' * 65 + '\nbar\n')
+        self.assertEqual(a.received, ['foo'])
+        self.assertEqual(exceeded, ['x' * 65 + 'bar\n'])
+
+
+    def test_clearLineBufferWhilePaused(self):
+        """
+        L{LineReceiver.clearLineBuffer} returns the data received while
+        paused too, after the data buffered before.
+        """
+        a = LineTester(task.Clock())
+        a.makeConnection(proto_helpers.StringTransport())
+        a.dataReceived('pause\nfoo')
+        a.dataReceived('\nbar')
+        a.dataReceived('\n')
+        self.assertEqual(a.received, ['pause'])
+        self.assertEqual(a.clearLineBuffer(), 'foo\nbar\n')
+        a.resumeProducing()
+        self.assertEqual(a.received, ['pause'])
+
+
+    def test_resumeInLineReceived(self):
+        """
+        If C{lineReceived} pauses and resumes the protocol, the lines after
+        it are delivered once.
+        """
+        class ResumingReceiver(basic.LineReceiver):
+            delimiter = '\n'
+            def connectionMade(self):
+                self.received = []
+            def lineReceived(self, line):
+                self.received.append(line)
+                if line == 'resume':
+                    self.pauseProducing()
+                    self.resumeProducing()
+
+        a = ResumingReceiver()
+        a.makeConnection(proto_helpers.StringTransport())
+        a.dataReceived('foo\nresume\nbar\nbaz\n')
+        self.assertEqual(a.received, ['foo', 'resume', 'bar', 'baz'])
+
+
 
 class LineOnlyReceiverTestCase(unittest.TestCase):
     """
@@ -750,6 +815,73 @@ class IntNTestCaseMixin(LPTestCaseMixin):
         self.assertEqual(r.received, [])
 
 
+    def test_manyStrings(self):
+        """
+        All the strings of a chunk of data are delivered in order, and the
+        partial string at its end is kept for the next chunk.
+        """
+        r = self.getProtocol()
+        strings = [str(i) for i in range(1000)]
+        data = "".join([struct.pack(r.structFormat, len(s)) + s
+                        for s in strings])
+        r.dataReceived(data + struct.pack(r.structFormat, 4) + "la")
+        self.assertEqual(r.received, strings)
+        r.dataReceived("st")
+        self.assertEqual(r.received[-1], "last")
+
+
+    def test_stringInChunks(self):
+        """
+        A string received in several chunks is delivered once all of them
+        have arrived, and the data after it is processed.
+        """
+        r = self.getProtocol()
+        r.MAX_LENGTH = 200
+        data = (struct.pack(r.structFormat, 200) + "x" * 200 +
+                struct.pack(r.structFormat, 3) + "foo")
+        for i in range(0, len(data), 7):
+            r.dataReceived(data[i:i + 7])
+        self.assertEqual(r.received, ["x" * 200, "foo"])
+
+
+    def test_recvd(self):
+        """
+        C{recvd} is the data not processed yet.  Setting it in
+        C{stringReceived} replaces that data.
+        """
+        r = self.getProtocol()
+        rest = []
+        def stringReceived(s):
+            rest.append(r.recvd)
+            if s == "switch":
+                r.recvd = ""
+        r.stringReceived = stringReceived
+        r.dataReceived(struct.pack(r.structFormat, 3) + "foo" +
+                       struct.pack(r.structFormat, 6) + "switch" + "raw")
+        self.assertEqual(rest, [struct.pack(r.structFormat, 6) + "switch" +
+                                "raw", "raw"])
+        self.assertEqual(r.recvd, "")
+        r.dataReceived(struct.pack(r.structFormat, 2) + "x")
+        self.assertEqual(r.recvd, struct.pack(r.structFormat, 2) + "x")
+
+
+    def test_resumeInStringReceived(self):
+        """
+        If C{stringReceived} pauses and resumes the protocol, the strings
+        after it are delivered once.
+        """
+        r = self.getProtocol()
+        def stringReceived(s):
+            r.received.append(s)
+            if s == "resume":
+                r.pauseProducing()
+                r.resumeProducing()
+        r.stringReceived = stringReceived
+        r.dataReceived("".join([struct.pack(r.structFormat, len(s)) + s
+                                for s in ["foo", "resume", "bar", "baz"]]))
+        self.assertEqual(r.received, ["foo", "resume", "bar", "baz"])
+
+
 
 class TestInt32(TestMixin, basic.Int32StringReceiver):
     """
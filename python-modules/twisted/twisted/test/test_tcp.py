@@ -1542,6 +1542,85 @@ class LargeBufferTestCase(unittest.TestCase):
         return d.addCallback(check)
 
 
+class BufferReaderProtocol(protocol.BufferProtocol):
+    """
+    A L{protocol.BufferProtocol} keeping the data and the views received.
+    """
+    def connectionMade(self):
+        self.data = []
+        self.views = []
+        self.buffers = set()
+        self.factory.protocol = self
+
+
+    def bufferReceived(self, data):
+        self.views.append(type(data))
+        self.buffers.add(id(self.transport._readBuffer))
+        self.data.append(data.tobytes())
+
+
+    def connectionLost(self, reason):
+        self.factory.done = 1
+
+
+
+class BufferReaderClientFactory(LargeBufferReaderClientFactory):
+    protocol = BufferReaderProtocol
+
+    def buildProtocol(self, addr):
+        return protocol.ClientFactory.buildProtocol(self, addr)
+
+
+
+class BufferProtocolTestCase(unittest.TestCase):
+    """
+    Tests for reading into a buffer for L{interfaces.IBufferProtocol}
+    providers.
+    """
+    datalen = 1024 * 1024
+
+    def test_bufferReceived(self):
+        """
+        A L{protocol.BufferProtocol} gets all the data by C{bufferReceived},
+        as views of one buffer of the connection.
+        """
+        f = protocol.Factory()
+        f.protocol = LargeBufferWriterProtocol
+        f.done = 0
+        f.len = self.datalen
+        wrappedF = FireOnCloseFactory(f)
+        p = reactor.listenTCP(0, wrappedF, interface="127.0.0.1")
+        self.addCleanup(p.stopListening)
+        clientF = BufferReaderClientFactory()
+        wrappedClientF = FireOnCloseFactory(clientF)
+        reactor.connectTCP("127.0.0.1", p.getHost().port, wrappedClientF)
+
+        d = defer.gatherResults([wrappedF.deferred, wrappedClientF.deferred])
+        def check(ignored):
+            proto = clientF.protocol
+            self.assertEquals("".join(proto.data), "X" * self.datalen)
+            self.assertEquals(set(proto.views), set([memoryview]))
+            self.assertEquals(len(proto.buffers), 1)
+        return d.addCallback(check)
+
+
+    def test_dataReceived(self):
+        """
+        L{protocol.BufferProtocol.dataReceived} passes a C{memoryview} of
+        the data to C{bufferReceived}, for the transports which do not
+        read into a buffer.
+        """
+        received = []
+        proto = protocol.BufferProtocol()
+        proto.bufferReceived = received.append
+        proto.dataReceived("abc")
+        self.assertEquals(len(received), 1)
+        self.assertIsInstance(received[0], memoryview)
+        self.assertEquals(received[0].tobytes(), "abc")
+        self.assertTrue(interfaces.IBufferProtocol.providedBy(proto))
+
+
+
 class MyHCProtocol(AccumulatingProtocol):
 
     implements(IHalfCloseableProtocol)
@@ -376,8 +376,9 @@ class Session(components.Componentized):
                 "The lifetime parameter to startCheckingExpiration is "
                 "deprecated since Twisted 9.0.  See Session.sessionTimeout "
                 "instead.", DeprecationWarning, stacklevel=2)
-        self._expireCall = self._reactor.callLater(
-            self.sessionTimeout, self.expire)
+        callLater = getattr(self._reactor, "callLaterCoarse",
+                            self._reactor.callLater)
+        self._expireCall = callLater(self.sessionTimeout, self.expire)
 
 
     def notifyOnExpire(self, callback):
@@ -0,0 +1,149 @@
+# Copyright (C) 2026 shimoda kuri65536@hotmail.com
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+"""asyncio client for SL4A.
+
+Many calls can be in flight on one connection, responses are matched to
+their requests by id::
+
+    import asyncio
+    import aioandroid
+
+    async def main():
+        droid = await aioandroid.connect()
+        event, level = await asyncio.gather(droid.eventWait(10000),
+                                            droid.batteryGetLevel())
+        droid.close()
+
+    asyncio.get_event_loop().run_until_complete(main())
+"""
+import asyncio
+import json
+import re
+
+import android
+from android import Result
+
+# bytes of one reply line, replies of smsGetMessages or base64 payloads
+# are far longer than the 64KiB default of asyncio streams.
+LIMIT = 64 * 1024 * 1024
+_ID = re.compile(br'"id"\s*:\s*(\d+)')
+
+
+class Android(object):
+
+    def __init__(self, reader, writer, loop=None):
+        self.loop = loop or asyncio.get_event_loop()
+        self.id = 0
+        self._reader = reader
+        self._writer = writer
+        self._pending = {}
+        self._receiver = self.loop.create_task(self._receive())
+
+    async def _authenticate(self, handshake):
+        return await self._rpc("_authenticate", handshake)
+
+    def _rpc(self, method, *args):
+        """Sends the request and returns a future of its Result."""
+        if self._receiver.done():
+            raise ConnectionError("SL4A connection closed")
+        data = {'id': self.id,
+                'method': method,
+                'params': args}
+        fut = self.loop.create_future()
+        self._pending[self.id] = fut
+        self.id += 1
+        self._writer.write((json.dumps(data) + '\n').encode('utf-8'))
+        return fut
+
+    async def _receive(self):
+        reader = self._reader
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b'\n')
+                except asyncio.LimitOverrunError as ex:
+                    head = await self._skip_line(ex.consumed)
+                    self._fail(head, ValueError(
+                        "SL4A reply is longer than the stream limit"))
+                    continue
+                try:
+                    result = json.loads(line.decode('utf-8'))
+                    fut = self._pending.pop(result['id'], None)
+                except (ValueError, KeyError, TypeError) as ex:
+                    self._fail(line, ex)
+                    continue
+                if fut is None or fut.cancelled():
+                    continue
+                if result.get('error') is not None:
+                    print(result['error'])
+                fut.set_result(Result(id=result['id'],
+                                      result=result.get('result'),
+                                      error=result.get('error'), ))
+        except asyncio.IncompleteReadError:
+            pass    # closed, maybe in the middle of a line.
+        finally:
+            pending, self._pending = self._pending, {}
+            for fut in pending.values():
+                if not fut.done():
+                    fut.set_exception(
+                        ConnectionError("SL4A connection closed"))
+
+    async def _skip_line(self, size):
+        """Drops a line over the limit, returns its first size bytes."""
+        head = await self._reader.readexactly(size)
+        while True:
+            try:
+                await self._reader.readuntil(b'\n')
+                return head
+            except asyncio.LimitOverrunError as ex:
+                await self._reader.readexactly(ex.consumed)
+
+    def _fail(self, line, exc):
+        """Fails the request of a reply which can not be decoded, found
+        by the id in the line.  Other requests are left running."""
+        m = _ID.search(line)
+        fut = None if m is None else self._pending.pop(int(m.group(1)), None)
+        if fut is not None and not fut.done():
+            fut.set_exception(exc)
+
+    async def drain(self):
+        """Waits until the written requests are flushed to the socket."""
+        await self._writer.drain()
+
+    def close(self):
+        self._writer.close()
+        self._receiver.cancel()
+
+    def __getattr__(self, name):
+        def rpc_call(*args):
+            return self._rpc(name, *args)
+        return rpc_call
+
+
+async def connect(addr=None, handshake=None, loop=None):
+    """Opens a connection to the SL4A server and authenticates it."""
+    if addr is None:
+        addr = android.HOST, android.PORT
+    if handshake is None:
+        handshake = android.HANDSHAKE
+    # the loop argument is gone from python3.10.
+    kw = {} if loop is None else {'loop': loop}
+    reader, writer = await asyncio.open_connection(addr[0], addr[1],
+                                                   limit=LIMIT, **kw)
+    droid = Android(reader, writer, loop=loop)
+    if handshake is not None:
+        await droid._authenticate(handshake)
+    return droid
+
+# vi: et:ts=4:nowrap
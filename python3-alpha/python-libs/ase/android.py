@@ -18,57 +18,489 @@ __author__ = 'Damon Kohler <damonkohler@gmail.com>'
 
 import sys
 import time
+import binascii
 import collections
 import json
 import os
 import socket
-from logging import warning as warn
+import threading
+from logging import warning as warn, debug as debg
 
 PORT = os.environ.get('AP_PORT')
 HOST = os.environ.get('AP_HOST')
 HANDSHAKE = os.environ.get('AP_HANDSHAKE')
+# seconds to wait for the server started by launchSL4A.
+LAUNCH_TIMEOUT = 10.0
 Result = collections.namedtuple('Result', 'id,result,error')
+if sys.version_info[0] == 2:
+  _string_types = basestring
+else:
+  _string_types = str
+
+
+class JsonCodec(object):
+  """Encodes requests and decodes responses, one JSON document per line.
+
+  mode tells Android how to open the socket file: 'text' goes through an
+  utf-8 text wrapper, 'binary' writes and reads raw bytes.
+  """
+  mode = 'text'
+
+  def __init__(self, module=json):
+    self.dumps = module.dumps
+    self.loads = module.loads
+    self._heads = {}
+
+  def encode(self, data):
+    return self.dumps(data) + '\n'
+
+  def encode_call(self, id, method, args):
+    """Encodes a request like encode(), the head of the request is
+    serialized once per method and reused."""
+    head = self._heads.get(method)
+    if head is None:
+      head = '{"method": %s, "params": ' % self.dumps(method)
+      self._heads[method] = head
+    return '%s%s, "id": %d}\n' % (head, self.dumps(args), id)
+
+  def decode(self, line):
+    return self.loads(line)
+
+
+class BytesCodec(JsonCodec):
+  """Opens the socket file in binary mode, json output is plain ascii.
+
+  Not a faster 'json': on python3 the utf-8 decoding moves from the text
+  wrapper into decode(), and tools/bench_rpc.py shows no gain per call.
+  It is the codec for json modules working on bytes, as simplejson.
+  """
+  mode = 'binary'
+
+  if sys.version_info[0] == 2:
+    # str is already bytes, json.loads takes utf-8 str.
+    pass
+  else:
+    def encode(self, data):
+      return (self.dumps(data) + '\n').encode('ascii')
+
+    def encode_call(self, id, method, args):
+      return JsonCodec.encode_call(self, id, method, args).encode('ascii')
+
+    def decode(self, line):
+      # json.loads of bytes guesses the encoding in python code first.
+      return self.loads(line.decode('utf-8'))
+
+
+CODECS = {
+    'json': JsonCodec,
+    'bytes': BytesCodec,
+}
+
+try:
+  # bundled with python-twitter, _speedups is needed to be fast.
+  import simplejson
+  CODECS['simplejson'] = lambda: BytesCodec(simplejson)
+except ImportError:
+  pass
+
+
+# facades answering the same while a script runs, cached by enable_cache().
+# maintained by hand, the facade metadata of SL4A does not tell which
+# calls are static.  fullQuery is not here: the user changes the views
+# on the screen without a facade call.
+CACHEABLE = frozenset([
+    'batteryGetTechnology',
+    'environment',
+    'getConstants',
+    'getDeviceId',
+    'getDeviceSoftwareVersion',
+    'getNetworkOperator',
+    'getNetworkOperatorName',
+    'getPackageVersion',
+    'getPackageVersionCode',
+    'getPhoneType',
+    'getSimCountryIso',
+    'getSimOperator',
+    'getSimOperatorName',
+    'getSimSerialNumber',
+    'getSubscriberId',
+    'requiredVersion',
+])
+
+# calls which make cached results of other facades stale, for scripts
+# caching fullQuery by enable_cache(facades=...).
+INVALIDATES = {
+    'fullDismiss': ('fullQuery', ),
+    'fullSetList': ('fullQuery', ),
+    'fullSetProperty': ('fullQuery', ),
+    'fullShow': ('fullQuery', ),
+}
+
+
+class ResponseCache(object):
+  """LRU cache of Results keyed by method name and params.
+
+  Entries older than ttl seconds are dropped, ttl=None keeps them until
+  they are evicted or invalidated.
+  """
+
+  def __init__(self, size=128, ttl=None):
+    self.size = size
+    self.ttl = ttl
+    self._data = collections.OrderedDict()
+    self._lock = threading.Lock()
+
+  def key(self, method, args):
+    """Returns the key of a call, or None if params are not hashable."""
+    key = (method, args)
+    try:
+      hash(key)
+    except TypeError:
+      return None
+    return key
+
+  def get(self, key):
+    with self._lock:
+      item = self._data.pop(key, None)
+      if item is None:
+        return None
+      result, expires = item
+      if expires is not None and expires < time.time():
+        return None
+      self._data[key] = item
+      return result
+
+  def put(self, key, result):
+    expires = None if self.ttl is None else time.time() + self.ttl
+    with self._lock:
+      self._data.pop(key, None)
+      self._data[key] = (result, expires)
+      while len(self._data) > self.size:
+        self._data.popitem(last=False)
+
+  def invalidate(self, *methods):
+    """Drops the results of methods, or everything without arguments."""
+    with self._lock:
+      if not methods:
+        self._data.clear()
+        return
+      for key in [k for k in self._data if k[0] in methods]:
+        del self._data[key]
+
+
+def get_codec(codec=None):
+  """Returns a codec instance from a name in CODECS or the instance."""
+  if codec is None:
+    codec = 'json'
+  if isinstance(codec, _string_types):
+    return CODECS[codec]()
+  return codec
 
 
 class Android(object):
+  cache = None
+  cacheable = CACHEABLE
+
+  def __init__(self, addr=None, codec=None, reconnect=False):
+    """Connects to SL4A, launching the server if it does not answer.
 
-  def __init__(self, addr=None):
+    With reconnect, a call failing on a dropped connection gets a new,
+    authenticated connection.  The call is sent again over it when the
+    request could not be written, or when it is a facade of CACHEABLE;
+    otherwise SL4A may have run it already, the IOError goes to the
+    caller over the new connection.  A resent call runs at least once,
+    not exactly once.  startup_time holds the seconds from here until the
+    server accepted the handshake.
+    """
+    started = time.time()
     if addr is None:
       addr = HOST, PORT
+    self.codec = get_codec(codec)
+    self.reconnect = reconnect
+    self.id = 0
+    self._connect(addr)
+    self.startup_time = time.time() - started
+    debg("SL4A ready in %.3f sec" % self.startup_time)
 
+  def _connect(self, addr):
     if True:
         try:
             self.conn = socket.create_connection(addr)
         except:
             self.conn = self.launchSL4A(addr)
+        self.addr = self.conn.getpeername()[:2]
 
-        if sys.version_info[0] == 2:
+        if self.codec.mode == 'binary':
+            self.client = self.conn.makefile('rwb')
+        elif sys.version_info[0] == 2:
             self.client = self.conn.makefile('rw')
         else:
             self.client = self.conn.makefile('rw', encoding='utf-8')
-    self.id = 0
     if HANDSHAKE is not None:
       self._authenticate(HANDSHAKE)
 
-  def _rpc(self, method, *args):
-    data = {'id': self.id,
-            'method': method,
-            'params': args}
-    request = json.dumps(data)
-    self.client.write(request+'\n')
+  def _reconnect(self):
+    warn("SL4A connection lost, reconnect to %s" % str(self.addr))
+    try:
+      self.close()
+    except (IOError, OSError):
+      pass
+    self._connect(self.addr)
+
+  def _send(self, request):
+    self.client.write(request)
     self.client.flush()
+
+  def _receive(self):
     response = self.client.readline()
+    if not response:
+      raise IOError("SL4A closed the connection")
+    return response
+
+  def _rpc(self, method, *args):
+    cache = self.cache
+    key = None
+    if cache is not None:
+      if method in self.cacheable:
+        key = cache.key(method, args)
+      if key is None:
+        stale = INVALIDATES.get(method)
+        if stale:
+          cache.invalidate(*stale)
+      else:
+        ret = cache.get(key)
+        if ret is not None:
+          return ret
+    request = self.codec.encode_call(self.id, method, args)
     self.id += 1
-    result = json.loads(response)
+    retry = self.reconnect and method != '_authenticate'
+    try:
+      self._send(request)
+    except (IOError, OSError):
+      if not retry:
+        raise
+      # not sent, SL4A did not run it.
+      self._reconnect()
+      self._send(request)
+    try:
+      response = self._receive()
+    except (IOError, OSError):
+      if not retry:
+        raise
+      self._reconnect()
+      if method not in CACHEABLE:
+        raise
+      self._send(request)
+      response = self._receive()
+    ret = self._result(self.codec.decode(response))
+    if key is not None and ret.error is None:
+      cache.put(key, ret)
+    return ret
+
+  def _rpc_many(self, calls):
+    """Send all (method, args) pairs at once, then read their responses.
+
+    Responses are matched by id, so the returned list is in the order of
+    calls regardless of the order the server answers in.  IOError is
+    raised when the connection closes before all the responses, or on a
+    response of an unknown or repeated id.
+    """
+    cache = self.cache
+    ids = []
+    for method, args in calls:
+      if cache is not None:
+        stale = INVALIDATES.get(method)
+        if stale:
+          cache.invalidate(*stale)
+      ids.append(self.id)
+      self.client.write(self.codec.encode_call(self.id, method, args))
+      self.id += 1
+    if not ids:
+      return []
+    self.client.flush()
+    responses = {}
+    pending = set(ids)
+    try:
+      while pending:
+        result = self.codec.decode(self._receive())
+        id = result['id']
+        if id not in pending:
+          raise IOError("SL4A answered %r out of the batch %d-%d" %
+                        (id, ids[0], ids[-1]))
+        pending.remove(id)
+        responses[id] = result
+    except (IOError, OSError):
+      # the calls of the batch may have run, they are not sent again.
+      if self.reconnect:
+        self._reconnect()
+      raise
+    return [self._result(responses[i]) for i in ids]
+
+  def _result(self, result):
     if result['error'] is not None:
       print(result['error'])
     # namedtuple doesn't work with unicode keys.
-    return Result(id=result['id'], result=result['result'],
-                  error=result['error'], )
+    return Result(result['id'], result['result'], result['error'])
+
+  def enable_cache(self, size=128, ttl=None, facades=None):
+    """Caches results of the cacheable facades, or of facades if given.
+
+    droid.enable_cache(ttl=60)
+    droid.getDeviceId()     # asks SL4A
+    droid.getDeviceId()     # from the cache
+    droid.invalidate('getDeviceId')
+    """
+    self.cache = ResponseCache(size, ttl)
+    if facades is not None:
+      self.cacheable = frozenset(facades)
+    return self.cache
+
+  def invalidate(self, *methods):
+    """Drops cached results of methods, or all of them."""
+    if self.cache is not None:
+      self.cache.invalidate(*methods)
+
+  def close(self):
+    self.client.close()
+    self.conn.close()
+
+  def batch(self):
+    """Returns a Batch which pipelines facade calls over this connection.
+
+    with droid.batch() as b:
+        b.batteryGetLevel()
+        b.readSensors()
+    level, sensors = b.results
+    """
+    return Batch(self)
+
+  def bluetooth_readinto(self, buf, connID=''):
+    """Reads up to len(buf) bytes of a Bluetooth connection into buf.
+
+    Returns the number of bytes read, 0 when nothing was read.  IOError
+    is raised on the errors of SL4A, as a dropped Bluetooth connection.
+    The base64 reply is decoded into a temporary bytes object, which is
+    copied into buf; only the buffer of the caller is reused.  connID ''
+    is the last connection, as in SL4A.
+    """
+    view = memoryview(buf)
+    ret = self._rpc('bluetoothReadBinary', len(view), connID)
+    if ret.error is not None:
+      raise IOError(ret.error)
+    if not ret.result:
+      return 0
+    data = binascii.a2b_base64(ret.result)
+    if len(data) > len(view):
+      raise IOError("SL4A sent %d bytes for a read of %d bytes" %
+                    (len(data), len(view)))
+    view[:len(data)] = data
+    return len(data)
+
+  def bluetooth_stream(self, size=4096, connID=''):
+    """Yields memoryviews of received data, which share one buffer.
+
+    A view is valid until the next one is yielded, copy it to keep it.
+    The iteration stops when nothing is left to read, errors of the
+    connection raise IOError as bluetooth_readinto() does.
+    """
+    buf = bytearray(size)
+    view = memoryview(buf)
+    while True:
+      n = self.bluetooth_readinto(buf, connID)
+      if n == 0:
+        return
+      yield view[:n]
+
+  def bluetooth_write(self, data, connID='', chunk_size=4096):
+    """Sends data in base64 chunks, pipelined in one batch.
+
+    Returns True if all chunks were sent.
+    """
+    view = memoryview(data)
+    calls = []
+    for pos in range(0, len(view), chunk_size):
+      chunk = binascii.b2a_base64(view[pos:pos + chunk_size])
+      calls.append(('bluetoothWriteBinary',
+                    (chunk.decode('ascii').rstrip('\n'), connID)))
+    results = self._rpc_many(calls)
+    return all(ret.error is None for ret in results)
+
+  def events(self, names=None, timeout=None, dispatcher=False):
+    """Yields SL4A events as they arrive, instead of polling for them.
+
+    names limits the stream to the events of those names (a str or a
+    sequence of str), other events are dropped on the client side.
+    The iteration stops when no event of names arrives for timeout
+    seconds, or runs forever if timeout is None.
+
+    With dispatcher=True events are read from the socket pushed by
+    startEventDispatcher, otherwise eventWait is called repeatedly.
+
+    for event in droid.events(('click', 'key'), timeout=30):
+        print(event['name'], event['data'])
+    """
+    if isinstance(names, _string_types):
+      names = (names, )
+    if names is not None:
+      names = frozenset(names)
+    if dispatcher:
+      return self._dispatched_events(names, timeout)
+    return self._waited_events(names, timeout)
+
+  def _waited_events(self, names, timeout):
+    # the events dropped by names do not restart the timeout.
+    deadline = None
+    while True:
+      args = ()
+      if timeout is not None:
+        if deadline is None:
+          deadline = time.time() + timeout
+        left = deadline - time.time()
+        if left <= 0:
+          return
+        args = (max(int(left * 1000), 1), )
+      ret = self._rpc('eventWait', *args)
+      if ret.error is not None or ret.result is None:
+        return
+      event = ret.result
+      if names is None or event['name'] in names:
+        deadline = None
+        yield event
+
+  def _dispatched_events(self, names, timeout):
+    port = self._rpc('startEventDispatcher').result
+    conn = socket.create_connection((self.conn.getpeername()[0], port))
+    fp = conn.makefile('rb')
+    deadline = None
+    try:
+      while True:
+        if timeout is not None:
+          if deadline is None:
+            deadline = time.time() + timeout
+          left = deadline - time.time()
+          if left <= 0:
+            return
+          conn.settimeout(left)
+        try:
+          line = fp.readline()
+        except socket.timeout:
+          return
+        if not line:
+          return
+        event = json.loads(line.decode('utf-8'))
+        if names is None or event['name'] in names:
+          deadline = None
+          yield event
+    finally:
+      fp.close()
+      conn.close()
+      self._rpc('stopEventDispatcher')
 
   def __getattr__(self, name):
     def rpc_call(*args):
       return self._rpc(name, *args)
+    # keep it, next lookups of the facade do not come here.
+    self.__dict__[name] = rpc_call
     return rpc_call
 
   if True:
@@ -84,7 +516,148 @@ class Android(object):
                % (sl4a, sl4a, addr[1], sl4a))
         warn("launch SL4A with %s" % str(addr))
         os.system(cmd)
-        time.sleep(2)
-        return socket.create_connection(addr)
+        return self._wait_server(addr, LAUNCH_TIMEOUT)
+
+    def _wait_server(self, addr, timeout):
+        # poll with short, growing intervals rather than a fixed sleep.
+        deadline = time.time() + timeout
+        delay = 0.05
+        while True:
+            try:
+                return socket.create_connection(addr)
+            except (IOError, OSError):
+                if time.time() + delay > deadline:
+                    raise
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+
+
+class Batch(object):
+  """Collects facade calls and sends them in one write.
+
+  Calls made on a Batch return None; the Result of every call is
+  available from flush() or, when used as a context manager, from
+  the results attribute after the with block.
+  """
+
+  def __init__(self, android):
+    self._android = android
+    self._calls = []
+    self.results = []
+
+  def flush(self):
+    calls, self._calls = self._calls, []
+    self.results = self._android._rpc_many(calls)
+    return self.results
+
+  def __len__(self):
+    return len(self._calls)
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    if exc_type is None:
+      self.flush()
+    return False
+
+  def __getattr__(self, name):
+    def rpc_call(*args):
+      self._calls.append((name, args))
+    return rpc_call
+
+
+class AndroidPool(object):
+  """A bounded pool of authenticated connections for threaded scripts.
+
+  Each facade call checks a connection out, runs the RPC and puts it
+  back, so worker threads never share a socket::
+
+      droid = AndroidPool(4)
+      threads = [threading.Thread(target=droid.readSensors) ...]
+
+  Use connection() to keep one connection for a sequence of calls,
+  e.g. for batch().
+  """
+
+  def __init__(self, size=4, addr=None, codec=None):
+    self.size = size
+    self.addr = addr
+    self.codec = codec
+    # _cond guards _idle and _opened, waiters are notified when a
+    # connection is put back or discarded.
+    self._idle = []
+    self._cond = threading.Condition()
+    self._opened = 0
+
+  def _checkout(self):
+    with self._cond:
+      while not self._idle and self._opened >= self.size:
+        self._cond.wait()
+      if self._idle:
+        return self._idle.pop()
+      self._opened += 1
+    try:
+      return Android(self.addr, self.codec)
+    except:
+      with self._cond:
+        self._opened -= 1
+        self._cond.notify()
+      raise
+
+  def _release(self, droid):
+    with self._cond:
+      self._idle.append(droid)
+      self._cond.notify()
+
+  def _discard(self, droid):
+    with self._cond:
+      self._opened -= 1
+      self._cond.notify()
+    try:
+      droid.close()
+    except (IOError, OSError):
+      pass
+
+  def connection(self):
+    """Context manager which holds one connection of the pool."""
+    return _PooledConnection(self)
+
+  def close(self):
+    with self._cond:
+      idle, self._idle = self._idle, []
+    for droid in idle:
+      self._discard(droid)
+
+  def _rpc(self, method, *args):
+    with self.connection() as droid:
+      return droid._rpc(method, *args)
+
+  def __getattr__(self, name):
+    def rpc_call(*args):
+      return self._rpc(name, *args)
+    self.__dict__[name] = rpc_call
+    return rpc_call
+
+
+class _PooledConnection(object):
+
+  def __init__(self, pool):
+    self.pool = pool
+    self.droid = None
+
+  def __enter__(self):
+    self.droid = self.pool._checkout()
+    return self.droid
+
+  def __exit__(self, exc_type, exc_value, traceback):
+    droid, self.droid = self.droid, None
+    if exc_type is None or not issubclass(exc_type, (IOError, OSError,
+                                                     ValueError)):
+      self.pool._release(droid)
+    else:
+      # the socket may hold a half read response, do not reuse it.
+      self.pool._discard(droid)
+    return False
 
 # vi: et:ts=4:nowrap
@@ -4,6 +4,8 @@ Created on Jul 19, 2012
 @author: Hariharan Srinath
 '''
 import abc
+import collections
+import contextlib
 #import android
 import pickle
 import json
@@ -228,9 +230,9 @@ class View(object):
     To add and remove events, use the View.add_event() and View.remove_event() methods. To set the contents of
     a ListView, use the View.set_listitems() method
     '''
-    def __init__(self,view_id, view_type):
+    def __init__(self,view_id, view_type, layout=None):
         '''
-        View constructer called with view_id & view_type. DO NOT create a view yourself.
+        View constructer called with view_id & view_type and the layout holding the view. DO NOT create a view yourself.
 
         Views are created by FullScreenWrapper2App.show_layout() after showing the xml and are populated
         in the Layout.views which is a BaseDict => ie. a dict that allows access by both [key] and .key
@@ -238,6 +240,7 @@ class View(object):
         self.view_type = view_type
         self.view_id = view_id
         self._events = {}
+        self._layout = layout
 
     def add_event(self, eventhandler):
         '''
@@ -246,18 +249,27 @@ class View(object):
         You would typically add one of click_EventHandler or itemclick_EventHandler (for List Views)
         to a view
         '''
+        old = self._events.get(eventhandler.event_name)
         self._events[eventhandler.event_name]=eventhandler
+        if self._layout != None:
+            if old != None:
+                self._layout._unindex_event(old)
+            self._layout._index_event(eventhandler)
 
     def remove_event(self,event_name):
         '''
         removes an event added previously by matching the event_name. Use this to temporarily disable a view's click event
         '''
-        self._events.pop(event_name)
+        eventhandler = self._events.pop(event_name)
+        if self._layout != None:
+            self._layout._unindex_event(eventhandler)
 
     def set_listitems(self,listitems):
         '''
         sets a list for a ListView. Takes a list of str as input
         '''
+        if self._layout != None:
+            return self._layout._write("fullSetList", self.view_id, None, listitems)
         FullScreenWrapper2App.set_list_contents(self.view_id, listitems)
 
     def __setattr__(self, name, value):
@@ -266,11 +278,13 @@ class View(object):
 
         For eg: Layout.views.viewname.color = "#FFFFFFFF"
         '''
-        if name in ("view_type","view_id","_events"):
+        if name in ("view_type","view_id","_events","_layout"):
             object.__setattr__(self,name,value)
         else:
             #sys.stderr.write("calling sl4a to set name:"+str(name)+" value:"+value+"\n")
-            return FullScreenWrapper2App.set_property_value(self.id, name, value)
+            if self._layout != None:
+                return self._layout._write("fullSetProperty", self.view_id, name, value)
+            return FullScreenWrapper2App.set_property_value(self.view_id, name, value)
 
     def __getattr__(self, name):
         '''
@@ -279,6 +293,8 @@ class View(object):
         For eg: buttontext = Layout.views.buttonname.text
         '''
         #sys.stderr.write("calling sl4a to get name:"+str(name)+"\n")
+        if self._layout != None:
+            return self._layout._get_property_value(self.view_id, name)
         return FullScreenWrapper2App.get_property_value(self.view_id, name)
 
     def __str__(self):
@@ -336,6 +352,7 @@ class Layout(object, metaclass=abc.ABCMeta):
         self.title = title
         self.xml = xml
         self.views = BaseDict()
+        self._batch_depth = 0
         self._reset()
 
     def _reset(self):
@@ -344,8 +361,157 @@ class Layout(object, metaclass=abc.ABCMeta):
         which is used to handle layout events internally
         '''
         self.views.clear()
+        #event handlers of the views keyed by (event_name, compare_attribute, compare_value)
+        self._event_index = {}
+        #compare_attributes used by the event handlers of each event_name
+        self._event_attributes = {}
+        #view properties from the last fullQuery, None until a property is read
+        self._properties = None
+        #property writes and lists held by batch() keyed by (facade, view_id, property), the writes held for the views
+        #of a layout shown before are dropped
+        self._writes = collections.OrderedDict()
         #adds a dummy view representing the layout for event management
-        self.views[self.uid]= View(self.uid,"Layout")
+        self.views[self.uid]= View(self.uid,"Layout",self)
+
+    def refresh_properties(self):
+        '''
+        reads the properties of all the views with one fullQuery call. View property reads are answered from this
+        snapshot until a property is written or an event arrives. This is done for you on the first read
+        '''
+        self._properties = FullScreenWrapper2App.get_android_instance().fullQuery().result or {}
+
+    def invalidate_properties(self, view_id=None):
+        '''
+        drops the snapshot of a view's properties, or of all the views if no view_id is given, so they are read again
+        '''
+        if view_id == None:
+            self._properties = None
+        elif self._properties != None:
+            self._properties.pop(view_id, None)
+
+    @contextlib.contextmanager
+    def batch(self):
+        '''
+        holds the view property writes and set_listitems() calls made in the with block and sends them in one
+        pipelined burst when it ends. Only the last value written to a property of a view is sent. Blocks can be nested,
+        the writes are sent at the end of the outermost one. If a block raises, the writes held are dropped and the
+        exception goes on
+
+        with self.batch():
+            self.views.txt_clock.text = clock
+            self.views.lst_log.set_listitems(lines)
+        '''
+        self._batch_depth += 1
+        try:
+            yield self
+        except:
+            self._writes.clear()
+            raise
+        finally:
+            self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+
+    def flush(self):
+        '''
+        sends the writes held by batch() now. Returns the list of their SL4A results
+        '''
+        writes, self._writes = self._writes, collections.OrderedDict()
+        if len(writes) == 0:
+            return []
+        calls = []
+        for (facade, view_id, property), value in writes.items():
+            self.invalidate_properties(view_id)
+            if facade == "fullSetList":
+                calls.append((facade, (view_id, value)))
+            else:
+                calls.append((facade, (view_id, property, value)))
+        droid = FullScreenWrapper2App.get_android_instance()
+        if getattr(type(droid), "batch", None) == None:
+            #an android module without batch(), one call at a time
+            return [getattr(droid, facade)(*args) for facade, args in calls]
+        with droid.batch() as b:
+            for facade, args in calls:
+                getattr(b, facade)(*args)
+        if getattr(type(droid), "invalidate", None) != None:
+            #batches of an older android module do not drop the cached fullQuery
+            droid.invalidate("fullQuery")
+        return b.results
+
+    def _write(self, facade, view_id, property, value):
+        '''
+        Internal - called by View to set a property or a list, held until the end of batch() if one is open
+        '''
+        if self._batch_depth > 0:
+            key = (facade, view_id, property)
+            #a rewrite moves to the end, keeping the order of the last writes
+            self._writes.pop(key, None)
+            self._writes[key] = value
+            return None
+        self.invalidate_properties(view_id)
+        if facade == "fullSetList":
+            return FullScreenWrapper2App.set_list_contents(view_id, value)
+        return FullScreenWrapper2App.set_property_value(view_id, property, value)
+
+    def _get_property_value(self, view_id, property):
+        '''
+        Internal - reads a view property from the snapshot. A view dropped by invalidate_properties(view_id)
+        is read again alone by fullQueryDetail. Writes held by batch() are read back as written
+        '''
+        key = ("fullSetProperty", view_id, property)
+        if key in self._writes:
+            return self._writes[key]
+        if self._properties == None:
+            self.refresh_properties()
+        try:
+            details = self._properties[view_id]
+        except KeyError:
+            if view_id == self.uid:
+                return None
+            details = FullScreenWrapper2App.get_android_instance().fullQueryDetail(view_id).result
+            if details == None:
+                return None
+            self._properties[view_id] = details
+        return details.get(property)
+
+    def _index_event(self, eventhandler):
+        '''
+        Internal - called by View.add_event() to make the event handler found by _find_event_handlers()
+        '''
+        key = (eventhandler.event_name, eventhandler.compare_attribute, eventhandler.compare_value)
+        self._event_index.setdefault(key, []).append(eventhandler)
+        if eventhandler.compare_attribute != None:
+            attributes = self._event_attributes.setdefault(eventhandler.event_name, [])
+            if eventhandler.compare_attribute not in attributes:
+                attributes.append(eventhandler.compare_attribute)
+
+    def _unindex_event(self, eventhandler):
+        '''
+        Internal - called by View.remove_event() and when View.add_event() replaces an event handler
+        '''
+        key = (eventhandler.event_name, eventhandler.compare_attribute, eventhandler.compare_value)
+        handlers = self._event_index.get(key, [])
+        if eventhandler in handlers:
+            handlers.remove(eventhandler)
+            if len(handlers) == 0:
+                del self._event_index[key]
+
+    def _find_event_handlers(self, event_data):
+        '''
+        returns the event handlers of the layout & its views matching the event data. This does the same matching
+        as EventHandler.match_event_data() with a few dict lookups, whatever the number of views
+        '''
+        handlers = []
+        try:
+            event_name = event_data["name"]
+            handlers.extend(self._event_index.get((event_name, None, None), []))
+            data = event_data["data"]
+            for attribute in self._event_attributes.get(event_name, []):
+                if attribute in data:
+                    handlers.extend(self._event_index.get((event_name, attribute, data[attribute]), []))
+        except (KeyError, TypeError):
+            pass
+        return handlers
 
     def add_event(self, eventhandler):
         '''
@@ -395,7 +561,7 @@ class FullScreenWrapper2App(object):
 
     the internal function called by FullScreenWrapper2App.show_layout() and close_layout() actually populates the layout's views once it is shown & also calls the Layout.on_show() function
 
-    Once you have called show_layout() and your first layout is displayed on screen with its view properties & event handlers set, you should call FullScreenWrapper2App.eventloop() to start the event loop. The event loop will keep polling for
+    Once you have called show_layout() and your first layout is displayed on screen with its view properties & event handlers set, you should call FullScreenWrapper2App.eventloop() to start the event loop. The event loop will keep waiting on
     the event queue and dispatch events to the appropriate handler functions
 
     The FullScreenWrapper also defines a few "convenience" functions which are used to set and access fullscreen properties via SL4A api calls
@@ -407,6 +573,9 @@ class FullScreenWrapper2App(object):
     SHOW_LAYOUT_REPLACING_CURRENT = 1
     _SHOW_LAYOUT_POP_CURRENT = 2
 
+    #milliseconds eventloop() waits for an event in a single eventWait call
+    EVENT_WAIT_TIMEOUT = 10000
+
 
     @classmethod
     def initialize(cls, android_instance):
@@ -448,7 +617,9 @@ class FullScreenWrapper2App(object):
             layout._reset()
 
             for viewname in iter(viewsdict):
-                layout.views[viewname] = View(viewname, viewsdict[viewname]["type"])
+                layout.views[viewname] = View(viewname, viewsdict[viewname]["type"], layout)
+            #the query just made is the first snapshot of the view properties
+            layout._properties = viewsdict
 
             if show_mode == cls.SHOW_LAYOUT_PUSH_OVER_CURRENT:
                 cls._layouts.append(layout)
@@ -503,9 +674,10 @@ class FullScreenWrapper2App(object):
             raise RuntimeError("Trying to start eventloop without a layout visible")
 
         while(True):
-            evt=cls.get_android_instance().eventPoll()
-            if(len(evt.result)>0):
-                eventdata=evt.result[0]
+            #eventWait blocks in the SL4A server until an event arrives, so the loop does not spin
+            evt=cls.get_android_instance().eventWait(cls.EVENT_WAIT_TIMEOUT)
+            if(evt.result):
+                eventdata=evt.result
 
                 #this corrects an eventpost issue where an extra "" wraps the json
                 try:
@@ -521,18 +693,13 @@ class FullScreenWrapper2App(object):
                     break
 
                 curlayout = cls._layouts[len(cls._layouts)-1]
+                #the user may have changed the views, read their properties again
+                curlayout.invalidate_properties()
 
-                for viewname in iter(curlayout.views):
-                    view = curlayout.views[viewname]
-                    #sys.stderr.write("Checking with"+ view.view_id+"\n")
-                    for eventname in iter(view._events):
-                        event = view._events[eventname]
-                        if event.match_event_data(eventdata):
-                            if event.event_handler_fn != None:
-                                event.event_handler_fn(event.view, eventdata)
-                                event_handled = True
-                                #sys.stderr.write("found a match in view "+str(event.view.view_id))
-                                break
+                for event in curlayout._find_event_handlers(eventdata):
+                    if event.event_handler_fn != None:
+                        event.event_handler_fn(event.view, eventdata)
+                        #sys.stderr.write("found a match in view "+str(event.view.view_id))
 
 
 
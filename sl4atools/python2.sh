@@ -17,7 +17,9 @@ bin=/data/data/com.googlecode.$py4a/files/$binr
 pfx=$st/com.googlecode.$py4a
 ext=$pfx/extras/$binr
 PYTHONUSERBASE=$pfx/local
-PYTHONPATH=$ext
+# pure python modules by zipimport, then the others.
+PYTHONPATH=$ext/python27.zip
+PYTHONPATH=${PYTHONPATH}:$ext
 PYTHONPATH=${PYTHONPATH}:$PYTHONUSERBASE
 PYTHONPATH=${PYTHONPATH}:$bin/lib/python$ver/lib-dynload
 export PYTHONPATH
@@ -20,7 +20,9 @@ ext=$pfx/extras/$binr
 PYTHONUSERBASE=$pfx/local
 # to use C extension modules (with shared lib)
 # PYTHONUSERBASE=/data/local/tmp/local
-PYTHONPATH=$ext
+# pure python modules by zipimport, then the others.
+PYTHONPATH=$ext/python36.zip
+PYTHONPATH=${PYTHONPATH}:$ext
 PYTHONPATH=${PYTHONPATH}:$PYTHONUSERBASE
 PYTHONPATH=${PYTHONPATH}:$bin/lib/python$ver/lib-dynload
 export PYTHONPATH
@@ -0,0 +1,343 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper
+#
+# Purpose:      To simplify Python-for-Android SL4A development in IDEs with a
+#               "hepler" class derived from the default Android class containing
+#               SL4A facade functions & API documentation
+#
+#               The facade functions of each SL4A facade are in a module of this
+#               package, which is imported at the first use of one of them
+#
+# Usage:        copy androidhelper directory into either the folder containing your
+#               SL4A python script or to some location on the python import path
+#               that your IDE can see and in your script, instead of:
+#
+#                   import android
+#
+#               use the following import code:
+#
+#                   try:
+#                       import androidhelper as android
+#                   except:
+#                       import android
+#
+# Sources:      Derived from API documentation in HTML files contained in
+#               /android-scripting/android/ScriptingLayerForAndroid/assets/sl4adoc.zip
+#
+# Version:      for SL4A Release R5, created on 7-Apr-2012
+#
+# Author(s):    Hariharan Srinath (srinathdevelopment@gmail.com) with inputs
+#               from Robert J Matthews (rjmatthews62@gmail.com)
+#
+# Copyright:    Copyright (C) 2012, Hariharan Srinath, Robert J Matthews
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy of
+# the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations under
+# the License.
+from __future__ import absolute_import
+import importlib
+
+import android
+
+class Android(android.Android):
+	'''
+	android.Android with the SL4A facade functions, which are set to this class
+	from the facade modules of this package at the first use
+	'''
+	def __getattr__(self, name):
+		family = FAMILIES.get(name)
+		if family is None:
+			return android.Android.__getattr__(self, name)
+		_attach(family)
+		return object.__getattribute__(self, name)
+
+	def __dir__(self):
+		return sorted(set(dir(type(self))) | set(self.__dict__) | set(FAMILIES))
+
+	cacheable = frozenset([
+		"batteryGetTechnology",
+		"environment",
+		"getConstants",
+		"getDeviceId",
+		"getDeviceSoftwareVersion",
+		"getNetworkOperator",
+		"getNetworkOperatorName",
+		"getPackageVersion",
+		"getPackageVersionCode",
+		"getPhoneType",
+		"getSimCountryIso",
+		"getSimOperator",
+		"getSimOperatorName",
+		"getSimSerialNumber",
+		"getSubscriberId",
+		"requiredVersion",
+	])
+
+def _attach(family):
+	'''
+	sets the functions of a facade module to Android
+	'''
+	mod = importlib.import_module(__name__+"."+family)
+	for name in mod.__all__:
+		if FAMILIES.get(name) == family:
+			setattr(Android, name, getattr(mod, name))
+
+#facade function name => module of this package defining it
+FAMILIES = {
+	"setResultBoolean": "activityresult",
+	"setResultBooleanArray": "activityresult",
+	"setResultByte": "activityresult",
+	"setResultByteArray": "activityresult",
+	"setResultChar": "activityresult",
+	"setResultCharArray": "activityresult",
+	"setResultDouble": "activityresult",
+	"setResultDoubleArray": "activityresult",
+	"setResultFloat": "activityresult",
+	"setResultFloatArray": "activityresult",
+	"setResultInteger": "activityresult",
+	"setResultIntegerArray": "activityresult",
+	"setResultLong": "activityresult",
+	"setResultLongArray": "activityresult",
+	"setResultSerializable": "activityresult",
+	"setResultShort": "activityresult",
+	"setResultShortArray": "activityresult",
+	"setResultString": "activityresult",
+	"setResultStringArray": "activityresult",
+	"environment": "androidfacade",
+	"getClipboard": "androidfacade",
+	"getConstants": "androidfacade",
+	"getInput": "androidfacade",
+	"getIntent": "androidfacade",
+	"getPackageVersion": "androidfacade",
+	"getPackageVersionCode": "androidfacade",
+	"getPassword": "androidfacade",
+	"log": "androidfacade",
+	"makeIntent": "androidfacade",
+	"makeToast": "androidfacade",
+	"notify": "androidfacade",
+	"requiredVersion": "androidfacade",
+	"sendBroadcast": "androidfacade",
+	"sendBroadcastIntent": "androidfacade",
+	"sendEmail": "androidfacade",
+	"setClipboard": "androidfacade",
+	"startActivity": "androidfacade",
+	"startActivityForResult": "androidfacade",
+	"startActivityForResultIntent": "androidfacade",
+	"startActivityIntent": "androidfacade",
+	"vibrate": "androidfacade",
+	"forceStopPackage": "application",
+	"getLaunchableApplications": "application",
+	"getRunningPackages": "application",
+	"launch": "application",
+	"batteryCheckPresent": "battery",
+	"batteryGetHealth": "battery",
+	"batteryGetLevel": "battery",
+	"batteryGetPlugType": "battery",
+	"batteryGetStatus": "battery",
+	"batteryGetTechnology": "battery",
+	"batteryGetTemperature": "battery",
+	"batteryGetVoltage": "battery",
+	"batteryStartMonitoring": "battery",
+	"batteryStopMonitoring": "battery",
+	"readBatteryData": "battery",
+	"bluetoothAccept": "bluetooth",
+	"bluetoothActiveConnections": "bluetooth",
+	"bluetoothConnect": "bluetooth",
+	"bluetoothGetConnectedDeviceName": "bluetooth",
+	"bluetoothGetLocalName": "bluetooth",
+	"bluetoothGetRemoteDeviceName": "bluetooth",
+	"bluetoothGetScanMode": "bluetooth",
+	"bluetoothMakeDiscoverable": "bluetooth",
+	"bluetoothRead": "bluetooth",
+	"bluetoothReadBinary": "bluetooth",
+	"bluetoothReadLine": "bluetooth",
+	"bluetoothReadReady": "bluetooth",
+	"bluetoothSetLocalName": "bluetooth",
+	"bluetoothStop": "bluetooth",
+	"bluetoothWrite": "bluetooth",
+	"bluetoothWriteBinary": "bluetooth",
+	"checkBluetoothState": "bluetooth",
+	"toggleBluetoothState": "bluetooth",
+	"cameraCapturePicture": "camera",
+	"cameraInteractiveCapturePicture": "camera",
+	"pick": "commonintents",
+	"scanBarcode": "commonintents",
+	"search": "commonintents",
+	"view": "commonintents",
+	"viewContacts": "commonintents",
+	"viewHtml": "commonintents",
+	"viewMap": "commonintents",
+	"contactsGet": "contacts",
+	"contactsGetAttributes": "contacts",
+	"contactsGetById": "contacts",
+	"contactsGetCount": "contacts",
+	"contactsGetIds": "contacts",
+	"pickContact": "contacts",
+	"pickPhone": "contacts",
+	"queryAttributes": "contacts",
+	"queryContent": "contacts",
+	"eventClearBuffer": "event",
+	"eventGetBrodcastCategories": "event",
+	"eventPoll": "event",
+	"eventPost": "event",
+	"eventRegisterForBroadcast": "event",
+	"eventUnregisterForBroadcast": "event",
+	"eventWait": "event",
+	"eventWaitFor": "event",
+	"receiveEvent": "event",
+	"rpcPostEvent": "event",
+	"startEventDispatcher": "event",
+	"stopEventDispatcher": "event",
+	"waitForEvent": "event",
+	"geocode": "location",
+	"getLastKnownLocation": "location",
+	"readLocation": "location",
+	"startLocating": "location",
+	"stopLocating": "location",
+	"mediaIsPlaying": "mediaplayer",
+	"mediaPlay": "mediaplayer",
+	"mediaPlayClose": "mediaplayer",
+	"mediaPlayInfo": "mediaplayer",
+	"mediaPlayList": "mediaplayer",
+	"mediaPlayPause": "mediaplayer",
+	"mediaPlaySeek": "mediaplayer",
+	"mediaPlaySetLooping": "mediaplayer",
+	"mediaPlayStart": "mediaplayer",
+	"recorderCaptureVideo": "mediarecorder",
+	"recorderStartMicrophone": "mediarecorder",
+	"recorderStartVideo": "mediarecorder",
+	"recorderStop": "mediarecorder",
+	"startInteractiveVideoRecording": "mediarecorder",
+	"checkNetworkRoaming": "phone",
+	"getCellLocation": "phone",
+	"getDeviceId": "phone",
+	"getDeviceSoftwareVersion": "phone",
+	"getLine1Number": "phone",
+	"getNeighboringCellInfo": "phone",
+	"getNetworkOperator": "phone",
+	"getNetworkOperatorName": "phone",
+	"getNetworkType": "phone",
+	"getPhoneType": "phone",
+	"getSimCountryIso": "phone",
+	"getSimOperator": "phone",
+	"getSimOperatorName": "phone",
+	"getSimSerialNumber": "phone",
+	"getSimState": "phone",
+	"getSubscriberId": "phone",
+	"getVoiceMailAlphaTag": "phone",
+	"getVoiceMailNumber": "phone",
+	"phoneCall": "phone",
+	"phoneCallNumber": "phone",
+	"phoneDial": "phone",
+	"phoneDialNumber": "phone",
+	"readPhoneState": "phone",
+	"startTrackingPhoneState": "phone",
+	"stopTrackingPhoneState": "phone",
+	"prefGetAll": "preferences",
+	"prefGetValue": "preferences",
+	"prefPutValue": "preferences",
+	"readSensors": "sensor",
+	"sensorsGetAccuracy": "sensor",
+	"sensorsGetLight": "sensor",
+	"sensorsReadAccelerometer": "sensor",
+	"sensorsReadMagnetometer": "sensor",
+	"sensorsReadOrientation": "sensor",
+	"startSensing": "sensor",
+	"startSensingThreshold": "sensor",
+	"startSensingTimed": "sensor",
+	"stopSensing": "sensor",
+	"checkAirplaneMode": "settings",
+	"checkRingerSilentMode": "settings",
+	"checkScreenOn": "settings",
+	"getMaxMediaVolume": "settings",
+	"getMaxRingerVolume": "settings",
+	"getMediaVolume": "settings",
+	"getRingerVolume": "settings",
+	"getScreenBrightness": "settings",
+	"getScreenTimeout": "settings",
+	"getVibrateMode": "settings",
+	"setMediaVolume": "settings",
+	"setRingerVolume": "settings",
+	"setScreenBrightness": "settings",
+	"setScreenTimeout": "settings",
+	"toggleAirplaneMode": "settings",
+	"toggleRingerSilentMode": "settings",
+	"toggleVibrateMode": "settings",
+	"readSignalStrengths": "signalstrength",
+	"startTrackingSignalStrengths": "signalstrength",
+	"stopTrackingSignalStrengths": "signalstrength",
+	"smsDeleteMessage": "sms",
+	"smsGetAttributes": "sms",
+	"smsGetMessageById": "sms",
+	"smsGetMessageCount": "sms",
+	"smsGetMessageIds": "sms",
+	"smsGetMessages": "sms",
+	"smsMarkMessageRead": "sms",
+	"smsSend": "sms",
+	"recognizeSpeech": "speechrecognition",
+	"ttsIsSpeaking": "texttospeech",
+	"ttsSpeak": "texttospeech",
+	"generateDtmfTones": "tonegenerator",
+	"addContextMenuItem": "ui",
+	"addOptionsMenuItem": "ui",
+	"clearContextMenu": "ui",
+	"clearOptionsMenu": "ui",
+	"dialogCreateAlert": "ui",
+	"dialogCreateDatePicker": "ui",
+	"dialogCreateHorizontalProgress": "ui",
+	"dialogCreateInput": "ui",
+	"dialogCreatePassword": "ui",
+	"dialogCreateSeekBar": "ui",
+	"dialogCreateSpinnerProgress": "ui",
+	"dialogCreateTimePicker": "ui",
+	"dialogDismiss": "ui",
+	"dialogGetInput": "ui",
+	"dialogGetPassword": "ui",
+	"dialogGetResponse": "ui",
+	"dialogGetSelectedItems": "ui",
+	"dialogSetCurrentProgress": "ui",
+	"dialogSetItems": "ui",
+	"dialogSetMaxProgress": "ui",
+	"dialogSetMultiChoiceItems": "ui",
+	"dialogSetNegativeButtonText": "ui",
+	"dialogSetNeutralButtonText": "ui",
+	"dialogSetPositiveButtonText": "ui",
+	"dialogSetSingleChoiceItems": "ui",
+	"dialogShow": "ui",
+	"fullDismiss": "ui",
+	"fullQuery": "ui",
+	"fullQueryDetail": "ui",
+	"fullSetList": "ui",
+	"fullSetProperty": "ui",
+	"fullShow": "ui",
+	"webViewShow": "ui",
+	"wakeLockAcquireBright": "wakelock",
+	"wakeLockAcquireDim": "wakelock",
+	"wakeLockAcquireFull": "wakelock",
+	"wakeLockAcquirePartial": "wakelock",
+	"wakeLockRelease": "wakelock",
+	"cameraStartPreview": "webcam",
+	"cameraStopPreview": "webcam",
+	"webcamAdjustQuality": "webcam",
+	"webcamStart": "webcam",
+	"webcamStop": "webcam",
+	"checkWifiState": "wifi",
+	"toggleWifiState": "wifi",
+	"wifiDisconnect": "wifi",
+	"wifiGetConnectionInfo": "wifi",
+	"wifiGetScanResults": "wifi",
+	"wifiLockAcquireFull": "wifi",
+	"wifiLockAcquireScanOnly": "wifi",
+	"wifiLockRelease": "wifi",
+	"wifiReassociate": "wifi",
+	"wifiReconnect": "wifi",
+	"wifiStartScan": "wifi",
+}
@@ -0,0 +1,201 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/activityresult.py
+#
+# Purpose:      ActivityResultFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from ActivityResultFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def setResultBoolean(self,resultCode,resultValue):
+	'''
+	setResultBoolean(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Boolean)
+	'''
+	return self._rpc("setResultBoolean",resultCode,resultValue)
+
+def setResultBooleanArray(self,resultCode,resultValue):
+	'''
+	setResultBooleanArray(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Boolean)
+	'''
+	return self._rpc("setResultBooleanArray",resultCode,resultValue)
+
+def setResultByte(self,resultCode,resultValue):
+	'''
+	setResultByte(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Byte)
+	'''
+	return self._rpc("setResultByte",resultCode,resultValue)
+
+def setResultByteArray(self,resultCode,resultValue):
+	'''
+	setResultByteArray(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Byte)
+	'''
+	return self._rpc("setResultByteArray",resultCode,resultValue)
+
+def setResultChar(self,resultCode,resultValue):
+	'''
+	setResultChar(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Character)
+	'''
+	return self._rpc("setResultChar",resultCode,resultValue)
+
+def setResultCharArray(self,resultCode,resultValue):
+	'''
+	setResultCharArray(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Character)
+	'''
+	return self._rpc("setResultCharArray",resultCode,resultValue)
+
+def setResultDouble(self,resultCode,resultValue):
+	'''
+	setResultDouble(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Double)
+	'''
+	return self._rpc("setResultDouble",resultCode,resultValue)
+
+def setResultDoubleArray(self,resultCode,resultValue):
+	'''
+	setResultDoubleArray(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Double)
+	'''
+	return self._rpc("setResultDoubleArray",resultCode,resultValue)
+
+def setResultFloat(self,resultCode,resultValue):
+	'''
+	setResultFloat(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Float)
+	'''
+	return self._rpc("setResultFloat",resultCode,resultValue)
+
+def setResultFloatArray(self,resultCode,resultValue):
+	'''
+	setResultFloatArray(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Float)
+	'''
+	return self._rpc("setResultFloatArray",resultCode,resultValue)
+
+def setResultInteger(self,resultCode,resultValue):
+	'''
+	setResultInteger(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Integer)
+	'''
+	return self._rpc("setResultInteger",resultCode,resultValue)
+
+def setResultIntegerArray(self,resultCode,resultValue):
+	'''
+	setResultIntegerArray(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Integer)
+	'''
+	return self._rpc("setResultIntegerArray",resultCode,resultValue)
+
+def setResultLong(self,resultCode,resultValue):
+	'''
+	setResultLong(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Long)
+	'''
+	return self._rpc("setResultLong",resultCode,resultValue)
+
+def setResultLongArray(self,resultCode,resultValue):
+	'''
+	setResultLongArray(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Long)
+	'''
+	return self._rpc("setResultLongArray",resultCode,resultValue)
+
+def setResultSerializable(self,resultCode,resultValue):
+	'''
+	setResultSerializable(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Serializable)
+	'''
+	return self._rpc("setResultSerializable",resultCode,resultValue)
+
+def setResultShort(self,resultCode,resultValue):
+	'''
+	setResultShort(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Short)
+	'''
+	return self._rpc("setResultShort",resultCode,resultValue)
+
+def setResultShortArray(self,resultCode,resultValue):
+	'''
+	setResultShortArray(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (Short)
+	'''
+	return self._rpc("setResultShortArray",resultCode,resultValue)
+
+def setResultString(self,resultCode,resultValue):
+	'''
+	setResultString(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (String)
+	'''
+	return self._rpc("setResultString",resultCode,resultValue)
+
+def setResultStringArray(self,resultCode,resultValue):
+	'''
+	setResultStringArray(resultCode,resultValue)
+	Sets the result of a script execution. Whenever the script APK is called via startActivityForResult(), the resulting intent will contain SCRIPT_RESULT extra with the given value.
+		resultCode (Integer) The result code to propagate back to the originating activity, often RESULT_CANCELED (0) or RESULT_OK (-1)
+		resultValue (String)
+	'''
+	return self._rpc("setResultStringArray",resultCode,resultValue)
+
+__all__ = [
+	"setResultBoolean",
+	"setResultBooleanArray",
+	"setResultByte",
+	"setResultByteArray",
+	"setResultChar",
+	"setResultCharArray",
+	"setResultDouble",
+	"setResultDoubleArray",
+	"setResultFloat",
+	"setResultFloatArray",
+	"setResultInteger",
+	"setResultIntegerArray",
+	"setResultLong",
+	"setResultLongArray",
+	"setResultSerializable",
+	"setResultShort",
+	"setResultShortArray",
+	"setResultString",
+	"setResultStringArray",
+]
@@ -0,0 +1,256 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/androidfacade.py
+#
+# Purpose:      AndroidFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from AndroidFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def environment(self):
+	'''
+	environment(self)
+	A map of various useful environment details
+	Map returned:
+	TZ = Timezone
+	id = Timezone ID
+	display = Timezone display name
+	offset = Offset from UTC (in ms)
+	SDK = SDK Version
+	download = default download path
+	appcache = Location of application cache
+	sdcard = Space on sdcard
+	availblocks = Available blocks
+	blockcount = Total Blocks
+	blocksize = size of block.
+	'''
+	return self._rpc("environment")
+
+def getClipboard(self):
+	'''
+	getClipboard(self)
+	Read text from the clipboard.
+	returns: (String) The text in the clipboard.
+	'''
+	return self._rpc("getClipboard")
+
+def getConstants(self,classname):
+	'''
+	getConstants(classname)
+	Get list of constants (static final fields) for a class
+		classname (String) Class to get constants from
+	'''
+	return self._rpc("getConstants",classname)
+
+def getInput(self,title="SL4A Input",message="Please enter value:"):
+	'''
+	getInput(title="SL4A Input",message="Please enter value:")
+	Queries the user for a text input.
+		title (String) title of the input box (default=SL4A Input)
+		message (String) message to display above the input box (default=Please enter value:)
+	Deprecated in r3. Use dialogGetInput instead.
+	'''
+	return self._rpc("getInput",title,message)
+
+def getIntent(self):
+	'''
+	getIntent(self)
+	Returns the intent that launched the script.
+	'''
+	return self._rpc("getIntent")
+
+def getPackageVersion(self,packageName):
+	'''
+	getPackageVersion(packageName)
+	Returns package version name.
+		packageName (String)
+	'''
+	return self._rpc("getPackageVersion",packageName)
+
+def getPackageVersionCode(self,packageName):
+	'''
+	getPackageVersionCode(packageName)
+	Returns package version code.
+		packageName (String)
+	'''
+	return self._rpc("getPackageVersionCode",packageName)
+
+def getPassword(self,title="SL4A Password Input",message="Please enter password:"):
+	'''
+	getPassword(title="SL4A Password Input",message="Please enter password:")
+	Queries the user for a password.
+		title (String) title of the input box (default=SL4A Password Input)
+		message (String) message to display above the input box (default=Please enter password:)
+	Deprecated in r3. Use dialogGetPassword instead.
+	'''
+	return self._rpc("getPassword",title,message)
+
+def log(self,message):
+	'''
+	log(message)
+	Writes message to logcat.
+		message (String)
+	'''
+	return self._rpc("log",message)
+
+def makeIntent(self,action,uri=None,type=None,extras=None,categories=None,packagename=None,classname=None,flags=None):
+	'''
+	makeIntent(action,uri=None,type=None,extras=None,categories=None,packagename=None,classname=None,flags=None)
+	Create an Intent.
+		action (String)
+		uri (String)  (optional)
+		type (String) MIME type/subtype of the URI (optional)
+		extras (JSONObject) a Map of extras to add to the Intent (optional)
+		categories (JSONArray) a List of categories to add to the Intent (optional)
+		packagename (String) name of package. If used, requires classname to be useful (optional)
+		classname (String) name of class. If used, requires packagename to be useful (optional)
+		flags (Integer) Intent flags (optional)
+	returns: (Intent) An object representing an Intent
+	'''
+	return self._rpc("makeIntent",action,uri,type,extras,categories,packagename,classname,flags)
+
+def makeToast(self,message):
+	'''
+	makeToast(message)
+	Displays a short-duration Toast notification.
+		message (String)
+	'''
+	return self._rpc("makeToast",message)
+
+def notify(self,title,message):
+	'''
+	notify(title,message)
+	Displays a notification that will be canceled when the user clicks on it.
+		title (String) title
+		message (String)
+	'''
+	return self._rpc("notify",title,message)
+
+def requiredVersion(self,requiredVersion):
+	'''
+	requiredVersion(requiredVersion)
+	Checks if version of SL4A is greater than or equal to the specified version.
+		requiredVersion (Integer)
+	'''
+	return self._rpc("requiredVersion",requiredVersion)
+
+def sendBroadcast(self,action,uri=None,type=None,extras=None,packagename=None,classname=None):
+	'''
+	sendBroadcast(action,uri=None,type=None,extras=None,packagename=None,classname=None)
+	Send a broadcast.
+		action (String)
+		uri (String)  (optional)
+		type (String) MIME type/subtype of the URI (optional)
+		extras (JSONObject) a Map of extras to add to the Intent (optional)
+		packagename (String) name of package. If used, requires classname to be useful (optional)
+		classname (String) name of class. If used, requires packagename to be useful (optional)
+	'''
+	return self._rpc("sendBroadcast",action,uri,type,extras,packagename,classname)
+
+def sendBroadcastIntent(self,intent):
+	'''
+	sendBroadcastIntent(intent)
+	Send Broadcast Intent
+		intent (Intent) Intent in the format as returned from makeIntent
+	'''
+	return self._rpc("sendBroadcastIntent",intent)
+
+def sendEmail(self,to,subject,body,attachmentUri=None):
+	'''
+	sendEmail(to,subject,body,attachmentUri=None)
+	Launches an activity that sends an e-mail message to a given recipient.
+		to (String) A comma separated list of recipients.
+		subject (String)
+		body (String)
+		attachmentUri (String)  (optional)
+	'''
+	return self._rpc("sendEmail",to,subject,body,attachmentUri)
+
+def setClipboard(self,text):
+	'''
+	setClipboard(text)
+	Put text in the clipboard.
+		text (String)
+	Creates a new AndroidFacade that simplifies the interface to various Android APIs.
+	'''
+	return self._rpc("setClipboard",text)
+
+def startActivity(self,action,uri=None,type=None,extras=None,wait=None,packagename=None,classname=None):
+	'''
+	startActivity(action,uri=None,type=None,extras=None,wait=None,packagename=None,classname=None)
+	Starts an activity.
+		action (String)
+		uri (String)  (optional)
+		type (String) MIME type/subtype of the URI (optional)
+		extras (JSONObject) a Map of extras to add to the Intent (optional)
+		wait (Boolean) block until the user exits the started activity (optional)
+		packagename (String) name of package. If used, requires classname to be useful (optional)
+		classname (String) name of class. If used, requires packagename to be useful (optional)
+	packagename and classname, if provided, are used in a 'setComponent' call.
+	'''
+	return self._rpc("startActivity",action,uri,type,extras,wait,packagename,classname)
+
+def startActivityForResult(self,action,uri=None,type=None,extras=None,packagename=None,classname=None):
+	'''
+	startActivityForResult(action,uri=None,type=None,extras=None,packagename=None,classname=None)
+	Starts an activity and returns the result.
+		action (String)
+		uri (String)  (optional)
+		type (String) MIME type/subtype of the URI (optional)
+		extras (JSONObject) a Map of extras to add to the Intent (optional)
+		packagename (String) name of package. If used, requires classname to be useful (optional)
+		classname (String) name of class. If used, requires packagename to be useful (optional)
+	returns: (Intent) A Map representation of the result Intent.
+	'''
+	return self._rpc("startActivityForResult",action,uri,type,extras,packagename,classname)
+
+def startActivityForResultIntent(self,intent):
+	'''
+	startActivityForResultIntent(intent)
+	Starts an activity and returns the result.
+		intent (Intent) Intent in the format as returned from makeIntent
+	returns: (Intent) A Map representation of the result Intent.
+	'''
+	return self._rpc("startActivityForResultIntent",intent)
+
+def startActivityIntent(self,intent,wait=None):
+	'''
+	startActivityIntent(intent,wait=None)
+	Start Activity using Intent
+		intent (Intent) Intent in the format as returned from makeIntent
+		wait (Boolean) block until the user exits the started activity (optional)
+	'''
+	return self._rpc("startActivityIntent",intent,wait)
+
+def vibrate(self,duration=300):
+	'''
+	vibrate(duration=300)
+	Vibrates the phone or a specified duration in milliseconds.
+		duration (Integer) duration in milliseconds (default=300)
+	'''
+	return self._rpc("vibrate",duration)
+
+__all__ = [
+	"environment",
+	"getClipboard",
+	"getConstants",
+	"getInput",
+	"getIntent",
+	"getPackageVersion",
+	"getPackageVersionCode",
+	"getPassword",
+	"log",
+	"makeIntent",
+	"makeToast",
+	"notify",
+	"requiredVersion",
+	"sendBroadcast",
+	"sendBroadcastIntent",
+	"sendEmail",
+	"setClipboard",
+	"startActivity",
+	"startActivityForResult",
+	"startActivityForResultIntent",
+	"startActivityIntent",
+	"vibrate",
+]
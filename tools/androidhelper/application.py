@@ -0,0 +1,46 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/application.py
+#
+# Purpose:      ApplicationManagerFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from ApplicationManagerFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def forceStopPackage(self,packageName):
+	'''
+	forceStopPackage(packageName)
+	Force stops a package.
+		packageName (String) name of package
+	'''
+	return self._rpc("forceStopPackage",packageName)
+
+def getLaunchableApplications(self):
+	'''
+	getLaunchableApplications(self)
+	Returns a list of all launchable application class names.
+	'''
+	return self._rpc("getLaunchableApplications")
+
+def getRunningPackages(self):
+	'''
+	getRunningPackages(self)
+	Returns a list of packages running activities or services.
+	returns: (List) List of packages running activities.
+	'''
+	return self._rpc("getRunningPackages")
+
+def launch(self,className):
+	'''
+	launch(className)
+	Start activity with the given class name.
+		className (String)
+	'''
+	return self._rpc("launch",className)
+
+__all__ = [
+	"forceStopPackage",
+	"getLaunchableApplications",
+	"getRunningPackages",
+	"launch",
+]
@@ -0,0 +1,105 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/battery.py
+#
+# Purpose:      BatteryManagerFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from BatteryManagerFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def batteryCheckPresent(self):
+	'''
+	batteryCheckPresent(self)
+	Returns the most recently received battery presence data.
+	Min SDK level=5
+	'''
+	return self._rpc("batteryCheckPresent")
+
+def batteryGetHealth(self):
+	'''
+	batteryGetHealth(self)
+	Returns the most recently received battery health data:1 - unknown;2 - good;3 - overheat;4 - dead;5 - over voltage;6 - unspecified failure;
+	'''
+	return self._rpc("batteryGetHealth")
+
+def batteryGetLevel(self):
+	'''
+	batteryGetLevel(self)
+	Returns the most recently received battery level (percentage).
+	Min SDK level=5
+	'''
+	return self._rpc("batteryGetLevel")
+
+def batteryGetPlugType(self):
+	'''
+	batteryGetPlugType(self)
+	Returns the most recently received plug type data:-1 - unknown0 - unplugged;1 - power source is an AC charger2 - power source is a USB port
+	'''
+	return self._rpc("batteryGetPlugType")
+
+def batteryGetStatus(self):
+	'''
+	batteryGetStatus(self)
+	Returns  the most recently received battery status data:1 - unknown;2 - charging;3 - discharging;4 - not charging;5 - full;
+	'''
+	return self._rpc("batteryGetStatus")
+
+def batteryGetTechnology(self):
+	'''
+	batteryGetTechnology(self)
+	Returns the most recently received battery technology data.
+	Min SDK level=5
+	'''
+	return self._rpc("batteryGetTechnology")
+
+def batteryGetTemperature(self):
+	'''
+	batteryGetTemperature(self)
+	Returns the most recently received battery temperature.
+	Min SDK level=5
+	'''
+	return self._rpc("batteryGetTemperature")
+
+def batteryGetVoltage(self):
+	'''
+	batteryGetVoltage(self)
+	Returns the most recently received battery voltage.
+	Min SDK level=5
+	'''
+	return self._rpc("batteryGetVoltage")
+
+def batteryStartMonitoring(self):
+	'''
+	batteryStartMonitoring(self)
+	Starts tracking battery state.
+	throws "battery" events
+	'''
+	return self._rpc("batteryStartMonitoring")
+
+def batteryStopMonitoring(self):
+	'''
+	batteryStopMonitoring(self)
+	Stops tracking battery state.
+	'''
+	return self._rpc("batteryStopMonitoring")
+
+def readBatteryData(self):
+	'''
+	readBatteryData(self)
+	Returns the most recently recorded battery data.
+	'''
+	return self._rpc("readBatteryData")
+
+__all__ = [
+	"batteryCheckPresent",
+	"batteryGetHealth",
+	"batteryGetLevel",
+	"batteryGetPlugType",
+	"batteryGetStatus",
+	"batteryGetTechnology",
+	"batteryGetTemperature",
+	"batteryGetVoltage",
+	"batteryStartMonitoring",
+	"batteryStopMonitoring",
+	"readBatteryData",
+]
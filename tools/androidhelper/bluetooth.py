@@ -0,0 +1,179 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/bluetooth.py
+#
+# Purpose:      BluetoothFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from BluetoothFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def bluetoothAccept(self,uuid="457807c0-4897-11df-9879-0800200c9a66",timeout=0):
+	'''
+	bluetoothAccept(uuid="457807c0-4897-11df-9879-0800200c9a66",timeout=0)
+	Listens for and accepts a Bluetooth connection. Blocks until the connection is established or fails.
+		uuid (String)  (default=457807c0-4897-11df-9879-0800200c9a66)
+		timeout (Integer) How long to wait for a new connection, 0 is wait for ever (default=0)
+	'''
+	return self._rpc("bluetoothAccept",uuid,timeout)
+
+def bluetoothActiveConnections(self):
+	'''
+	bluetoothActiveConnections(self)
+	Returns true when there\'s an active Bluetooth connection.
+	'''
+	return self._rpc("bluetoothActiveConnections")
+
+def bluetoothConnect(self,uuid="457807c0-4897-11df-9879-0800200c9a66",address=None):
+	'''
+	bluetoothConnect(uuid="457807c0-4897-11df-9879-0800200c9a66",address=None)
+	Connect to a device over Bluetooth. Blocks until the connection is established or fails.
+		uuid (String) The UUID passed here must match the UUID used by the server device. (default=457807c0-4897-11df-9879-0800200c9a66)
+		address (String) The user will be presented with a list of discovered devices to choose from if an address is not provided. (optional)
+	returns: (String) True if the connection was established successfully.
+	'''
+	return self._rpc("bluetoothConnect",uuid,address)
+
+def bluetoothGetConnectedDeviceName(self,connID=None):
+	'''
+	bluetoothGetConnectedDeviceName(connID=None)
+	Returns the name of the connected device.
+		connID (String) Connection id (optional) (default=)
+	'''
+	return self._rpc("bluetoothGetConnectedDeviceName",connID)
+
+def bluetoothGetLocalName(self):
+	'''
+	bluetoothGetLocalName(self)
+	Gets the Bluetooth Visible device name
+	'''
+	return self._rpc("bluetoothGetLocalName")
+
+def bluetoothGetRemoteDeviceName(self,address):
+	'''
+	bluetoothGetRemoteDeviceName(address)
+	Queries a remote device for it\'s name or null if it can\'t be resolved
+		address (String) Bluetooth Address For Target Device
+	'''
+	return self._rpc("bluetoothGetRemoteDeviceName",address)
+
+def bluetoothGetScanMode(self):
+	'''
+	bluetoothGetScanMode(self)
+	Gets the scan mode for the local dongle.\rReturn values:\r\t-1 when Bluetooth is disabled.\r\t0 if non discoverable and non connectable.\r\r1 connectable non discoverable.\r3 connectable and discoverable.
+	'''
+	return self._rpc("bluetoothGetScanMode")
+
+def bluetoothMakeDiscoverable(self,duration=300):
+	'''
+	bluetoothMakeDiscoverable(duration=300)
+	Requests that the device be discoverable for Bluetooth connections.
+		duration (Integer) period of time, in seconds, during which the device should be discoverable (default=300)
+	'''
+	return self._rpc("bluetoothMakeDiscoverable",duration)
+
+def bluetoothRead(self,bufferSize=4096,connID=None):
+	'''
+	bluetoothRead(bufferSize=4096,connID=None)
+	Read up to bufferSize ASCII characters.
+		bufferSize (Integer)  (default=4096)
+		connID (String) Connection id (optional) (default=)
+	'''
+	return self._rpc("bluetoothRead",bufferSize,connID)
+
+def bluetoothReadBinary(self,bufferSize=4096,connID=None):
+	'''
+	bluetoothReadBinary(bufferSize=4096,connID=None)
+	Read up to bufferSize bytes and return a chunked, base64 encoded string.
+		bufferSize (Integer)  (default=4096)
+		connID (String) Connection id (optional) (default=)
+	'''
+	return self._rpc("bluetoothReadBinary",bufferSize,connID)
+
+def bluetoothReadLine(self,connID=None):
+	'''
+	bluetoothReadLine(connID=None)
+	Read the next line.
+		connID (String) Connection id (optional) (default=)
+	'''
+	return self._rpc("bluetoothReadLine",connID)
+
+def bluetoothReadReady(self,connID=None):
+	'''
+	bluetoothReadReady(connID=None)
+	Returns True if the next read is guaranteed not to block.
+		connID (String) Connection id (optional) (default=)
+	'''
+	return self._rpc("bluetoothReadReady",connID)
+
+def bluetoothSetLocalName(self,name):
+	'''
+	bluetoothSetLocalName(name)
+	Sets the Bluetooth Visible device name, returns True on success
+		name (String) New local name
+	'''
+	return self._rpc("bluetoothSetLocalName",name)
+
+def bluetoothStop(self,connID=None):
+	'''
+	bluetoothStop(connID=None)
+	Stops Bluetooth connection.
+		connID (String) Connection id (optional) (default=)
+	'''
+	return self._rpc("bluetoothStop",connID)
+
+def bluetoothWrite(self,ascii,connID=""):
+	'''
+	bluetoothWrite(ascii,connID="")
+	Sends ASCII characters over the currently open Bluetooth connection.
+		ascii (String)
+		connID (String) Connection id (default=)
+	'''
+	return self._rpc("bluetoothWrite",ascii,connID)
+
+def bluetoothWriteBinary(self,base64,connID=None):
+	'''
+	bluetoothWriteBinary(base64,connID=None)
+	Send bytes over the currently open Bluetooth connection.
+		base64 (String) A base64 encoded String of the bytes to be sent.
+		connID (String) Connection id (optional) (default=)
+	'''
+	return self._rpc("bluetoothWriteBinary",base64,connID)
+
+def checkBluetoothState(self):
+	'''
+	checkBluetoothState(self)
+	Checks Bluetooth state.
+	returns: (Boolean) True if Bluetooth is enabled.
+	'''
+	return self._rpc("checkBluetoothState")
+
+def toggleBluetoothState(self,enabled=None,prompt=True):
+	'''
+	toggleBluetoothState(enabled=None,prompt=True)
+	Toggle Bluetooth on and off.
+		enabled (Boolean)  (optional)
+		prompt (Boolean) Prompt the user to confirm changing the Bluetooth state. (default=true)
+	returns: (Boolean) True if Bluetooth is enabled.
+	'''
+	return self._rpc("toggleBluetoothState",enabled,prompt)
+
+__all__ = [
+	"bluetoothAccept",
+	"bluetoothActiveConnections",
+	"bluetoothConnect",
+	"bluetoothGetConnectedDeviceName",
+	"bluetoothGetLocalName",
+	"bluetoothGetRemoteDeviceName",
+	"bluetoothGetScanMode",
+	"bluetoothMakeDiscoverable",
+	"bluetoothRead",
+	"bluetoothReadBinary",
+	"bluetoothReadLine",
+	"bluetoothReadReady",
+	"bluetoothSetLocalName",
+	"bluetoothStop",
+	"bluetoothWrite",
+	"bluetoothWriteBinary",
+	"checkBluetoothState",
+	"toggleBluetoothState",
+]
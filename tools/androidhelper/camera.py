@@ -0,0 +1,31 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/camera.py
+#
+# Purpose:      CameraFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from CameraFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def cameraCapturePicture(self,targetPath,useAutoFocus=True):
+	'''
+	cameraCapturePicture(targetPath,useAutoFocus=True)
+	Take a picture and save it to the specified path.
+		targetPath (String)
+		useAutoFocus (Boolean)  (default=true)
+	returns: (Bundle) A map of Booleans autoFocus and takePicture where True indicates success.
+	'''
+	return self._rpc("cameraCapturePicture",targetPath,useAutoFocus)
+
+def cameraInteractiveCapturePicture(self,targetPath):
+	'''
+	cameraInteractiveCapturePicture(targetPath)
+	Starts the image capture application to take a picture and saves it to the specified path.
+		targetPath (String)
+	'''
+	return self._rpc("cameraInteractiveCapturePicture",targetPath)
+
+__all__ = [
+	"cameraCapturePicture",
+	"cameraInteractiveCapturePicture",
+]
@@ -0,0 +1,76 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/commonintents.py
+#
+# Purpose:      CommonIntentsFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from CommonIntentsFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def pick(self,uri):
+	'''
+	pick(uri)
+	Display content to be picked by URI (e.g. contacts)
+		uri (String)
+	returns: (Intent) A map of result values.
+	'''
+	return self._rpc("pick",uri)
+
+def scanBarcode(self):
+	'''
+	scanBarcode(self)
+	Starts the barcode scanner.
+	returns: (Intent) A Map representation of the result Intent.
+	'''
+	return self._rpc("scanBarcode")
+
+def search(self,query):
+	'''
+	search(query)
+	Starts a search for the given query.
+		query (String)
+	'''
+	return self._rpc("search",query)
+
+def view(self,uri,type=None,extras=None):
+	'''
+	view(uri,type=None,extras=None)
+	Start activity with view action by URI (i.e. browser, contacts, etc.).
+		uri (String)
+		type (String) MIME type/subtype of the URI (optional)
+		extras (JSONObject) a Map of extras to add to the Intent (optional)
+	'''
+	return self._rpc("view",uri,type,extras)
+
+def viewContacts(self):
+	'''
+	viewContacts(self)
+	Opens the list of contacts.
+	'''
+	return self._rpc("viewContacts")
+
+def viewHtml(self,path):
+	'''
+	viewHtml(path)
+	Opens the browser to display a local HTML file.
+		path (String) the path to the HTML file
+	'''
+	return self._rpc("viewHtml",path)
+
+def viewMap(self,query):
+	'''
+	viewMap(query,_e.g._pizza,_123_My_Street)
+	Opens a map search for query (e.g. pizza, 123 My Street).
+		query, e.g. pizza, 123 My Street (String)
+	'''
+	return self._rpc("viewMap",query)
+
+__all__ = [
+	"pick",
+	"scanBarcode",
+	"search",
+	"view",
+	"viewContacts",
+	"viewHtml",
+	"viewMap",
+]
@@ -0,0 +1,98 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/contacts.py
+#
+# Purpose:      ContactsFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from ContactsFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def contactsGet(self,attributes=None):
+	'''
+	contactsGet(attributes=None)
+	Returns a List of all contacts.
+		attributes (JSONArray)  (optional)
+	returns: (List) a List of contacts as Maps
+	'''
+	return self._rpc("contactsGet",attributes)
+
+def contactsGetAttributes(self):
+	'''
+	contactsGetAttributes(self)
+	Returns a List of all possible attributes for contacts.
+	'''
+	return self._rpc("contactsGetAttributes")
+
+def contactsGetById(self,id,attributes=None):
+	'''
+	contactsGetById(id,attributes=None)
+	Returns contacts by ID.
+		id (Integer)
+		attributes (JSONArray)  (optional)
+	'''
+	return self._rpc("contactsGetById",id,attributes)
+
+def contactsGetCount(self):
+	'''
+	contactsGetCount(self)
+	Returns the number of contacts.
+	'''
+	return self._rpc("contactsGetCount")
+
+def contactsGetIds(self):
+	'''
+	contactsGetIds(self)
+	Returns a List of all contact IDs.
+	'''
+	return self._rpc("contactsGetIds")
+
+def pickContact(self):
+	'''
+	pickContact(self)
+	Displays a list of contacts to pick from.
+	returns: (Intent) A map of result values.
+	'''
+	return self._rpc("pickContact")
+
+def pickPhone(self):
+	'''
+	pickPhone(self)
+	Displays a list of phone numbers to pick from.
+	returns: (String) The selected phone number.
+	'''
+	return self._rpc("pickPhone")
+
+def queryAttributes(self,uri):
+	'''
+	queryAttributes(uri)
+	Content Resolver Query Attributes
+		uri (String) The URI, using the content:// scheme, for the content to retrieve.
+	returns: (JSONArray) a list of available columns for a given content uri
+	'''
+	return self._rpc("queryAttributes",uri)
+
+def queryContent(self,uri,attributes=None,selection=None,selectionArgs=None,order=None):
+	'''
+	queryContent(uri,attributes=None,selection=None,selectionArgs=None,order=None)
+	Content Resolver Query
+		uri (String) The URI, using the content:// scheme, for the content to retrieve.
+		attributes (JSONArray) A list of which columns to return. Passing null will return all columns (optional)
+		selection (String) A filter declaring which rows to return (optional)
+		selectionArgs (JSONArray) You may include ?s in selection, which will be replaced by the values from selectionArgs (optional)
+		order (String) How to order the rows (optional)
+	returns: (List) result of query as Maps
+	Exactly as per ContentResolver.query
+	'''
+	return self._rpc("queryContent",uri,attributes,selection,selectionArgs,order)
+
+__all__ = [
+	"contactsGet",
+	"contactsGetAttributes",
+	"contactsGetById",
+	"contactsGetCount",
+	"contactsGetIds",
+	"pickContact",
+	"pickPhone",
+	"queryAttributes",
+	"queryContent",
+]
@@ -0,0 +1,164 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/event.py
+#
+# Purpose:      EventFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from EventFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def eventClearBuffer(self):
+	'''
+	eventClearBuffer(self)
+	Clears all events from the event buffer.
+	Example (python): droid.eventClearBuffer()
+	'''
+	return self._rpc("eventClearBuffer")
+
+def eventGetBrodcastCategories(self):
+	'''
+	eventGetBrodcastCategories(self)
+	Lists all the broadcast signals we are listening for
+	'''
+	return self._rpc("eventGetBrodcastCategories")
+
+def eventPoll(self,number_of_events=1):
+	'''
+	eventPoll(number_of_events=1)
+	Returns and removes the oldest n events (i.e. location or sensor update, etc.) from the event buffer.
+		number_of_events (Integer)  (default=1)
+	returns: (List) A List of Maps of event properties.
+	Actual data returned in the map will depend on the type of event.
+	Example (python):
+	import android, time
+	droid = android.Android()
+	droid.startSensing()
+	time.sleep(1)
+	droid.eventClearBuffer()
+	time.sleep(1)
+	e = eventPoll(1).result
+	event_entry_number = 0
+	x = e[event_entry_ number]['data']['xforce']
+	e has the format:
+	[{u'data': {u'accuracy': 0, u'pitch': -0.48766891956329345, u'xmag': -5.6875, u'azimuth':
+	0.3312483489513397, u'zforce': 8.3492730000000002, u'yforce': 4.5628165999999997, u'time':
+	1297072704.813, u'ymag': -11.125, u'zmag': -42.375, u'roll': -0.059393649548292161, u'xforce':
+	0.42223078000000003}, u'name': u'sensors', u'time': 1297072704813000L}]
+	x has the string value of the x force data (0.42223078000000003) at the time of the event
+	entry.
+	'''
+	return self._rpc("eventPoll",number_of_events)
+
+def eventPost(self,name,data,enqueue=None):
+	'''
+	eventPost(name,data,enqueue=None)
+	Post an event to the event queue.
+		name (String) Name of event
+		data (String) Data contained in event.
+		enqueue (Boolean) Set to False if you don\'t want your events to be added to the event queue, just dispatched. (optional) (default=false)
+	Example:
+	import android
+	from datetime import datetime
+	droid = android.Android()
+	t = datetime.now()
+	droid.eventPost('Some Event', t)
+	'''
+	return self._rpc("eventPost",name,data,enqueue)
+
+def eventRegisterForBroadcast(self,category,enqueue=True):
+	'''
+	eventRegisterForBroadcast(category,enqueue=True)
+	Registers a listener for a new broadcast signal
+		category (String)
+		enqueue (Boolean) Should this events be added to the event queue or only dispatched (default=true)
+	Registers a listener for a new broadcast signal
+	'''
+	return self._rpc("eventRegisterForBroadcast",category,enqueue)
+
+def eventUnregisterForBroadcast(self,category):
+	'''
+	eventUnregisterForBroadcast(category)
+	Stop listening for a broadcast signal
+		category (String)
+	'''
+	return self._rpc("eventUnregisterForBroadcast",category)
+
+def eventWait(self,timeout=None):
+	'''
+	eventWait(timeout=None)
+	Blocks until an event occurs. The returned event is removed from the buffer.
+		timeout (Integer) the maximum time to wait (optional)
+	returns: (Event) Map of event properties.
+	'''
+	return self._rpc("eventWait",timeout)
+
+def eventWaitFor(self,eventName,timeout=None):
+	'''
+	eventWaitFor(eventName,timeout=None)
+	Blocks until an event with the supplied name occurs. The returned event is not removed from the buffer.
+		eventName (String)
+		timeout (Integer) the maximum time to wait (in ms) (optional)
+	returns: (Event) Map of event properties.
+	'''
+	return self._rpc("eventWaitFor",eventName,timeout)
+
+def receiveEvent(self):
+	'''
+	receiveEvent(self)
+	Returns and removes the oldest event (i.e. location or sensor update, etc.) from the event buffer.
+	returns: (Event) Map of event properties.
+	Deprecated in r4. Use eventPoll instead.
+	'''
+	return self._rpc("receiveEvent")
+
+def rpcPostEvent(self,name,data):
+	'''
+	rpcPostEvent(name,data)
+	Post an event to the event queue.
+		name (String)
+		data (String)
+	Deprecated in r4. Use eventPost instead.
+	'''
+	return self._rpc("rpcPostEvent",name,data)
+
+def startEventDispatcher(self,port=None):
+	'''
+	startEventDispatcher(port=None)
+	Opens up a socket where you can read for events posted
+		port (Integer) Port to use (optional) (default=0)
+	'''
+	return self._rpc("startEventDispatcher",port)
+
+def stopEventDispatcher(self):
+	'''
+	stopEventDispatcher(self)
+	Stops the event server, you can\'t read in the port anymore
+	'''
+	return self._rpc("stopEventDispatcher")
+
+def waitForEvent(self,eventName,timeout=None):
+	'''
+	waitForEvent(eventName,timeout=None)
+	Blocks until an event with the supplied name occurs. The returned event is not removed from the buffer.
+		eventName (String)
+		timeout (Integer) the maximum time to wait (optional)
+	returns: (Event) Map of event properties.
+	Deprecated in r4. Use eventWaitFor instead.
+	'''
+	return self._rpc("waitForEvent",eventName,timeout)
+
+__all__ = [
+	"eventClearBuffer",
+	"eventGetBrodcastCategories",
+	"eventPoll",
+	"eventPost",
+	"eventRegisterForBroadcast",
+	"eventUnregisterForBroadcast",
+	"eventWait",
+	"eventWaitFor",
+	"receiveEvent",
+	"rpcPostEvent",
+	"startEventDispatcher",
+	"stopEventDispatcher",
+	"waitForEvent",
+]
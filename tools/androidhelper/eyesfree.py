@@ -0,0 +1,20 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/eyesfree.py
+#
+# Purpose:      EyesFreeFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from EyesFreeFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def ttsSpeak(self,message):
+	'''
+	ttsSpeak(message)
+	Speaks the provided message via TTS.
+		message (String)
+	'''
+	return self._rpc("ttsSpeak",message)
+
+__all__ = [
+	"ttsSpeak",
+]
@@ -0,0 +1,59 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/location.py
+#
+# Purpose:      LocationFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from LocationFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def geocode(self,latitude,longitude,maxResults=1):
+	'''
+	geocode(latitude,longitude,maxResults=1)
+	Returns a list of addresses for the given latitude and longitude.
+		latitude (Double)
+		longitude (Double)
+		maxResults (Integer) maximum number of results (default=1)
+	returns: (List) A list of addresses.
+	'''
+	return self._rpc("geocode",latitude,longitude,maxResults)
+
+def getLastKnownLocation(self):
+	'''
+	getLastKnownLocation(self)
+	Returns the last known location of the device.
+	returns: (Map) A map of location information by provider.
+	'''
+	return self._rpc("getLastKnownLocation")
+
+def readLocation(self):
+	'''
+	readLocation(self)
+	Returns the current location as indicated by all available providers.
+	returns: (Map) A map of location information by provider.
+	'''
+	return self._rpc("readLocation")
+
+def startLocating(self,minDistance=60000,minUpdateDistance=30):
+	'''
+	startLocating(minDistance=60000,minUpdateDistance=30)
+	Starts collecting location data.
+		minDistance (Integer) minimum time between updates in milliseconds (default=60000)
+		minUpdateDistance (Integer) minimum distance between updates in meters (default=30)
+	'''
+	return self._rpc("startLocating",minDistance,minUpdateDistance)
+
+def stopLocating(self):
+	'''
+	stopLocating(self)
+	Stops collecting location data.
+	'''
+	return self._rpc("stopLocating")
+
+__all__ = [
+	"geocode",
+	"getLastKnownLocation",
+	"readLocation",
+	"startLocating",
+	"stopLocating",
+]
@@ -0,0 +1,104 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/mediaplayer.py
+#
+# Purpose:      MediaPlayerFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from MediaPlayerFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def mediaIsPlaying(self,tag="default"):
+	'''
+	mediaIsPlaying(tag="default")
+	Checks if media file is playing.
+		tag (String) string identifying resource (default=default)
+	returns: (boolean) true if playing
+	'''
+	return self._rpc("mediaIsPlaying",tag)
+
+def mediaPlay(self,url,tag="default",play=True):
+	'''
+	mediaPlay(url,tag="default",play=True)
+	Open a media file
+		url (String) url of media resource
+		tag (String) string identifying resource (default=default)
+		play (Boolean) start playing immediately (default=true)
+	returns: (boolean) true if play successful
+	'''
+	return self._rpc("mediaPlay",url,tag,play)
+
+def mediaPlayClose(self,tag="default"):
+	'''
+	mediaPlayClose(tag="default")
+	Close media file
+		tag (String) string identifying resource (default=default)
+	returns: (boolean) true if successful
+	'''
+	return self._rpc("mediaPlayClose",tag)
+
+def mediaPlayInfo(self,tag="default"):
+	'''
+	mediaPlayInfo(tag="default")
+	Information on current media
+		tag (String) string identifying resource (default=default)
+	returns: (Map) Media Information
+	'''
+	return self._rpc("mediaPlayInfo",tag)
+
+def mediaPlayList(self):
+	'''
+	mediaPlayList(self)
+	Lists currently loaded media
+	returns: (Set) List of Media Tags
+	'''
+	return self._rpc("mediaPlayList")
+
+def mediaPlayPause(self,tag="default"):
+	'''
+	mediaPlayPause(tag="default")
+	pause playing media file
+		tag (String) string identifying resource (default=default)
+	returns: (boolean) true if successful
+	'''
+	return self._rpc("mediaPlayPause",tag)
+
+def mediaPlaySeek(self,msec,tag="default"):
+	'''
+	mediaPlaySeek(msec,tag="default")
+	Seek To Position
+		msec (Integer) Position in millseconds
+		tag (String) string identifying resource (default=default)
+	returns: (int) New Position (in ms)
+	'''
+	return self._rpc("mediaPlaySeek",msec,tag)
+
+def mediaPlaySetLooping(self,enabled=True,tag="default"):
+	'''
+	mediaPlaySetLooping(enabled=True,tag="default")
+	Set Looping
+		enabled (Boolean)  (default=true)
+		tag (String) string identifying resource (default=default)
+	returns: (boolean) True if successful
+	'''
+	return self._rpc("mediaPlaySetLooping",enabled,tag)
+
+def mediaPlayStart(self,tag="default"):
+	'''
+	mediaPlayStart(tag="default")
+	start playing media file
+		tag (String) string identifying resource (default=default)
+	returns: (boolean) true if successful
+	'''
+	return self._rpc("mediaPlayStart",tag)
+
+__all__ = [
+	"mediaIsPlaying",
+	"mediaPlay",
+	"mediaPlayClose",
+	"mediaPlayInfo",
+	"mediaPlayList",
+	"mediaPlayPause",
+	"mediaPlaySeek",
+	"mediaPlaySetLooping",
+	"mediaPlayStart",
+]
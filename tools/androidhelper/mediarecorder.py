@@ -0,0 +1,59 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/mediarecorder.py
+#
+# Purpose:      MediaRecorderFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from MediaRecorderFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def recorderCaptureVideo(self,targetPath,duration=None,recordAudio=True):
+	'''
+	recorderCaptureVideo(targetPath,duration=None,recordAudio=True)
+	Records video (and optionally audio) from the camera and saves it to the given location. Duration specifies the maximum duration of the recording session. If duration is not provided this method will return immediately and the recording will only be stopped when recorderStop is called or when a scripts exits. Otherwise it will block for the time period equal to the duration argument.
+		targetPath (String)
+		duration (Integer)  (optional)
+		recordAudio (Boolean)  (default=true)
+	'''
+	return self._rpc("recorderCaptureVideo",targetPath,duration,recordAudio)
+
+def recorderStartMicrophone(self,targetPath):
+	'''
+	recorderStartMicrophone(targetPath)
+	Records audio from the microphone and saves it to the given location.
+		targetPath (String)
+	'''
+	return self._rpc("recorderStartMicrophone",targetPath)
+
+def recorderStartVideo(self,targetPath,duration=0,videoSize=1):
+	'''
+	recorderStartVideo(targetPath,duration=0,videoSize=1)
+	Records video from the camera and saves it to the given location. Duration specifies the maximum duration of the recording session. If duration is 0 this method will return and the recording will only be stopped when recorderStop is called or when a scripts exits. Otherwise it will block for the time period equal to the duration argument.videoSize: 0=160x120, 1=320x240, 2=352x288, 3=640x480, 4=800x480.
+		targetPath (String)
+		duration (Integer)  (default=0)
+		videoSize (Integer)  (default=1)
+	'''
+	return self._rpc("recorderStartVideo",targetPath,duration,videoSize)
+
+def recorderStop(self):
+	'''
+	recorderStop(self)
+	Stops a previously started recording.
+	'''
+	return self._rpc("recorderStop")
+
+def startInteractiveVideoRecording(self,path):
+	'''
+	startInteractiveVideoRecording(path)
+	Starts the video capture application to record a video and saves it to the specified path.
+		path (String)
+	'''
+	return self._rpc("startInteractiveVideoRecording",path)
+
+__all__ = [
+	"recorderCaptureVideo",
+	"recorderStartMicrophone",
+	"recorderStartVideo",
+	"recorderStop",
+	"startInteractiveVideoRecording",
+]
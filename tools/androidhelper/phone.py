@@ -0,0 +1,216 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/phone.py
+#
+# Purpose:      PhoneFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from PhoneFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def checkNetworkRoaming(self):
+	'''
+	checkNetworkRoaming(self)
+	Returns true if the device is considered roaming on the current network, for GSM purposes.
+	'''
+	return self._rpc("checkNetworkRoaming")
+
+def getCellLocation(self):
+	'''
+	getCellLocation(self)
+	Returns the current cell location.
+	'''
+	return self._rpc("getCellLocation")
+
+def getDeviceId(self):
+	'''
+	getDeviceId(self)
+	Returns the unique device ID, for example, the IMEI for GSM and the MEID for CDMA phones. Return null if device ID is not available.
+	'''
+	return self._rpc("getDeviceId")
+
+def getDeviceSoftwareVersion(self):
+	'''
+	getDeviceSoftwareVersion(self)
+	Returns the software version number for the device, for example, the IMEI/SV for GSM phones. Return null if the software version is not available.
+	'''
+	return self._rpc("getDeviceSoftwareVersion")
+
+def getLine1Number(self):
+	'''
+	getLine1Number(self)
+	Returns the phone number string for line 1, for example, the MSISDN for a GSM phone. Return null if it is unavailable.
+	'''
+	return self._rpc("getLine1Number")
+
+def getNeighboringCellInfo(self):
+	'''
+	getNeighboringCellInfo(self)
+	Returns the neighboring cell information of the device.
+	'''
+	return self._rpc("getNeighboringCellInfo")
+
+def getNetworkOperator(self):
+	'''
+	getNetworkOperator(self)
+	Returns the numeric name (MCC+MNC) of current registered operator.
+	'''
+	return self._rpc("getNetworkOperator")
+
+def getNetworkOperatorName(self):
+	'''
+	getNetworkOperatorName(self)
+	Returns the alphabetic name of current registered operator.
+	'''
+	return self._rpc("getNetworkOperatorName")
+
+def getNetworkType(self):
+	'''
+	getNetworkType(self)
+	Returns a the radio technology (network type) currently in use on the device.
+	'''
+	return self._rpc("getNetworkType")
+
+def getPhoneType(self):
+	'''
+	getPhoneType(self)
+	Returns the device phone type.
+	'''
+	return self._rpc("getPhoneType")
+
+def getSimCountryIso(self):
+	'''
+	getSimCountryIso(self)
+	Returns the ISO country code equivalent for the SIM provider\'s country code.
+	'''
+	return self._rpc("getSimCountryIso")
+
+def getSimOperator(self):
+	'''
+	getSimOperator(self)
+	Returns the MCC+MNC (mobile country code + mobile network code) of the provider of the SIM. 5 or 6 decimal digits.
+	'''
+	return self._rpc("getSimOperator")
+
+def getSimOperatorName(self):
+	'''
+	getSimOperatorName(self)
+	Returns the Service Provider Name (SPN).
+	'''
+	return self._rpc("getSimOperatorName")
+
+def getSimSerialNumber(self):
+	'''
+	getSimSerialNumber(self)
+	Returns the serial number of the SIM, if applicable. Return null if it is unavailable.
+	'''
+	return self._rpc("getSimSerialNumber")
+
+def getSimState(self):
+	'''
+	getSimState(self)
+	Returns the state of the device SIM card.
+	'''
+	return self._rpc("getSimState")
+
+def getSubscriberId(self):
+	'''
+	getSubscriberId(self)
+	Returns the unique subscriber ID, for example, the IMSI for a GSM phone. Return null if it is unavailable.
+	'''
+	return self._rpc("getSubscriberId")
+
+def getVoiceMailAlphaTag(self):
+	'''
+	getVoiceMailAlphaTag(self)
+	Retrieves the alphabetic identifier associated with the voice mail number.
+	'''
+	return self._rpc("getVoiceMailAlphaTag")
+
+def getVoiceMailNumber(self):
+	'''
+	getVoiceMailNumber(self)
+	Returns the voice mail number. Return null if it is unavailable.
+	'''
+	return self._rpc("getVoiceMailNumber")
+
+def phoneCall(self,uri):
+	'''
+	phoneCall(uri)
+	Calls a contact/phone number by URI.
+		uri (String)
+	'''
+	return self._rpc("phoneCall",uri)
+
+def phoneCallNumber(self,phone_number):
+	'''
+	phoneCallNumber(phone_number)
+	Calls a phone number.
+		phone number (String)
+	'''
+	return self._rpc("phoneCallNumber",phone_number)
+
+def phoneDial(self,uri):
+	'''
+	phoneDial(uri)
+	Dials a contact/phone number by URI.
+		uri (String)
+	'''
+	return self._rpc("phoneDial",uri)
+
+def phoneDialNumber(self,phone_number):
+	'''
+	phoneDialNumber(phone_number)
+	Dials a phone number.
+		phone number (String)
+	'''
+	return self._rpc("phoneDialNumber",phone_number)
+
+def readPhoneState(self):
+	'''
+	readPhoneState(self)
+	Returns the current phone state and incoming number.
+	returns: (Bundle) A Map of \"state\" and \"incomingNumber\"
+	'''
+	return self._rpc("readPhoneState")
+
+def startTrackingPhoneState(self):
+	'''
+	startTrackingPhoneState(self)
+	Starts tracking phone state.
+	'''
+	return self._rpc("startTrackingPhoneState")
+
+def stopTrackingPhoneState(self):
+	'''
+	stopTrackingPhoneState(self)
+	Stops tracking phone state.
+	'''
+	return self._rpc("stopTrackingPhoneState")
+
+__all__ = [
+	"checkNetworkRoaming",
+	"getCellLocation",
+	"getDeviceId",
+	"getDeviceSoftwareVersion",
+	"getLine1Number",
+	"getNeighboringCellInfo",
+	"getNetworkOperator",
+	"getNetworkOperatorName",
+	"getNetworkType",
+	"getPhoneType",
+	"getSimCountryIso",
+	"getSimOperator",
+	"getSimOperatorName",
+	"getSimSerialNumber",
+	"getSimState",
+	"getSubscriberId",
+	"getVoiceMailAlphaTag",
+	"getVoiceMailNumber",
+	"phoneCall",
+	"phoneCallNumber",
+	"phoneDial",
+	"phoneDialNumber",
+	"readPhoneState",
+	"startTrackingPhoneState",
+	"stopTrackingPhoneState",
+]
@@ -0,0 +1,42 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/preferences.py
+#
+# Purpose:      PreferencesFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from PreferencesFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def prefGetAll(self,filename=None):
+	'''
+	prefGetAll(filename=None)
+	Get list of Shared Preference Values
+		filename (String) Desired preferences file. If not defined, uses the default Shared Preferences. (optional)
+	returns: (Map) Map of key,value
+	'''
+	return self._rpc("prefGetAll",filename)
+
+def prefGetValue(self,key,filename=None):
+	'''
+	prefGetValue(key,filename=None)
+	Read a value from shared preferences
+		key (String)
+		filename (String) Desired preferences file. If not defined, uses the default Shared Preferences. (optional)
+	'''
+	return self._rpc("prefGetValue",key,filename)
+
+def prefPutValue(self,key,value,filename=None):
+	'''
+	prefPutValue(key,value,filename=None)
+	Write a value to shared preferences
+		key (String)
+		value (Object)
+		filename (String) Desired preferences file. If not defined, uses the default Shared Preferences. (optional)
+	'''
+	return self._rpc("prefPutValue",key,value,filename)
+
+__all__ = [
+	"prefGetAll",
+	"prefGetValue",
+	"prefPutValue",
+]
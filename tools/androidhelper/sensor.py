@@ -0,0 +1,101 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/sensor.py
+#
+# Purpose:      SensorManagerFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from SensorManagerFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def readSensors(self):
+	'''
+	readSensors(self)
+	Returns the most recently recorded sensor data.
+	'''
+	return self._rpc("readSensors")
+
+def sensorsGetAccuracy(self):
+	'''
+	sensorsGetAccuracy(self)
+	Returns the most recently received accuracy value.
+	'''
+	return self._rpc("sensorsGetAccuracy")
+
+def sensorsGetLight(self):
+	'''
+	sensorsGetLight(self)
+	Returns the most recently received light value.
+	'''
+	return self._rpc("sensorsGetLight")
+
+def sensorsReadAccelerometer(self):
+	'''
+	sensorsReadAccelerometer(self)
+	Returns the most recently received accelerometer values.
+	returns: (List) a List of Floats [(acceleration on the) X axis, Y axis, Z axis].
+	'''
+	return self._rpc("sensorsReadAccelerometer")
+
+def sensorsReadMagnetometer(self):
+	'''
+	sensorsReadMagnetometer(self)
+	Returns the most recently received magnetic field values.
+	returns: (List) a List of Floats [(magnetic field value for) X axis, Y axis, Z axis].
+	'''
+	return self._rpc("sensorsReadMagnetometer")
+
+def sensorsReadOrientation(self):
+	'''
+	sensorsReadOrientation(self)
+	Returns the most recently received orientation values.
+	returns: (List) a List of Doubles [azimuth, pitch, roll].
+	'''
+	return self._rpc("sensorsReadOrientation")
+
+def startSensing(self,sampleSize=5):
+	'''
+	startSensing(sampleSize=5)
+	Starts recording sensor data to be available for polling.
+		sampleSize (Integer) number of samples for calculating average readings (default=5)
+	Deprecated in 4. Use startSensingTimed or startSensingThreshhold instead.
+	'''
+	return self._rpc("startSensing",sampleSize)
+
+def startSensingThreshold(self,sensorNumber,threshold,axis):
+	'''
+	startSensingThreshold(sensorNumber,threshold,axis)
+	Records to the Event Queue sensor data exceeding a chosen threshold.
+		sensorNumber (Integer) 1 = Orientation, 2 = Accelerometer, 3 = Magnetometer and 4 = Light
+		threshold (Integer) Threshold level for chosen sensor (integer)
+		axis (Integer) 0 = No axis, 1 = X, 2 = Y, 3 = X+Y, 4 = Z, 5= X+Z, 6 = Y+Z, 7 = X+Y+Z
+	'''
+	return self._rpc("startSensingThreshold",sensorNumber,threshold,axis)
+
+def startSensingTimed(self,sensorNumber,delayTime):
+	'''
+	startSensingTimed(sensorNumber,delayTime)
+	Starts recording sensor data to be available for polling.
+		sensorNumber (Integer) 1 = All, 2 = Accelerometer, 3 = Magnetometer and 4 = Light
+		delayTime (Integer) Minimum time between readings in milliseconds
+	'''
+	return self._rpc("startSensingTimed",sensorNumber,delayTime)
+
+def stopSensing(self):
+	'''
+	stopSensing(self)
+	Stops collecting sensor data.
+	'''
+	return self._rpc("stopSensing")
+
+__all__ = [
+	"readSensors",
+	"sensorsGetAccuracy",
+	"sensorsGetLight",
+	"sensorsReadAccelerometer",
+	"sensorsReadMagnetometer",
+	"sensorsReadOrientation",
+	"startSensing",
+	"startSensingThreshold",
+	"startSensingTimed",
+	"stopSensing",
+]
@@ -0,0 +1,167 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/settings.py
+#
+# Purpose:      SettingsFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from SettingsFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def checkAirplaneMode(self):
+	'''
+	checkAirplaneMode(self)
+	Checks the airplane mode setting.
+	returns: (Boolean) True if airplane mode is enabled.
+	'''
+	return self._rpc("checkAirplaneMode")
+
+def checkRingerSilentMode(self):
+	'''
+	checkRingerSilentMode(self)
+	Checks the ringer silent mode setting.
+	returns: (Boolean) True if ringer silent mode is enabled.
+	'''
+	return self._rpc("checkRingerSilentMode")
+
+def checkScreenOn(self):
+	'''
+	checkScreenOn(self)
+	Checks if the screen is on or off (requires API level 7).
+	returns: (Boolean) True if the screen is currently on.
+	'''
+	return self._rpc("checkScreenOn")
+
+def getMaxMediaVolume(self):
+	'''
+	getMaxMediaVolume(self)
+	Returns the maximum media volume.
+	'''
+	return self._rpc("getMaxMediaVolume")
+
+def getMaxRingerVolume(self):
+	'''
+	getMaxRingerVolume(self)
+	Returns the maximum ringer volume.
+	'''
+	return self._rpc("getMaxRingerVolume")
+
+def getMediaVolume(self):
+	'''
+	getMediaVolume(self)
+	Returns the current media volume.
+	'''
+	return self._rpc("getMediaVolume")
+
+def getRingerVolume(self):
+	'''
+	getRingerVolume(self)
+	Returns the current ringer volume.
+	'''
+	return self._rpc("getRingerVolume")
+
+def getScreenBrightness(self):
+	'''
+	getScreenBrightness(self)
+	Returns the screen backlight brightness.
+	returns: (Integer) the current screen brightness between 0 and 255
+	'''
+	return self._rpc("getScreenBrightness")
+
+def getScreenTimeout(self):
+	'''
+	getScreenTimeout(self)
+	Returns the current screen timeout in seconds.
+	returns: (Integer) the current screen timeout in seconds.
+	'''
+	return self._rpc("getScreenTimeout")
+
+def getVibrateMode(self,ringer=None):
+	'''
+	getVibrateMode(ringer=None)
+	Checks Vibration setting. If ringer=true then query Ringer setting, else query Notification setting
+		ringer (Boolean)  (optional)
+	returns: (Boolean) True if vibrate mode is enabled.
+	'''
+	return self._rpc("getVibrateMode",ringer)
+
+def setMediaVolume(self,volume):
+	'''
+	setMediaVolume(volume)
+	Sets the media volume.
+		volume (Integer)
+	'''
+	return self._rpc("setMediaVolume",volume)
+
+def setRingerVolume(self,volume):
+	'''
+	setRingerVolume(volume)
+	Sets the ringer volume.
+		volume (Integer)
+	'''
+	return self._rpc("setRingerVolume",volume)
+
+def setScreenBrightness(self,value):
+	'''
+	setScreenBrightness(value)
+	Sets the the screen backlight brightness.
+		value (Integer) brightness value between 0 and 255
+	returns: (Integer) the original screen brightness.
+	'''
+	return self._rpc("setScreenBrightness",value)
+
+def setScreenTimeout(self,value):
+	'''
+	setScreenTimeout(value)
+	Sets the screen timeout to this number of seconds.
+		value (Integer)
+	returns: (Integer) The original screen timeout.
+	'''
+	return self._rpc("setScreenTimeout",value)
+
+def toggleAirplaneMode(self,enabled=None):
+	'''
+	toggleAirplaneMode(enabled=None)
+	Toggles airplane mode on and off.
+		enabled (Boolean)  (optional)
+	returns: (Boolean) True if airplane mode is enabled.
+	'''
+	return self._rpc("toggleAirplaneMode",enabled)
+
+def toggleRingerSilentMode(self,enabled=None):
+	'''
+	toggleRingerSilentMode(enabled=None)
+	Toggles ringer silent mode on and off.
+		enabled (Boolean)  (optional)
+	returns: (Boolean) True if ringer silent mode is enabled.
+	'''
+	return self._rpc("toggleRingerSilentMode",enabled)
+
+def toggleVibrateMode(self,enabled=None,ringer=None):
+	'''
+	toggleVibrateMode(enabled=None,ringer=None)
+	Toggles vibrate mode on and off. If ringer=true then set Ringer setting, else set Notification setting
+		enabled (Boolean)  (optional)
+		ringer (Boolean)  (optional)
+	returns: (Boolean) True if vibrate mode is enabled.
+	'''
+	return self._rpc("toggleVibrateMode",enabled,ringer)
+
+__all__ = [
+	"checkAirplaneMode",
+	"checkRingerSilentMode",
+	"checkScreenOn",
+	"getMaxMediaVolume",
+	"getMaxRingerVolume",
+	"getMediaVolume",
+	"getRingerVolume",
+	"getScreenBrightness",
+	"getScreenTimeout",
+	"getVibrateMode",
+	"setMediaVolume",
+	"setRingerVolume",
+	"setScreenBrightness",
+	"setScreenTimeout",
+	"toggleAirplaneMode",
+	"toggleRingerSilentMode",
+	"toggleVibrateMode",
+]
@@ -0,0 +1,36 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/signalstrength.py
+#
+# Purpose:      SignalStrengthFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from SignalStrengthFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def readSignalStrengths(self):
+	'''
+	readSignalStrengths(self)
+	Returns the current signal strengths.
+	returns: (Bundle) A map of \"gsm_signal_strength\"
+	'''
+	return self._rpc("readSignalStrengths")
+
+def startTrackingSignalStrengths(self):
+	'''
+	startTrackingSignalStrengths(self)
+	Starts tracking signal strengths.
+	'''
+	return self._rpc("startTrackingSignalStrengths")
+
+def stopTrackingSignalStrengths(self):
+	'''
+	stopTrackingSignalStrengths(self)
+	Stops tracking signal strength.
+	'''
+	return self._rpc("stopTrackingSignalStrengths")
+
+__all__ = [
+	"readSignalStrengths",
+	"startTrackingSignalStrengths",
+	"stopTrackingSignalStrengths",
+]
@@ -0,0 +1,92 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/sms.py
+#
+# Purpose:      SmsFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from SmsFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def smsDeleteMessage(self,id):
+	'''
+	smsDeleteMessage(id)
+	Deletes a message.
+		id (Integer)
+	returns: (Boolean) True if the message was deleted
+	'''
+	return self._rpc("smsDeleteMessage",id)
+
+def smsGetAttributes(self):
+	'''
+	smsGetAttributes(self)
+	Returns a List of all possible message attributes.
+	'''
+	return self._rpc("smsGetAttributes")
+
+def smsGetMessageById(self,id,attributes=None):
+	'''
+	smsGetMessageById(id,attributes=None)
+	Returns message attributes.
+		id (Integer) message ID
+		attributes (JSONArray)  (optional)
+	'''
+	return self._rpc("smsGetMessageById",id,attributes)
+
+def smsGetMessageCount(self,unreadOnly,folder="inbox"):
+	'''
+	smsGetMessageCount(unreadOnly,folder="inbox")
+	Returns the number of messages.
+		unreadOnly (Boolean)
+		folder (String)  (default=inbox)
+	'''
+	return self._rpc("smsGetMessageCount",unreadOnly,folder)
+
+def smsGetMessageIds(self,unreadOnly,folder="inbox"):
+	'''
+	smsGetMessageIds(unreadOnly,folder="inbox")
+	Returns a List of all message IDs.
+		unreadOnly (Boolean)
+		folder (String)  (default=inbox)
+	'''
+	return self._rpc("smsGetMessageIds",unreadOnly,folder)
+
+def smsGetMessages(self,unreadOnly,folder="inbox",attributes=None):
+	'''
+	smsGetMessages(unreadOnly,folder="inbox",attributes=None)
+	Returns a List of all messages.
+		unreadOnly (Boolean)
+		folder (String)  (default=inbox)
+		attributes (JSONArray)  (optional)
+	returns: (List) a List of messages as Maps
+	'''
+	return self._rpc("smsGetMessages",unreadOnly,folder,attributes)
+
+def smsMarkMessageRead(self,ids,read):
+	'''
+	smsMarkMessageRead(ids,read)
+	Marks messages as read.
+		ids (JSONArray) List of message IDs to mark as read.
+		read (Boolean)
+	returns: (Integer) number of messages marked read
+	'''
+	return self._rpc("smsMarkMessageRead",ids,read)
+
+def smsSend(self,destinationAddress,text):
+	'''
+	smsSend(destinationAddress,text)
+	Sends an SMS.
+		destinationAddress (String) typically a phone number
+		text (String)
+	'''
+	return self._rpc("smsSend",destinationAddress,text)
+
+__all__ = [
+	"smsDeleteMessage",
+	"smsGetAttributes",
+	"smsGetMessageById",
+	"smsGetMessageCount",
+	"smsGetMessageIds",
+	"smsGetMessages",
+	"smsMarkMessageRead",
+	"smsSend",
+]
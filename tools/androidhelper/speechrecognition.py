@@ -0,0 +1,23 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/speechrecognition.py
+#
+# Purpose:      SpeechRecognitionFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from SpeechRecognitionFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def recognizeSpeech(self,prompt=None,language=None,languageModel=None):
+	'''
+	recognizeSpeech(prompt=None,language=None,languageModel=None)
+	Recognizes user\'s speech and returns the most likely result.
+		prompt (String) text prompt to show to the user when asking them to speak (optional)
+		language (String) language override to inform the recognizer that it should expect speech in a language different than the one set in the java.util.Locale.getDefault() (optional)
+		languageModel (String) informs the recognizer which speech model to prefer (see android.speech.RecognizeIntent) (optional)
+	returns: (String) An empty string in case the speech cannot be recongnized.
+	'''
+	return self._rpc("recognizeSpeech",prompt,language,languageModel)
+
+__all__ = [
+	"recognizeSpeech",
+]
@@ -0,0 +1,28 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/texttospeech.py
+#
+# Purpose:      TextToSpeechFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from TextToSpeechFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def ttsIsSpeaking(self):
+	'''
+	ttsIsSpeaking(self)
+	Returns True if speech is currently in progress.
+	'''
+	return self._rpc("ttsIsSpeaking")
+
+def ttsSpeak(self,message):
+	'''
+	ttsSpeak(message)
+	Speaks the provided message via TTS.
+		message (String)
+	'''
+	return self._rpc("ttsSpeak",message)
+
+__all__ = [
+	"ttsIsSpeaking",
+	"ttsSpeak",
+]
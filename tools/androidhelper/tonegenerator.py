@@ -0,0 +1,21 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/tonegenerator.py
+#
+# Purpose:      ToneGeneratorFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from ToneGeneratorFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def generateDtmfTones(self,phoneNumber,toneDuration=100):
+	'''
+	generateDtmfTones(phoneNumber,toneDuration=100)
+	Generate DTMF tones for the given phone number.
+		phoneNumber (String)
+		toneDuration (Integer) duration of each tone in milliseconds (default=100)
+	'''
+	return self._rpc("generateDtmfTones",phoneNumber,toneDuration)
+
+__all__ = [
+	"generateDtmfTones",
+]
@@ -0,0 +1,394 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/ui.py
+#
+# Purpose:      UiFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from UiFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def addContextMenuItem(self,label,event,eventData=None):
+	'''
+	addContextMenuItem(label,event,eventData=None)
+	Adds a new item to context menu.
+		label (String) label for this menu item
+		event (String) event that will be generated on menu item click
+		eventData (Object)  (optional)
+	Context menus are used primarily with webViewShow
+	'''
+	return self._rpc("addContextMenuItem",label,event,eventData)
+
+def addOptionsMenuItem(self,label,event,eventData=None,iconName=None):
+	'''
+	addOptionsMenuItem(label,event,eventData=None,iconName=None)
+	Adds a new item to options menu.
+		label (String) label for this menu item
+		event (String) event that will be generated on menu item click
+		eventData (Object)  (optional)
+		iconName (String) Android system menu icon, see http://developer.android.com/reference/android/R.drawable.html (optional)
+	Example (python)
+	import android
+	droid=android.Android()
+	droid.addOptionsMenuItem("Silly","silly",None,"star_on")
+	droid.addOptionsMenuItem("Sensible","sensible","I bet.","star_off")
+	droid.addOptionsMenuItem("Off","off",None,"ic_menu_revert")
+	print "Hit menu to see extra options."
+	print "Will timeout in 10 seconds if you hit nothing."
+	while True: # Wait for events from the menu.
+	response=droid.eventWait(10000).result
+	if response==None:
+	break
+	print response
+	if response["name"]=="off":
+	break
+	print "And done."
+	'''
+	return self._rpc("addOptionsMenuItem",label,event,eventData,iconName)
+
+def clearContextMenu(self):
+	'''
+	clearContextMenu(self)
+	Removes all items previously added to context menu.
+	'''
+	return self._rpc("clearContextMenu")
+
+def clearOptionsMenu(self):
+	'''
+	clearOptionsMenu(self)
+	Removes all items previously added to options menu.
+	'''
+	return self._rpc("clearOptionsMenu")
+
+def dialogCreateAlert(self,title=None,message=None):
+	'''
+	dialogCreateAlert(title=None,message=None)
+	Create alert dialog.
+		title (String)  (optional)
+		message (String)  (optional)
+	Example (python)
+	import android
+	droid=android.Android()
+	droid.dialogCreateAlert("I like swords.","Do you like swords?")
+	droid.dialogSetPositiveButtonText("Yes")
+	droid.dialogSetNegativeButtonText("No")
+	droid.dialogShow()
+	response=droid.dialogGetResponse().result
+	droid.dialogDismiss()
+	if response.has_key("which"):
+	result=response["which"]
+	if result=="positive":
+	print "Yay! I like swords too!"
+	elif result=="negative":
+	print "Oh. How sad."
+	elif response.has_key("canceled"): # Yes, I know it's mispelled.
+	print "You can't even make up your mind?"
+	else:
+	print "Unknown response=",response
+	print "Done"
+	'''
+	return self._rpc("dialogCreateAlert",title,message)
+
+def dialogCreateDatePicker(self,year=1970,month=1,day=1):
+	'''
+	dialogCreateDatePicker(year=1970,month=1,day=1)
+	Create date picker dialog.
+		year (Integer)  (default=1970)
+		month (Integer)  (default=1)
+		day (Integer)  (default=1)
+	'''
+	return self._rpc("dialogCreateDatePicker",year,month,day)
+
+def dialogCreateHorizontalProgress(self,title=None,message=None,maximum_progress=100):
+	'''
+	dialogCreateHorizontalProgress(title=None,message=None,maximum_progress=100)
+	Create a horizontal progress dialog.
+		title (String)  (optional)
+		message (String)  (optional)
+		maximum progress (Integer)  (default=100)
+	'''
+	return self._rpc("dialogCreateHorizontalProgress",title,message,maximum_progress)
+
+def dialogCreateInput(self,title="Value",message="Please enter value:",defaultText=None,inputType=None):
+	'''
+	dialogCreateInput(title="Value",message="Please enter value:",defaultText=None,inputType=None)
+	Create a text input dialog.
+		title (String) title of the input box (default=Value)
+		message (String) message to display above the input box (default=Please enter value:)
+		defaultText (String) text to insert into the input box (optional)
+		inputType (String) type of input data, ie number or text (optional)
+	For inputType, see InputTypes. Some useful ones are text, number, and textUri. Multiple flags can be
+	supplied, seperated by "|", ie: "textUri|textAutoComplete"
+	'''
+	return self._rpc("dialogCreateInput",title,message,defaultText,inputType)
+
+def dialogCreatePassword(self,title="Password",message="Please enter password:"):
+	'''
+	dialogCreatePassword(title="Password",message="Please enter password:")
+	Create a password input dialog.
+		title (String) title of the input box (default=Password)
+		message (String) message to display above the input box (default=Please enter password:)
+	'''
+	return self._rpc("dialogCreatePassword",title,message)
+
+def dialogCreateSeekBar(self,starting_value=50,maximum_value=100,title="",message=""):
+	'''
+	dialogCreateSeekBar(starting_value=50,maximum_value=100,title,message)
+	Create seek bar dialog.
+		starting value (Integer)  (default=50)
+		maximum value (Integer)  (default=100)
+		title (String)
+		message (String)
+	Will produce "dialog" events on change, containing:
+	"progress" - Position chosen, between 0 and max
+	"which" = "seekbar"
+	"fromuser" = true/false change is from user input
+	Response will contain a "progress" element.
+	'''
+	return self._rpc("dialogCreateSeekBar",starting_value,maximum_value,title,message)
+
+def dialogCreateSpinnerProgress(self,title=None,message=None,maximum_progress=100):
+	'''
+	dialogCreateSpinnerProgress(title=None,message=None,maximum_progress=100)
+	Create a spinner progress dialog.
+		title (String)  (optional)
+		message (String)  (optional)
+		maximum progress (Integer)  (default=100)
+	'''
+	return self._rpc("dialogCreateSpinnerProgress",title,message,maximum_progress)
+
+def dialogCreateTimePicker(self,hour=0,minute=0,is24hour=False):
+	'''
+	dialogCreateTimePicker(hour=0,minute=0,is24hour=False)
+	Create time picker dialog.
+		hour (Integer)  (default=0)
+		minute (Integer)  (default=0)
+		is24hour (Boolean) Use 24 hour clock (default=false)
+	'''
+	return self._rpc("dialogCreateTimePicker",hour,minute,is24hour)
+
+def dialogDismiss(self):
+	'''
+	dialogDismiss(self)
+	Dismiss dialog.
+	'''
+	return self._rpc("dialogDismiss")
+
+def dialogGetInput(self,title="Value",message="Please enter value:",defaultText=None):
+	'''
+	dialogGetInput(title="Value",message="Please enter value:",defaultText=None)
+	Queries the user for a text input.
+		title (String) title of the input box (default=Value)
+		message (String) message to display above the input box (default=Please enter value:)
+		defaultText (String) text to insert into the input box (optional)
+	The result is the user's input, or None (null) if cancel was hit.
+	Example (python)
+	import android
+	droid=android.Android()
+	print droid.dialogGetInput("Title","Message","Default").result
+	'''
+	return self._rpc("dialogGetInput",title,message,defaultText)
+
+def dialogGetPassword(self,title="Password",message="Please enter password:"):
+	'''
+	dialogGetPassword(title="Password",message="Please enter password:")
+	Queries the user for a password.
+		title (String) title of the password box (default=Password)
+		message (String) message to display above the input box (default=Please enter password:)
+	'''
+	return self._rpc("dialogGetPassword",title,message)
+
+def dialogGetResponse(self):
+	'''
+	dialogGetResponse(self)
+	Returns dialog response.
+	'''
+	return self._rpc("dialogGetResponse")
+
+def dialogGetSelectedItems(self):
+	'''
+	dialogGetSelectedItems(self)
+	This method provides list of items user selected.
+	returns: (Set) Selected items
+	'''
+	return self._rpc("dialogGetSelectedItems")
+
+def dialogSetCurrentProgress(self,current):
+	'''
+	dialogSetCurrentProgress(current)
+	Set progress dialog current value.
+		current (Integer)
+	'''
+	return self._rpc("dialogSetCurrentProgress",current)
+
+def dialogSetItems(self,items):
+	'''
+	dialogSetItems(items)
+	Set alert dialog list items.
+		items (JSONArray)
+	This effectively creates list of options. Clicking on an item will immediately return an "item"
+	element, which is the index of the selected item.
+	'''
+	return self._rpc("dialogSetItems",items)
+
+def dialogSetMaxProgress(self,max):
+	'''
+	dialogSetMaxProgress(max)
+	Set progress dialog maximum value.
+		max (Integer)
+	'''
+	return self._rpc("dialogSetMaxProgress",max)
+
+def dialogSetMultiChoiceItems(self,items,selected=None):
+	'''
+	dialogSetMultiChoiceItems(items,selected=None)
+	Set dialog multiple choice items and selection.
+		items (JSONArray)
+		selected (JSONArray) list of selected items (optional)
+	This creates a list of check boxes. You can select multiple items out of the list. A response
+	will not be returned until the dialog is closed, either with the Cancel key or a button
+	(positive/negative/neutral). Use dialogGetSelectedItems() to find out what was
+	selected.
+	'''
+	return self._rpc("dialogSetMultiChoiceItems",items,selected)
+
+def dialogSetNegativeButtonText(self,text):
+	'''
+	dialogSetNegativeButtonText(text)
+	Set alert dialog button text.
+		text (String)
+	'''
+	return self._rpc("dialogSetNegativeButtonText",text)
+
+def dialogSetNeutralButtonText(self,text):
+	'''
+	dialogSetNeutralButtonText(text)
+	Set alert dialog button text.
+		text (String)
+	'''
+	return self._rpc("dialogSetNeutralButtonText",text)
+
+def dialogSetPositiveButtonText(self,text):
+	'''
+	dialogSetPositiveButtonText(text)
+	Set alert dialog positive button text.
+		text (String)
+	'''
+	return self._rpc("dialogSetPositiveButtonText",text)
+
+def dialogSetSingleChoiceItems(self,items,selected=0):
+	'''
+	dialogSetSingleChoiceItems(items,selected=0)
+	Set dialog single choice items and selected item.
+		items (JSONArray)
+		selected (Integer) selected item index (default=0)
+	This creates a list of radio buttons. You can select one item out of the list. A response will
+	not be returned until the dialog is closed, either with the Cancel key or a button
+	(positive/negative/neutral). Use dialogGetSelectedItems() to find out what was
+	selected.
+	'''
+	return self._rpc("dialogSetSingleChoiceItems",items,selected)
+
+def dialogShow(self):
+	'''
+	dialogShow(self)
+	Show dialog.
+	'''
+	return self._rpc("dialogShow")
+
+def fullDismiss(self):
+	'''
+	fullDismiss(self)
+	Dismiss Full Screen.
+	'''
+	return self._rpc("fullDismiss")
+
+def fullQuery(self):
+	'''
+	fullQuery(self)
+	Get Fullscreen Properties
+	'''
+	return self._rpc("fullQuery")
+
+def fullQueryDetail(self,id):
+	'''
+	fullQueryDetail(id)
+	Get fullscreen properties for a specific widget
+		id (String) id of layout widget
+	'''
+	return self._rpc("fullQueryDetail",id)
+
+def fullSetList(self,id,list):
+	'''
+	fullSetList(id,list)
+	Attach a list to a fullscreen widget
+		id (String) id of layout widget
+		list (JSONArray) List to set
+	'''
+	return self._rpc("fullSetList",id,list)
+
+def fullSetProperty(self,id,property,value):
+	'''
+	fullSetProperty(id,property,value)
+	Set fullscreen widget property
+		id (String) id of layout widget
+		property (String) name of property to set
+		value (String) value to set property to
+	'''
+	return self._rpc("fullSetProperty",id,property,value)
+
+def fullShow(self,layout):
+	'''
+	fullShow(layout)
+	Show Full Screen.
+		layout (String) String containing View layout
+	See wiki page for more
+	detail.
+	'''
+	return self._rpc("fullShow",layout)
+
+def webViewShow(self,url,wait=None):
+	'''
+	webViewShow(url,wait=None)
+	Display a WebView with the given URL.
+		url (String)
+		wait (Boolean) block until the user exits the WebView (optional)
+	See wiki page for more
+	detail.
+	'''
+	return self._rpc("webViewShow",url,wait)
+
+__all__ = [
+	"addContextMenuItem",
+	"addOptionsMenuItem",
+	"clearContextMenu",
+	"clearOptionsMenu",
+	"dialogCreateAlert",
+	"dialogCreateDatePicker",
+	"dialogCreateHorizontalProgress",
+	"dialogCreateInput",
+	"dialogCreatePassword",
+	"dialogCreateSeekBar",
+	"dialogCreateSpinnerProgress",
+	"dialogCreateTimePicker",
+	"dialogDismiss",
+	"dialogGetInput",
+	"dialogGetPassword",
+	"dialogGetResponse",
+	"dialogGetSelectedItems",
+	"dialogSetCurrentProgress",
+	"dialogSetItems",
+	"dialogSetMaxProgress",
+	"dialogSetMultiChoiceItems",
+	"dialogSetNegativeButtonText",
+	"dialogSetNeutralButtonText",
+	"dialogSetPositiveButtonText",
+	"dialogSetSingleChoiceItems",
+	"dialogShow",
+	"fullDismiss",
+	"fullQuery",
+	"fullQueryDetail",
+	"fullSetList",
+	"fullSetProperty",
+	"fullShow",
+	"webViewShow",
+]
@@ -0,0 +1,51 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/wakelock.py
+#
+# Purpose:      WakeLockFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from WakeLockFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def wakeLockAcquireBright(self):
+	'''
+	wakeLockAcquireBright(self)
+	Acquires a bright wake lock (CPU on, screen bright).
+	'''
+	return self._rpc("wakeLockAcquireBright")
+
+def wakeLockAcquireDim(self):
+	'''
+	wakeLockAcquireDim(self)
+	Acquires a dim wake lock (CPU on, screen dim).
+	'''
+	return self._rpc("wakeLockAcquireDim")
+
+def wakeLockAcquireFull(self):
+	'''
+	wakeLockAcquireFull(self)
+	Acquires a full wake lock (CPU on, screen bright, keyboard bright).
+	'''
+	return self._rpc("wakeLockAcquireFull")
+
+def wakeLockAcquirePartial(self):
+	'''
+	wakeLockAcquirePartial(self)
+	Acquires a partial wake lock (CPU on).
+	'''
+	return self._rpc("wakeLockAcquirePartial")
+
+def wakeLockRelease(self):
+	'''
+	wakeLockRelease(self)
+	Releases the wake lock.
+	'''
+	return self._rpc("wakeLockRelease")
+
+__all__ = [
+	"wakeLockAcquireBright",
+	"wakeLockAcquireDim",
+	"wakeLockAcquireFull",
+	"wakeLockAcquirePartial",
+	"wakeLockRelease",
+]
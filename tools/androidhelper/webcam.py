@@ -0,0 +1,60 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/webcam.py
+#
+# Purpose:      WebCamFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from WebCamFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def cameraStartPreview(self,resolutionLevel=0,jpegQuality=20,filepath=None):
+	'''
+	cameraStartPreview(resolutionLevel=0,jpegQuality=20,filepath=None)
+	Start Preview Mode. Throws \'preview\' events.
+		resolutionLevel (Integer) increasing this number provides higher resolution (default=0)
+		jpegQuality (Integer) a number from 0-100 (default=20)
+		filepath (String) Path to store jpeg files. (optional)
+	returns: (boolean) True if successful
+	'''
+	return self._rpc("cameraStartPreview",resolutionLevel,jpegQuality,filepath)
+
+def cameraStopPreview(self):
+	'''
+	cameraStopPreview(self)
+	Stop the preview mode.
+	'''
+	return self._rpc("cameraStopPreview")
+
+def webcamAdjustQuality(self,resolutionLevel=0,jpegQuality=20):
+	'''
+	webcamAdjustQuality(resolutionLevel=0,jpegQuality=20)
+	Adjusts the quality of the webcam stream while it is running.
+		resolutionLevel (Integer) increasing this number provides higher resolution (default=0)
+		jpegQuality (Integer) a number from 0-100 (default=20)
+	'''
+	return self._rpc("webcamAdjustQuality",resolutionLevel,jpegQuality)
+
+def webcamStart(self,resolutionLevel=0,jpegQuality=20,port=0):
+	'''
+	webcamStart(resolutionLevel=0,jpegQuality=20,port=0)
+	Starts an MJPEG stream and returns a Tuple of address and port for the stream.
+		resolutionLevel (Integer) increasing this number provides higher resolution (default=0)
+		jpegQuality (Integer) a number from 0-100 (default=20)
+		port (Integer) If port is specified, the webcam service will bind to port, otherwise it will pick any available port. (default=0)
+	'''
+	return self._rpc("webcamStart",resolutionLevel,jpegQuality,port)
+
+def webcamStop(self):
+	'''
+	webcamStop(self)
+	Stops the webcam stream.
+	'''
+	return self._rpc("webcamStop")
+
+__all__ = [
+	"cameraStartPreview",
+	"cameraStopPreview",
+	"webcamAdjustQuality",
+	"webcamStart",
+	"webcamStop",
+]
@@ -0,0 +1,106 @@
+#-------------------------------------------------------------------------------
+# Name:         androidhelper/wifi.py
+#
+# Purpose:      WifiFacade functions of androidhelper.Android,
+#               generated by createandroidhelper.py from WifiFacade.html
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+
+def checkWifiState(self):
+	'''
+	checkWifiState(self)
+	Checks Wifi state.
+	returns: (Boolean) True if Wifi is enabled.
+	'''
+	return self._rpc("checkWifiState")
+
+def toggleWifiState(self,enabled=None):
+	'''
+	toggleWifiState(enabled=None)
+	Toggle Wifi on and off.
+		enabled (Boolean)  (optional)
+	returns: (Boolean) True if Wifi is enabled.
+	'''
+	return self._rpc("toggleWifiState",enabled)
+
+def wifiDisconnect(self):
+	'''
+	wifiDisconnect(self)
+	Disconnects from the currently active access point.
+	returns: (Boolean) True if the operation succeeded.
+	'''
+	return self._rpc("wifiDisconnect")
+
+def wifiGetConnectionInfo(self):
+	'''
+	wifiGetConnectionInfo(self)
+	Returns information about the currently active access point.
+	'''
+	return self._rpc("wifiGetConnectionInfo")
+
+def wifiGetScanResults(self):
+	'''
+	wifiGetScanResults(self)
+	Returns the list of access points found during the most recent Wifi scan.
+	'''
+	return self._rpc("wifiGetScanResults")
+
+def wifiLockAcquireFull(self):
+	'''
+	wifiLockAcquireFull(self)
+	Acquires a full Wifi lock.
+	'''
+	return self._rpc("wifiLockAcquireFull")
+
+def wifiLockAcquireScanOnly(self):
+	'''
+	wifiLockAcquireScanOnly(self)
+	Acquires a scan only Wifi lock.
+	'''
+	return self._rpc("wifiLockAcquireScanOnly")
+
+def wifiLockRelease(self):
+	'''
+	wifiLockRelease(self)
+	Releases a previously acquired Wifi lock.
+	'''
+	return self._rpc("wifiLockRelease")
+
+def wifiReassociate(self):
+	'''
+	wifiReassociate(self)
+	Reassociates with the currently active access point.
+	returns: (Boolean) True if the operation succeeded.
+	'''
+	return self._rpc("wifiReassociate")
+
+def wifiReconnect(self):
+	'''
+	wifiReconnect(self)
+	Reconnects to the currently active access point.
+	returns: (Boolean) True if the operation succeeded.
+	'''
+	return self._rpc("wifiReconnect")
+
+def wifiStartScan(self):
+	'''
+	wifiStartScan(self)
+	Starts a scan for Wifi access points.
+	returns: (Boolean) True if the scan was initiated successfully.
+	'''
+	return self._rpc("wifiStartScan")
+
+__all__ = [
+	"checkWifiState",
+	"toggleWifiState",
+	"wifiDisconnect",
+	"wifiGetConnectionInfo",
+	"wifiGetScanResults",
+	"wifiLockAcquireFull",
+	"wifiLockAcquireScanOnly",
+	"wifiLockRelease",
+	"wifiReassociate",
+	"wifiReconnect",
+	"wifiStartScan",
+]
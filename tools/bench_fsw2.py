@@ -0,0 +1,182 @@
+#!env python
+#
+# Copyright (C) 2026 shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy
+# of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+"""micro benchmarks of sl4atools/fullscreenwrapper2.
+
+usage: python bench_fsw2.py [count [suite ...]]
+suites: dispatch, properties, batch (default: all)
+"""
+from __future__ import print_function
+import os
+import sys
+import time
+
+_top = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(_top, "python-build", "python-libs", "ase"))
+import android  # noqa: E402
+import sl4aserver  # noqa: E402
+if sys.version_info[0] == 2:
+    sys.path.insert(0, os.path.join(_top, "sl4atools", "fullscreenwrapper2"))
+    import fullscreenwrapper2 as fsw2
+else:
+    sys.path.insert(0, os.path.join(_top, "sl4atools", "fullscreenwrapper2",
+                                    "py3"))
+    import fullscreenwrapper2_py3 as fsw2
+
+
+class BenchLayout(fsw2.Layout):
+    def __init__(self, nviews):
+        super(BenchLayout, self).__init__("<LinearLayout/>", "bench")
+        self.nviews = nviews
+
+    def on_show(self):
+        pass
+
+    def on_close(self):
+        pass
+
+
+def make_layout(nviews, hits):
+    layout = BenchLayout(nviews)
+
+    def handler(view, eventdata):
+        hits.append(view.view_id)
+
+    for i in range(nviews):
+        view_id = "view%d" % i
+        layout.views[view_id] = view = fsw2.View(view_id, "Button", layout)
+        view.add_event(fsw2.click_EventHandler(view, handler))
+    layout.add_event(fsw2.key_EventHandler(handler_function=handler))
+    return layout
+
+
+def linear_handlers(layout, eventdata):
+    """the view by view scan of eventloop before the index."""
+    ret = []
+    for viewname in layout.views:
+        view = layout.views[viewname]
+        for eventname in view._events:
+            event = view._events[eventname]
+            if event.match_event_data(eventdata):
+                ret.append(event)
+                break
+    return ret
+
+
+def bench_dispatch(count):                                  # {{{1
+    """find the handler of a click event among N views."""
+    print("%-8s %14s %14s" % ("views", "linear(us)", "indexed(us)"))
+    for nviews in (10, 100, 1000):
+        hits = []
+        layout = make_layout(nviews, hits)
+        events = [{"name": "click", "data": {"id": "view%d" % (i % nviews)}}
+                  for i in range(count)]
+        t = time.time()
+        for ev in events:
+            for event in linear_handlers(layout, ev):
+                event.event_handler_fn(event.view, ev)
+        t1 = (time.time() - t) / count
+        n = len(hits)
+        t = time.time()
+        for ev in events:
+            for event in layout._find_event_handlers(ev):
+                event.event_handler_fn(event.view, ev)
+        t2 = (time.time() - t) / count
+        assert hits[:n] == hits[n:]
+        print("%-8d %14.1f %14.1f" % (nviews, t1 * 1e6, t2 * 1e6))
+
+
+def show_text_views(nviews):
+    layout = BenchLayout(nviews)
+    layout.xml = "<LinearLayout>%s</LinearLayout>" % "".join(
+        '<TextView android:id="@+id/view%d" android:text="%d"/>' % (i, i)
+        for i in range(nviews))
+    fsw2.FullScreenWrapper2App.show_layout(layout)
+    return layout
+
+
+def bench_properties(count):                                # {{{1
+    """read view properties of a shown layout from sl4aserver.py."""
+    server = sl4aserver.start()
+    droid = android.Android(server.server_address)
+    fsw2.FullScreenWrapper2App.initialize(droid)
+    print("%-8s %14s %14s %8s" % ("views", "rpc(us)", "snapshot(us)", "calls"))
+    for nviews in (10, 100):
+        layout = show_text_views(nviews)
+        names = ["view%d" % (i % nviews) for i in range(count)]
+        t = time.time()
+        for name in names:
+            fsw2.FullScreenWrapper2App.get_property_value(name, "text")
+        t1 = (time.time() - t) / count
+        server.emulator.calls.clear()
+        t = time.time()
+        for i, name in enumerate(names):
+            if i % 100 == 0:
+                # as an event arrived.
+                layout.invalidate_properties()
+            getattr(layout.views, name).text
+        t2 = (time.time() - t) / count
+        print("%-8d %14.1f %14.1f %8d" % (nviews, t1 * 1e6, t2 * 1e6,
+                                         sum(server.emulator.calls.values())))
+        fsw2.FullScreenWrapper2App._layouts.pop()
+    droid.close()
+    server.shutdown()
+
+
+def bench_batch(count):                                     # {{{1
+    """update every text of a dashboard, with and without batch()."""
+    server = sl4aserver.start()
+    droid = android.Android(server.server_address)
+    fsw2.FullScreenWrapper2App.initialize(droid)
+    print("%-8s %14s %14s" % ("views", "each(ms)", "batch(ms)"))
+    for nviews in (10, 50):
+        layout = show_text_views(nviews)
+        frames = max(count // nviews, 1)
+        t = time.time()
+        for n in range(frames):
+            for i in range(nviews):
+                layout.views["view%d" % i].text = str(n)
+        t1 = (time.time() - t) / frames
+        t = time.time()
+        for n in range(frames):
+            with layout.batch():
+                for i in range(nviews):
+                    layout.views["view%d" % i].text = str(n)
+        t2 = (time.time() - t) / frames
+        print("%-8d %14.2f %14.2f" % (nviews, t1 * 1e3, t2 * 1e3))
+        fsw2.FullScreenWrapper2App._layouts.pop()
+    droid.close()
+    server.shutdown()
+
+
+SUITES = (
+    ("dispatch", bench_dispatch),
+    ("properties", bench_properties),
+    ("batch", bench_batch),
+)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    names = sys.argv[2:] or [name for name, fn in SUITES]
+    for name, fn in SUITES:
+        if name in names:
+            fn(count)
+
+
+if __name__ == "__main__":
+    main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker
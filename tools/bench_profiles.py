@@ -0,0 +1,185 @@
+#!env python
+#
+# Copyright (C) 2026 shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy
+# of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+"""compares the py4a optimization profiles by C kernels on the host.
+
+the kernels are loops of numpy (saxpy, dot, byte sum) and of pycrypto
+(ARX cipher rounds, table lookups).  they are compiled with the -O
+flags of each profile in py4a.PROFILES, the code size of the object
+and the time per call are reported.
+
+on the host the arm flags are left out, the x86-sse flags are used on
+x86 hosts only.  to run the target code, give a cross compiler and a
+runner, all flags of the profiles are used then:
+    CC=arm-linux-androideabi-gcc RUN="qemu-arm -L $SYSROOT" \\
+        python bench_profiles.py
+
+usage: python bench_profiles.py [count [profile ...]]
+"""
+from __future__ import print_function
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "python-build", "python-libs"))
+import py4a  # noqa: E402
+
+KERNELS = r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <stdint.h>
+#include <time.h>
+
+#define N 4096
+static float fx[N], fy[N];
+static double dx[N], dy[N];
+static unsigned char bytes[N];
+static uint32_t sbox[256], words[N];
+volatile double sink;
+
+void saxpy(float a) {
+    int i;
+    for (i = 0; i < N; i++) fy[i] += a * fx[i];
+}
+
+double dot(void) {
+    int i; double s = 0;
+    for (i = 0; i < N; i++) s += dx[i] * dy[i];
+    return s;
+}
+
+uint32_t bytesum(void) {
+    int i; uint32_t s = 0;
+    for (i = 0; i < N; i++) s += bytes[i];
+    return s;
+}
+
+#define ROTL(x, n) (((x) << (n)) | ((x) >> (32 - (n))))
+uint32_t arx(void) {
+    int i; uint32_t a = 1, b = 2, c = 3, d = 4;
+    for (i = 0; i < N; i += 4) {
+        a += words[i]; d ^= a; d = ROTL(d, 16);
+        c += words[i + 1]; b ^= c; b = ROTL(b, 12);
+        a += words[i + 2]; d ^= a; d = ROTL(d, 8);
+        c += words[i + 3]; b ^= c; b = ROTL(b, 7);
+    }
+    return a ^ b ^ c ^ d;
+}
+
+uint32_t lookup(void) {
+    int i; uint32_t s = 0;
+    for (i = 0; i < N; i++) s = sbox[(s ^ bytes[i]) & 0xff] ^ (s >> 8);
+    return s;
+}
+
+static double now(void) {
+    struct timespec ts;
+    clock_gettime(CLOCK_MONOTONIC, &ts);
+    return ts.tv_sec + ts.tv_nsec * 1e-9;
+}
+
+#define BENCH(name, expr) do { \
+    double t = now(); \
+    for (n = 0; n < count; n++) sink = (expr); \
+    printf("%s %.1f\n", name, (now() - t) / count * 1e9); \
+} while (0)
+
+int main(int argc, char **argv) {
+    int i, n, count = argc > 1 ? atoi(argv[1]) : 1000;
+    for (i = 0; i < N; i++) {
+        fx[i] = fy[i] = dx[i] = dy[i] = i * 0.5;
+        bytes[i] = (unsigned char)(i * 7);
+        words[i] = i * 2654435761u;
+    }
+    for (i = 0; i < 256; i++) sbox[i] = i * 16777619u;
+    BENCH("saxpy", (saxpy(1.5f), fy[n % N]));
+    BENCH("dot", dot());
+    BENCH("bytesum", bytesum());
+    BENCH("arx", arx());
+    BENCH("lookup", lookup());
+    return 0;
+}
+"""
+
+
+def flags(prof, cross):
+    """the -O flags and the arch flags usable on the machine."""
+    ret = prof["opt"].split()
+    arch = prof["arch"].split()
+    if cross:
+        return ret + arch
+    if prof["target"].startswith("i686") and \
+            platform.machine() in ("i686", "x86_64", "AMD64"):
+        # -march=i686 is not for 64bit hosts.
+        ret += [i for i in arch if not i.startswith(("-march", "-mtune"))]
+    return ret
+
+
+def text_size(obj):
+    try:
+        out = subprocess.check_output(["size", obj]).decode("ascii")
+        return int(out.splitlines()[1].split()[0])
+    except (OSError, subprocess.CalledProcessError, ValueError, IndexError):
+        return os.path.getsize(obj)
+
+
+def bench(name, prof, count, tmp):
+    cross = "CC" in os.environ
+    cc = os.environ.get("CC", "cc").split()
+    run = os.environ.get("RUN", "").split()
+    src = os.path.join(tmp, "kernels.c")
+    obj = os.path.join(tmp, name + ".o")
+    exe = os.path.join(tmp, name)
+    opts = flags(prof, cross)
+    subprocess.check_call(cc + opts + ["-c", src, "-o", obj])
+    subprocess.check_call(cc + opts + [obj, "-o", exe] +
+                          (["-static"] if run else []))
+    out = subprocess.check_output(run + [exe, str(count)]).decode("ascii")
+    times = dict((k, float(v)) for k, v in
+                 (line.split() for line in out.splitlines()))
+    return text_size(obj), times, opts
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    names = sys.argv[2:] or sorted(py4a.PROFILES)
+    tmp = tempfile.mkdtemp()
+    try:
+        with open(os.path.join(tmp, "kernels.c"), "w") as fp:
+            fp.write(KERNELS)
+        results = []
+        for name in names:
+            size, times, opts = bench(name, py4a.PROFILES[name], count, tmp)
+            results.append((name, size, times))
+            print("%-12s %s" % (name, " ".join(opts)))
+        kernels = sorted(results[0][2])
+        print("")
+        print("%-12s %8s" % ("profile", "text(B)") +
+              "".join(" %10s" % ("%s(ns)" % k) for k in kernels))
+        for name, size, times in results:
+            print("%-12s %8d" % (name, size) +
+                  "".join(" %10.0f" % times[k] for k in kernels))
+    finally:
+        shutil.rmtree(tmp)
+
+
+if __name__ == "__main__":
+    main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker
@@ -0,0 +1,203 @@
+#!env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2026 shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy
+# of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+"""benchmarks of the android.py client against sl4aserver.py.
+
+usage: python bench_rpc.py [count [suite ...]]
+suites: codec, call, batch, pool, events, binary (default: all)
+"""
+from __future__ import print_function
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "python-build", "python-libs", "ase"))
+import android  # noqa: E402
+import sl4aserver  # noqa: E402
+
+
+def sms_messages(count):
+    return [{"_id": i, "thread_id": i % 7, "address": "+8190%08d" % i,
+             "date": 1500000000000 + i, "read": 1, "type": 1,
+             "body": u"message body あ %d " % i * 4}
+            for i in range(count)]
+
+
+PAYLOADS = {
+    "batteryGetLevel": 87,
+    "smsGetMessages": sms_messages(500),
+}
+HANDSHAKE = "bench"
+
+
+def percentile(samples, pct):
+    samples = sorted(samples)
+    idx = int(round((len(samples) - 1) * pct / 100.0))
+    return samples[idx]
+
+
+def report(name, count, elapsed, samples=None):
+    line = "%-28s %9.0f calls/s" % (name, count / elapsed)
+    if samples:
+        line += "  p50 %7.1fus p90 %7.1fus p99 %7.1fus" % tuple(
+            percentile(samples, p) * 1e6 for p in (50, 90, 99))
+    print(line)
+
+
+def connect(server, codec=None):
+    return android.Android(server.server_address, codec)
+
+
+def bench_codec(server, count):                             # {{{1
+    """encode a request and decode a response, without the socket."""
+    for name in sorted(android.CODECS):
+        codec = android.get_codec(name)
+        for method in sorted(PAYLOADS):
+            n = count if method == "batteryGetLevel" else max(count // 50, 1)
+            line = codec.encode({"id": 0, "error": None,
+                                 "result": PAYLOADS[method]})
+            t = time.time()
+            for i in range(n):
+                codec.encode_call(i, method, ())
+                codec.decode(line)
+            report("codec %s %s" % (name, method), n, time.time() - t)
+
+
+def bench_call(server, count):                              # {{{1
+    """one round trip per call, with latency percentiles."""
+    for name in sorted(android.CODECS):
+        for method in sorted(PAYLOADS):
+            n = count if method == "batteryGetLevel" else max(count // 50, 1)
+            droid = connect(server, name)
+            fn = getattr(droid, method)
+            # warm up, the first codec measured paid for the others.
+            for i in range(min(n, 100)):
+                fn()
+            samples = []
+            t = time.time()
+            for i in range(n):
+                t1 = time.time()
+                fn()
+                samples.append(time.time() - t1)
+            report("call %s %s" % (name, method), n, time.time() - t,
+                   samples)
+            droid.close()
+
+
+def bench_batch(server, count):                             # {{{1
+    """8 calls per round trip, as a script polling several facades."""
+    droid = connect(server)
+    t = time.time()
+    for i in range(count // 8):
+        with droid.batch() as b:
+            for j in range(8):
+                b.batteryGetLevel()
+    report("batch of 8", count // 8 * 8, time.time() - t)
+    droid.close()
+
+
+def bench_pool(server, count):                              # {{{1
+    for threads in (1, 4):
+        pool = android.AndroidPool(threads, server.server_address)
+
+        def work():
+            for i in range(count // threads):
+                pool.batteryGetLevel()
+
+        ths = [threading.Thread(target=work) for i in range(threads)]
+        t = time.time()
+        for th in ths:
+            th.start()
+        for th in ths:
+            th.join()
+        report("pool %d threads" % threads, count // threads * threads,
+               time.time() - t)
+        pool.close()
+
+
+def bench_events(server, count):                            # {{{1
+    """events posted by the server, read through Android.events()."""
+    for dispatcher in (False, True):
+        droid = connect(server)
+        droid.eventClearBuffer()
+        stream = droid.events("bench", timeout=5, dispatcher=dispatcher)
+
+        def post():
+            # the dispatcher socket is opened by the 1st next(stream).
+            while dispatcher and not server.emulator.dispatchers:
+                time.sleep(0.001)
+            for i in range(count):
+                server.emulator.post_event("bench", i)
+
+        th = threading.Thread(target=post)
+        t = time.time()
+        th.start()
+        n = 0
+        for event in stream:
+            n += 1
+            if n >= count:
+                break
+        stream.close()
+        th.join()
+        report("events %s" % ("dispatcher" if dispatcher else "eventWait"),
+               n, time.time() - t)
+        droid.close()
+
+
+def bench_binary(server, count):                            # {{{1
+    """bytes through bluetoothWriteBinary/ReadBinary of the emulator."""
+    droid = connect(server)
+    data = os.urandom(1024 * 1024)
+    buf = bytearray(16384)
+    t = time.time()
+    droid.bluetooth_write(data, chunk_size=len(buf))
+    n = 0
+    while n < len(data):
+        n += droid.bluetooth_readinto(buf)
+    elapsed = time.time() - t
+    print("%-28s %9.2f MB/s" % ("binary 1MB in 16KB chunks",
+                                2 * len(data) / elapsed / 1e6))
+    droid.close()
+
+
+SUITES = (
+    ("codec", bench_codec),
+    ("call", bench_call),
+    ("batch", bench_batch),
+    ("pool", bench_pool),
+    ("events", bench_events),
+    ("binary", bench_binary),
+)
+
+
+def main():
+    # Android() and AndroidPool authenticate with this.
+    android.HANDSHAKE = HANDSHAKE
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    names = sys.argv[2:] or [name for name, fn in SUITES]
+    server = sl4aserver.start(handshake=HANDSHAKE, results=PAYLOADS)
+    for name, fn in SUITES:
+        if name in names:
+            fn(server, count)
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker
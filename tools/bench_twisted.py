@@ -0,0 +1,500 @@
+#!env python
+#
+# Copyright (C) 2026 shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy
+# of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+"""micro benchmarks of python-modules/twisted, run by python2.
+
+usage: python2 bench_twisted.py [count [suite ...]]
+suites: timers, write, read, receive, banana (default: all)
+"""
+from __future__ import print_function
+import cStringIO
+import errno
+import os
+import random
+import select
+import socket
+import struct
+import sys
+import threading
+import time
+
+_top = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..",
+                    "python-modules")
+sys.path.insert(0, os.path.join(_top, "twisted"))
+sys.path.insert(0, os.path.join(_top, "zope"))
+from twisted.internet import abstract, base, protocol, task  # noqa: E402
+from twisted.internet import tcp  # noqa: E402
+from twisted.protocols import basic, policies  # noqa: E402
+from twisted.spread import banana  # noqa: E402
+
+
+class BenchReactor(base.ReactorBase):
+    """the timed calls of a reactor, on a task.Clock and without I/O."""
+
+    def __init__(self, clock):
+        base.ReactorBase.__init__(self)
+        self.seconds = clock.seconds
+
+    def installWaker(self):
+        pass
+
+
+class Idle(policies.TimeoutMixin):
+    """a keep-alive connection, which times out when left idle."""
+    timedOut = False
+
+    def __init__(self, callLater):
+        self.callLater = callLater
+
+    def timeoutConnection(self):
+        self.timedOut = True
+
+
+def bench_timers(count):                                    # {{{1
+    """10k connections resetting their timeouts, 1 step = 10ms.
+
+    loop is the time of timeout() and runUntilCurrent() of the reactor,
+    wakeups the steps with calls due.
+    """
+    nconns, resets, churn, timeout = 10000, 500, 20, 5
+    print("%-8s %10s %10s %10s %10s" % ("timer", "step(us)", "loop(us)",
+                                        "timeouts", "wakeups"))
+    for name in ("heap", "wheel"):
+        clock = task.Clock()
+        reactor = BenchReactor(clock)
+        if name == "wheel":
+            reactor.useTimingWheel(0.1)
+        rnd = random.Random(0)
+        conns = [Idle(reactor.callLaterCoarse) for i in range(nconns)]
+        for conn in conns:
+            conn.setTimeout(timeout)
+        wakeups = 0
+        loop = 0.0
+        t = time.time()
+        for step in range(count):
+            clock.advance(0.01)
+            for i in range(resets):
+                # the last 10% stay idle and time out.
+                conns[rnd.randrange(nconns * 9 // 10)].resetTimeout()
+            for i in range(churn):
+                n = rnd.randrange(nconns)
+                conns[n].setTimeout(None)
+                conns[n] = Idle(reactor.callLaterCoarse)
+                conns[n].setTimeout(timeout)
+            t1 = time.time()
+            if reactor.timeout() <= 0:
+                wakeups += 1
+            reactor.runUntilCurrent()
+            loop += time.time() - t1
+        elapsed = time.time() - t
+        timeouts = sum(1 for conn in conns if conn.timedOut)
+        print("%-8s %10.1f %10.1f %10d %10d" % (
+              name, elapsed / count * 1e6, loop / count * 1e6, timeouts,
+              wakeups))
+
+
+class FakeReactor(object):
+    def addWriter(self, writer):
+        writer.writing = True
+
+    def removeWriter(self, writer):
+        writer.writing = False
+
+
+class SocketWriter(abstract.FileDescriptor):
+    """the write buffer of FileDescriptor on a non-blocking socket."""
+    connected = 1
+    writing = False
+
+    def __init__(self, sock):
+        abstract.FileDescriptor.__init__(self, FakeReactor())
+        self.sock = sock
+        sock.setblocking(0)
+
+    def writeSomeData(self, data):
+        try:
+            return self.sock.send(buffer(data, 0, self.SEND_LIMIT))
+        except socket.error as e:
+            if e.args[0] == errno.EAGAIN:
+                return 0
+            raise
+
+
+class JoinWriter(SocketWriter):
+    """the doWrite before the deque, joining all the pending data."""
+
+    def doWrite(self):
+        if len(self.dataBuffer) - self.offset < self.SEND_LIMIT:
+            self.dataBuffer = (buffer(self.dataBuffer, self.offset) +
+                               "".join(self._tempDataBuffer))
+            self.offset = 0
+            self._tempDataBuffer.clear()
+            self._tempDataLen = 0
+        if self.offset:
+            l = self.writeSomeData(buffer(self.dataBuffer, self.offset))
+        else:
+            l = self.writeSomeData(self.dataBuffer)
+        self.offset += l
+        if self.offset == len(self.dataBuffer) and not self._tempDataLen:
+            self.dataBuffer = ""
+            self.offset = 0
+            self.stopWriting()
+
+
+def drain(sock, total):
+    buf = bytearray(256 * 1024)
+    n = 0
+    while n < total:
+        n += sock.recv_into(buf)
+
+
+def bench_write(count):                                     # {{{1
+    """throughput of FileDescriptor.write over a socketpair.
+
+    bulk: writes of 64KB, while sending as an HTTP download does.
+    small: writes of 100 bytes, as PB messages.
+    """
+    print("%-8s %-6s %10s" % ("write", "buffer", "MB/s"))
+    for name, size, n in (("bulk", 65536, count), ("small", 100,
+                                                   count * 100)):
+        data = "x" * size
+        for cls in (JoinWriter, SocketWriter):
+            a, b = socket.socketpair()
+            th = threading.Thread(target=drain, args=(b, size * n))
+            th.start()
+            fd = cls(a)
+            t = time.time()
+            for i in range(n):
+                fd.write(data)
+                if i % 16 == 0 and select.select([], [a], [], 0)[1]:
+                    fd.doWrite()
+            while fd.writing:
+                select.select([], [a], [])
+                fd.doWrite()
+            th.join()
+            elapsed = time.time() - t
+            print("%-8s %-6s %10.1f" % (
+                  name, "join" if cls is JoinWriter else "deque",
+                  size * n / elapsed / 1e6))
+            a.close()
+            b.close()
+
+
+class CountProtocol(protocol.Protocol):
+    """counts the bytes by dataReceived, a str per read."""
+    received = 0
+
+    def dataReceived(self, data):
+        self.received += len(data)
+
+
+class CountBufferProtocol(protocol.BufferProtocol):
+    """counts the bytes by bufferReceived, a view of the read buffer."""
+    received = 0
+
+    def bufferReceived(self, data):
+        self.received += len(data)
+
+
+def feed(sock, data, n):
+    for i in range(n):
+        sock.sendall(data)
+    sock.shutdown(socket.SHUT_WR)
+
+
+def bench_read(count):                                      # {{{1
+    """throughput of tcp.Connection.doRead over a socketpair.
+
+    recv: the str of each read given to dataReceived.
+    recv_into: a view of the buffer of the connection to bufferReceived.
+    recv_into is not faster with CPython 2.7, a little slower for both
+    the bulk and the small reads.
+    """
+    print("%-8s %-10s %10s" % ("read", "protocol", "MB/s"))
+    for name, size, n in (("bulk", 65536, count), ("small", 100,
+                                                   count * 100)):
+        data = "x" * size
+        for cls in (CountProtocol, CountBufferProtocol):
+            a, b = socket.socketpair()
+            th = threading.Thread(target=feed, args=(b, data, n))
+            proto = cls()
+            conn = tcp.Connection(a, proto, FakeReactor())
+            t = time.time()
+            th.start()
+            while True:
+                select.select([a], [], [])
+                if conn.doRead() is not None:
+                    break
+            th.join()
+            elapsed = time.time() - t
+            assert proto.received == size * n
+            print("%-8s %-10s %10.1f" % (
+                  name, "recv" if cls is CountProtocol else "recv_into",
+                  size * n / elapsed / 1e6))
+            a.close()
+            b.close()
+
+
+class Lines(basic.LineReceiver):
+    """counts the lines, and the raw bytes."""
+    lines = raw = 0
+
+    def lineReceived(self, line):
+        self.lines += 1
+
+    def rawDataReceived(self, data):
+        self.raw += len(data)
+
+
+class JoinLines(Lines):
+    """the dataReceived before the offset, splitting the buffer by line."""
+    _buf = ""
+
+    def dataReceived(self, data):
+        self._buf = self._buf + data
+        while self.line_mode and not self.paused:
+            try:
+                line, self._buf = self._buf.split(self.delimiter, 1)
+            except ValueError:
+                break
+            self.lineReceived(line)
+        else:
+            if not self.paused:
+                data, self._buf = self._buf, ""
+                if data:
+                    self.rawDataReceived(data)
+
+
+class Strings(basic.Int32StringReceiver):
+    """counts the strings."""
+    MAX_LENGTH = 1 << 24
+    strings = 0
+
+    def stringReceived(self, string):
+        self.strings += 1
+
+
+class JoinStrings(Strings):
+    """the dataReceived before the offset, slicing the buffer by string."""
+    _buf = ""
+
+    def dataReceived(self, recd):
+        self._buf = self._buf + recd
+        while len(self._buf) >= self.prefixLength and not self.paused:
+            length, = struct.unpack(self.structFormat,
+                                    self._buf[:self.prefixLength])
+            if len(self._buf) < length + self.prefixLength:
+                break
+            packet = self._buf[self.prefixLength:length + self.prefixLength]
+            self._buf = self._buf[length + self.prefixLength:]
+            self.stringReceived(packet)
+
+
+class NullTransport(object):
+    disconnecting = False
+
+    def pauseProducing(self):
+        pass
+
+    def resumeProducing(self):
+        pass
+
+
+def bench_receive(count):                                   # {{{1
+    """LineReceiver and Int32StringReceiver, buffer copies or the offset.
+
+    lines: 1MB of 20 byte lines in one chunk.
+    frame: a string of 1MB received in chunks of 64KB.
+    rawpause: 1MB in chunks of 4KB received in raw mode while paused.
+    """
+    mb = 1 << 20
+    lines = ("x" * 18 + "\r\n") * (mb // 20)
+    frame = struct.pack("!I", mb) + "x" * mb
+    frame = [frame[i:i + 65536] for i in range(0, len(frame), 65536)]
+    raw = ["x" * 4096] * (mb // 4096)
+
+    def run_lines(cls):
+        p = cls()
+        p.transport = NullTransport()
+        p.dataReceived(lines)
+        return p.lines == mb // 20
+
+    def run_frame(cls):
+        p = cls()
+        for chunk in frame:
+            p.dataReceived(chunk)
+        return p.strings == 1
+
+    def run_rawpause(cls):
+        p = cls()
+        p.transport = NullTransport()
+        p.setRawMode()
+        p.pauseProducing()
+        for chunk in raw:
+            p.dataReceived(chunk)
+        p.resumeProducing()
+        return p.raw == mb
+
+    print("%-8s %-6s %10s" % ("receive", "buffer", "ms/MB"))
+    n = max(1, count // 100)
+    for name, fn, classes in (("lines", run_lines, (JoinLines, Lines)),
+                              ("frame", run_frame, (JoinStrings, Strings)),
+                              ("rawpause", run_rawpause, (JoinLines, Lines))):
+        for cls in classes:
+            t = time.time()
+            for i in range(n):
+                assert fn(cls)
+            elapsed = time.time() - t
+            print("%-8s %-6s %10.1f" % (
+                  name, "join" if cls.__name__.startswith("Join") else
+                  "offset", elapsed / n * 1e3))
+
+
+class JoinBanana(banana.Banana):
+    """the Banana before the offset, slicing the buffer by element."""
+
+    def dataReceived(self, chunk):
+        buffer = self.buffer + chunk
+        listStack = self.listStack
+        gotItem = self.gotItem
+        while buffer:
+            self.buffer = buffer
+            pos = 0
+            for ch in buffer:
+                if ch >= banana.HIGH_BIT_SET:
+                    break
+                pos = pos + 1
+            else:
+                return
+            num = banana.b1282int(buffer[:pos])
+            typebyte = buffer[pos]
+            rest = buffer[pos + 1:]
+            if typebyte == banana.LIST:
+                listStack.append((num, []))
+                buffer = rest
+            elif typebyte == banana.STRING:
+                if len(rest) < num:
+                    return
+                buffer = rest[num:]
+                gotItem(rest[:num])
+            elif typebyte in (banana.INT, banana.LONGINT):
+                buffer = rest
+                gotItem(num)
+            elif typebyte in (banana.NEG, banana.LONGNEG):
+                buffer = rest
+                gotItem(-num)
+            elif typebyte == banana.FLOAT:
+                if len(rest) < 8:
+                    return
+                buffer = rest[8:]
+                gotItem(struct.unpack("!d", rest[:8])[0])
+            while listStack and (len(listStack[-1][1]) ==
+                                 listStack[-1][0]):
+                gotItem(listStack.pop()[1])
+        self.buffer = ""
+
+    def sendEncoded(self, obj):
+        io = cStringIO.StringIO()
+        self._encode(obj, io.write)
+        self.transport.write(io.getvalue())
+
+    def _encode(self, obj, write):
+        if isinstance(obj, (list, tuple)):
+            banana.int2b128(len(obj), write)
+            write(banana.LIST)
+            for elem in obj:
+                self._encode(elem, write)
+        elif isinstance(obj, (int, long)):
+            banana.int2b128(abs(obj), write)
+            write(banana.INT if obj >= 0 else banana.NEG)
+        elif isinstance(obj, float):
+            write(banana.FLOAT)
+            write(struct.pack("!d", obj))
+        else:
+            banana.int2b128(len(obj), write)
+            write(banana.STRING)
+            write(obj)
+
+
+def nested(depth):
+    ret = []
+    for i in range(depth):
+        ret = [i, "n", ret]
+    return ret
+
+
+def bench_banana(count):                                    # {{{1
+    """encode and decode by Banana, fed in chunks of 64KB.
+
+    list: a list of 100k ints, floats and short strings.
+    strings: 10 strings of 500KB.
+    nesting: 200 lists nested 300 deep.
+    """
+    objs = (("list", [[i, i * 0.5, "item"] for i in range(100000 // 3)]),
+            ("strings", ["x" * 500000] * 10),
+            ("nesting", [nested(300) for i in range(200)]))
+    print("%-8s %-6s %10s %10s %10s" % ("banana", "buffer", "size(KB)",
+                                        "enc(ms)", "dec(ms)"))
+    n = max(1, count // 200)
+    for name, obj in objs:
+        for cls in (JoinBanana, banana.Banana):
+            got = []
+            p = cls()
+            p.connectionMade = lambda: None
+            p.setPrefixLimit(64)
+            p.currentDialect = "none"
+            p.expressionReceived = got.append
+            io = cStringIO.StringIO()
+            p.transport = io
+            t = time.time()
+            for i in range(n):
+                io.seek(0)
+                io.truncate()
+                p.sendEncoded(obj)
+            enc = (time.time() - t) / n
+            data = io.getvalue()
+            chunks = [data[i:i + 65536] for i in range(0, len(data), 65536)]
+            t = time.time()
+            for i in range(n):
+                for chunk in chunks:
+                    p.dataReceived(chunk)
+            dec = (time.time() - t) / n
+            assert len(got) == n and got[0] == obj
+            print("%-8s %-6s %10d %10.1f %10.1f" % (
+                  name, "join" if cls is JoinBanana else "offset",
+                  len(data) // 1024, enc * 1e3, dec * 1e3))
+
+
+SUITES = (
+    ("timers", bench_timers),
+    ("write", bench_write),
+    ("read", bench_read),
+    ("receive", bench_receive),
+    ("banana", bench_banana),
+)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    names = sys.argv[2:] or [name for name, fn in SUITES]
+    for name, fn in SUITES:
+        if name in names:
+            fn(count)
+
+
+if __name__ == "__main__":
+    main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker
@@ -1,9 +1,11 @@
 #-------------------------------------------------------------------------------
 # Name:     createandroidhelper.py
 #
-# Purpose:  To automagically generate androidhelper.py file containing a
+# Purpose:  To automagically generate androidhelper package containing a
 #           "helper" class to simplify Python-for-Android SL4A development
-#           in IDEs environments
+#           in IDEs environments. Each facade (battery, bluetooth, ui, ...)
+#           is a module of the package, imported on the first use of its
+#           methods
 #
 # Known Issues:
 # 1. viewMap(self,query) wiki for some reason copies example string - need to manually correct
@@ -17,13 +19,16 @@
 #
 # Then run the program as follows:
 #
-# python createandroidhelper.py <HTML FILES DIR> <androidhelper.py TARGET DIR>
+# python createandroidhelper.py [--strip-docs] <HTML FILES DIR> <androidhelper TARGET DIR>
 #
 # <HTML FILES DIR> = The local folder where the zip file has been unzipped
 
-# <androidhelper.py TARGET DIR> = In which folder do you want androidhelper.py
+# <androidhelper TARGET DIR> = In which folder do you want androidhelper
 # to be generated. if this is missing or unreachable the program will try to
-# generate the file in the folder where createandroidhelper.py is located
+# generate the package in the folder where createandroidhelper.py is located
+#
+# --strip-docs = leave the API documentation out of the methods, for the
+# package installed on the device
 #
 # Version:  0.1 alpha, created on 7-Apr-2012
 #
@@ -46,7 +51,7 @@
 #!/usr/bin/env python
 
 usagestring = """Name:     createandroidhelper.py
-Purpose:  To automagically generate androidhelper.py file containing a
+Purpose:  To automagically generate androidhelper package containing a
           "helper" class to simplify Python-for-Android SL4A development
           in IDEs environments
 Usage:
@@ -56,22 +61,28 @@ http://android-scripting.googlecode.com/hg/android/ScriptingLayerForAndroid/asse
 
 Then run the program from shell as follows:
 
-python createandroidhelper.py <HTML FILES DIR> <androidhelper.py TARGET DIR>
+python createandroidhelper.py [--strip-docs] <HTML FILES DIR> <androidhelper TARGET DIR>
 
 <HTML FILES DIR> = The local folder where the zip file has been unzipped
 
-<androidhelper.py TARGET DIR> = In which folder do you want androidhelper.py
+<androidhelper TARGET DIR> = In which folder do you want androidhelper
 to be generated. if this is missing or unreachable the program will try to
-generate the file in the folder where createandroidhelper.py is located"""
+generate the package in the folder where createandroidhelper.py is located
+
+--strip-docs = leave the API documentation out of the methods, for the
+package installed on the device"""
 
 startstring = """#-------------------------------------------------------------------------------
-# Name:         androidhelper.py
+# Name:         androidhelper
 #
 # Purpose:      To simplify Python-for-Android SL4A development in IDEs with a
 #               "hepler" class derived from the default Android class containing
 #               SL4A facade functions & API documentation
 #
-# Usage:        copy androidhelper.py into either the folder containing your
+#               The facade functions of each SL4A facade are in a module of this
+#               package, which is imported at the first use of one of them
+#
+# Usage:        copy androidhelper directory into either the folder containing your
 #               SL4A python script or to some location on the python import path
 #               that your IDE can see and in your script, instead of:
 #
@@ -105,17 +116,73 @@ startstring = """#--------------------------------------------------------------
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations under
 # the License.
+from __future__ import absolute_import
+import importlib
 
 import android
 
-class Android(android.Android):"""
+class Android(android.Android):
+	'''
+	android.Android with the SL4A facade functions, which are set to this class
+	from the facade modules of this package at the first use
+	'''
+	def __getattr__(self, name):
+		family = FAMILIES.get(name)
+		if family is None:
+			return android.Android.__getattr__(self, name)
+		_attach(family)
+		return object.__getattribute__(self, name)
+
+	def __dir__(self):
+		return sorted(set(dir(type(self))) | set(self.__dict__) | set(FAMILIES))
+"""
+
+endstring = """
+def _attach(family):
+	'''
+	sets the functions of a facade module to Android
+	'''
+	mod = importlib.import_module(__name__+"."+family)
+	for name in mod.__all__:
+		if FAMILIES.get(name) == family:
+			setattr(Android, name, getattr(mod, name))
+"""
+
+familystring = """#-------------------------------------------------------------------------------
+# Name:         androidhelper/%s.py
+#
+# Purpose:      %s functions of androidhelper.Android,
+#               generated by createandroidhelper.py from %s
+#
+# Licensed under the Apache License, Version 2.0, see androidhelper/__init__.py
+#-------------------------------------------------------------------------------
+"""
 
 
 from bs4 import BeautifulSoup
 import os.path
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "python3-alpha", "python-libs", "ase"))
+from android import CACHEABLE
+
+def family_name(href):
+    #BatteryManagerFacade.html => battery
+    name = os.path.splitext(os.path.basename(href))[0]
+    for suffix in ("Facade","Manager"):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+    name = name.lower()
+    #not to be mistaken for the android module
+    if name == "android":
+        name = "androidfacade"
+    return name
+
 def main():
+    stripdocs = "--strip-docs" in sys.argv
+    if stripdocs:
+        sys.argv.remove("--strip-docs")
     try:
         basedocdir = sys.argv[1]
         infile = open(os.path.join(basedocdir,"index.html"),"r")
@@ -130,16 +197,20 @@ def main():
 
     try:
         andhelperfildir = sys.argv[2]
-        outpath =os.path.join(andhelperfildir,"androidhelper.py")
-        print "Found index.html. Trying to create "+outpath
-        outfile = open(outpath,"w")
-    except IndexError,IOError:
-        altpath =os.path.join(os.path.dirname(sys.argv[0]),"androidhelper.py")
-        print "ERROR: <androidhelper.py TARGET DIR> was not found or failed to create androidhelper.py there"
-        print "Trying to create "+altpath+" instead"
+        outdir =os.path.join(andhelperfildir,"androidhelper")
+        print "Found index.html. Trying to create "+outdir
+        if not os.path.isdir(outdir):
+            os.mkdir(outdir)
+        outfile = open(os.path.join(outdir,"__init__.py"),"w")
+    except (IndexError,IOError,OSError):
+        outdir =os.path.join(os.path.dirname(sys.argv[0]),"androidhelper")
+        print "ERROR: <androidhelper TARGET DIR> was not found or failed to create androidhelper there"
+        print "Trying to create "+outdir+" instead"
         try:
-            outfile = open(altpath,"w")
-        except IOError:
+            if not os.path.isdir(outdir):
+                os.mkdir(outdir)
+            outfile = open(os.path.join(outdir,"__init__.py"),"w")
+        except (IOError,OSError):
             print "ERROR: Failed!"
             print usagestring
             exit(-1)
@@ -147,12 +218,19 @@ def main():
     idxsoup = BeautifulSoup(infile.read())
     infile.close()
 
-    print "starting to write androidhelper.py"
+    print "starting to write androidhelper"
+    facade_names = []
+    #(function name, facade module) in the order of the documents
+    families = []
     outfile.write( startstring)
     outfile.write("\n")
 
     for facade in idxsoup.findAll("a"):
         print "processing "+facade["href"]
+        family = family_name(facade["href"])
+        familyfile = open(os.path.join(outdir,family+".py"),"w")
+        familyfile.write(familystring % (family, os.path.splitext(os.path.basename(facade["href"]))[0], facade["href"]))
+        familyfile.write("\n")
         html = open(os.path.join(basedocdir,facade["href"]),"r").read()
         html = html.replace("<br>","")
         html = html.replace("<BR>","")
@@ -213,8 +291,8 @@ def main():
             apifunctions.append({"func_name":func_name, "func_parameters":func_parameters, "func_docstuff":func_docstuff.text })
 
         for apifunction in apifunctions:
-            functionstring ='\tdef '+apifunction["func_name"]+'(self,'
-            rpcstring = '\t\treturn self._rpc("'+apifunction["func_name"]+'",'
+            functionstring ='def '+apifunction["func_name"]+'(self,'
+            rpcstring = '\treturn self._rpc("'+apifunction["func_name"]+'",'
 
             if( len (apifunction["func_parameters"])>0):
                 for parameter in apifunction["func_parameters"]:
@@ -245,8 +323,8 @@ def main():
 
             functionstring = functionstring + "):"
             rpcstring = rpcstring+")"
-            apidoctext = "\t\t'''\n"
-            apidoctext = apidoctext+"\t\t"+functionstring[5:-1].replace("self,","")+"\n"
+            apidoctext = "\t'''\n"
+            apidoctext = apidoctext+"\t"+functionstring[4:-1].replace("self,","")+"\n"
 
             doclinectr = 0
 
@@ -254,21 +332,45 @@ def main():
                 txtline = txtline.strip()
                 if(txtline!=""):
                     if(doclinectr>0 and doclinectr<len(apifunction["func_parameters"])+1):
-                        apidoctext=apidoctext+ "\t\t\t"+txtline+"\n"
+                        apidoctext=apidoctext+ "\t\t"+txtline+"\n"
                     else:
-                        apidoctext = apidoctext + "\t\t"+txtline+"\n"
+                        apidoctext = apidoctext + "\t"+txtline+"\n"
 
                     doclinectr = doclinectr+1
 
-            apidoctext = apidoctext+"\t\t'''"
-            print "\twriting "+functionstring[5:]
-            outfile.write(functionstring)
-            outfile.write("\n")
-            outfile.write(apidoctext)
-            outfile.write("\n")
-            outfile.write(rpcstring)
-            outfile.write("\n\n")
-
+            apidoctext = apidoctext+"\t'''"
+            print "\twriting "+family+"."+functionstring[4:]
+            facade_names.append(apifunction["func_name"])
+            families.append((apifunction["func_name"], family))
+            familyfile.write(functionstring)
+            familyfile.write("\n")
+            if not stripdocs:
+                familyfile.write(apidoctext)
+                familyfile.write("\n")
+            familyfile.write(rpcstring)
+            familyfile.write("\n\n")
+
+        familyfile.write("__all__ = [\n")
+        for apifunction in apifunctions:
+            familyfile.write('\t"'+apifunction["func_name"]+'",\n')
+        familyfile.write("]\n")
+        familyfile.close()
+
+    #facades whose results Android.enable_cache() may keep
+    outfile.write("\tcacheable = frozenset([\n")
+    for func_name in sorted(CACHEABLE.intersection(facade_names)):
+        outfile.write('\t\t"'+func_name+'",\n')
+    outfile.write("\t])\n")
+    outfile.write(endstring)
+
+    #a function documented in 2 facades is the one of the later, as it was in the class
+    familyof = dict(families)
+    outfile.write("\n#facade function name => module of this package defining it\n")
+    outfile.write("FAMILIES = {\n")
+    for func_name, family in families:
+        if familyof[func_name] == family:
+            outfile.write('\t"'+func_name+'": "'+family+'",\n')
+    outfile.write("}\n")
     outfile.close()
 
 if __name__ == '__main__':
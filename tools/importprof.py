@@ -0,0 +1,250 @@
+#!env python
+#
+# Copyright (C) 2026 shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy
+# of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+"""import time profiler, runs a script and reports its imports.
+
+every import statement that loads a new module (or fails) is timed by a
+__import__ hook and put in a tree of the imports it caused.  on python3
+the stat()/listdir() and open() calls of the import system are counted
+too, python2 imports in C and the columns are empty.
+
+usage: python importprof.py [-o report] [-f folded] [-s cum|self|fs]
+                            script.py [args ...]
+    -o: write the report to a file instead of stderr.
+    -f: write folded stacks (flamegraph.pl, speedscope) in microseconds.
+    -s: sort the flat report by the cumulative time, the own time or
+        the file system calls.
+
+the modules loaded before the script runs (os, sys, ... of the
+interpreter startup) are not shown, this imports nothing else.
+"""
+from __future__ import print_function
+import os
+import sys
+import time
+
+if sys.version_info[0] == 2:
+    import __builtin__ as builtins
+    _bootstrap_external = None
+else:
+    import builtins
+    try:
+        from importlib import _bootstrap_external
+    except ImportError:
+        _bootstrap_external = None
+
+timer = getattr(time, "perf_counter", time.time)
+# sys.modules keeps the order of loading, new modules name the imports.
+ORDERED = sys.version_info >= (3, 6)
+
+
+class Node(object):
+    """an import and the imports made while it runs."""
+    __slots__ = ("name", "children", "modules", "cum", "stats", "opens",
+                 "failed")
+
+    def __init__(self, name):
+        self.name = name
+        self.children = []
+        self.modules = []
+        self.cum = 0.0
+        self.stats = self.opens = 0
+        self.failed = False
+
+    @property
+    def own(self):
+        return self.cum - sum(i.cum for i in self.children)
+
+    @property
+    def fs(self):
+        return self.stats + self.opens
+
+    def walk(self, path=()):
+        path = path + (self.name, )
+        yield path, self
+        for child in self.children:
+            for i in child.walk(path):
+                yield i
+
+
+class _Counting(object):
+    """a module proxy counting calls of some functions to the profiler."""
+
+    def __init__(self, mod, prof, counted):
+        self._mod = mod
+        self._prof = prof
+        self._counted = counted
+
+    def __getattr__(self, name):
+        ret = getattr(self._mod, name)
+        kind = self._counted.get(name)
+        if kind is None:
+            return ret
+        prof = self._prof
+
+        def counted(*args, **kw):
+            prof.count(kind)
+            return ret(*args, **kw)
+        return counted
+
+
+class ImportProfiler(object):
+
+    def __init__(self):
+        self.root = Node("<main>")
+        self.stack = [self.root]
+        self._import = None
+        self._saved = {}
+
+    def count(self, kind):
+        node = self.stack[-1]
+        if kind == "stat":
+            node.stats += 1
+        else:
+            node.opens += 1
+
+    def hooked_import(self, name, globals=None, locals=None, fromlist=(),
+                      level=-1 if sys.version_info[0] == 2 else 0):
+        node = Node("." * level + name if level > 0 else name)
+        parent = self.stack[-1]
+        self.stack.append(node)
+        n = len(sys.modules)
+        t = timer()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        except ImportError:
+            node.failed = True
+            raise
+        finally:
+            node.cum = timer() - t
+            self.stack.pop()
+            # imports of the modules already loaded are not shown.
+            if node.failed or len(sys.modules) != n or node.fs:
+                parent.children.append(node)
+            if ORDERED and len(sys.modules) > n:
+                self.name_node(node, list(sys.modules)[n:])
+
+    def name_node(self, node, modules):
+        node.modules = modules
+        for child in node.children:
+            modules = [i for i in modules if i not in child.modules]
+        if len(modules) == 1:
+            node.name = modules[0]
+        elif modules:
+            node.name = "%s +%d" % (modules[-1], len(modules) - 1)
+
+    def start(self):
+        self._import = builtins.__import__
+        builtins.__import__ = self.hooked_import
+        if _bootstrap_external is None:
+            return
+        for name, counted in (("_os", {"stat": "stat", "listdir": "stat",
+                                       "open": "open"}),
+                              ("_io", {"FileIO": "open",
+                                       "open_code": "open"})):
+            mod = getattr(_bootstrap_external, name, None)
+            if mod is not None:
+                self._saved[name] = mod
+                setattr(_bootstrap_external, name,
+                        _Counting(mod, self, counted))
+
+    def stop(self):
+        builtins.__import__ = self._import
+        for name, mod in self._saved.items():
+            setattr(_bootstrap_external, name, mod)
+        self.root.cum = sum(i.cum for i in self.root.children)
+
+    def run(self, script, args):
+        sys.argv = [script] + list(args)
+        sys.path[0] = os.path.dirname(os.path.abspath(script))
+        with open(script) as fp:
+            code = compile(fp.read(), script, "exec")
+        globs = {"__name__": "__main__", "__file__": script,
+                 "__builtins__": builtins}
+        self.start()
+        try:
+            exec(code, globs)
+        except SystemExit:
+            pass
+        finally:
+            self.stop()
+
+    # reports {{{1
+    def report(self, fp, sort="cum"):
+        counted = _bootstrap_external is not None
+
+        def fs(n):
+            return "%6d" % n if counted else "%6s" % "-"
+
+        key = {"cum": lambda node: node.cum,
+               "self": lambda node: node.own,
+               "fs": lambda node: node.fs}[sort]
+        nodes = [node for path, node in self.root.walk()][1:]
+        total = self.root
+        print("%d imports in %.1fms, %s stat %s open" % (
+              len(nodes), total.cum * 1e3,
+              fs(sum(i.stats for i in nodes)).strip(),
+              fs(sum(i.opens for i in nodes)).strip()), file=fp)
+        print("", file=fp)
+        print("%9s %9s %6s %6s  module" % ("cum(ms)", "self(ms)",
+                                          "stat", "open"), file=fp)
+        for node in sorted(nodes, key=key, reverse=True):
+            print("%9.2f %9.2f %s %s  %s%s" % (
+                  node.cum * 1e3, node.own * 1e3, fs(node.stats),
+                  fs(node.opens), node.name,
+                  " (failed)" if node.failed else ""), file=fp)
+        print("", file=fp)
+        print("%9s %6s  tree" % ("cum(ms)", "%"), file=fp)
+        for path, node in self.root.walk():
+            pct = 100.0 * node.cum / total.cum if total.cum else 0.0
+            print("%9.2f %6.1f  %s%s%s" % (
+                  node.cum * 1e3, pct, "  " * (len(path) - 1), node.name,
+                  " (failed)" if node.failed else ""), file=fp)
+
+    def folded(self, fp):
+        """stacks of the own time, a line by a stack."""
+        for path, node in self.root.walk():
+            us = int(node.own * 1e6)
+            if us > 0:
+                print("%s %d" % (";".join(path), us), file=fp)
+
+
+def main():
+    # no argparse, its imports would be hidden from the report.
+    args = sys.argv[1:]
+    opts = {"-o": None, "-f": None, "-s": "cum"}
+    while args and args[0] in opts:
+        opts[args[0]] = args[1]
+        args = args[2:]
+    if not args or opts["-s"] not in ("cum", "self", "fs"):
+        print(__doc__)
+        sys.exit(1)
+
+    prof = ImportProfiler()
+    prof.run(args[0], args[1:])
+    if opts["-o"]:
+        with open(opts["-o"], "w") as fp:
+            prof.report(fp, opts["-s"])
+    else:
+        prof.report(sys.stderr, opts["-s"])
+    if opts["-f"]:
+        with open(opts["-f"], "w") as fp:
+            prof.folded(fp)
+
+
+if __name__ == "__main__":
+    main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker
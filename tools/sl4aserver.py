@@ -0,0 +1,306 @@
+#!env python
+#
+# Copyright (C) 2026 shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy
+# of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+"""stand-in SL4A server for running android.py clients on a Linux box.
+
+speaks the line delimited JSON-RPC protocol of SL4A, checks the
+_authenticate handshake, answers facades from canned results and keeps
+an event queue (eventPost, eventWait, eventPoll, startEventDispatcher)
+and a small FullScreenUI view model (fullShow, fullQuery, ...).
+
+usage: python sl4aserver.py [port [handshake]]
+then run the script with the printed AP_HOST/AP_PORT/AP_HANDSHAKE.
+"""
+from __future__ import print_function
+import base64
+import collections
+import json
+import re
+import socket
+import sys
+import threading
+import time
+import logging
+from logging import info
+
+if sys.version_info[0] == 2:
+    import SocketServer as socketserver
+else:
+    import socketserver
+
+
+RESULTS = {
+    "batteryGetHealth": 2,
+    "batteryGetLevel": 87,
+    "batteryGetStatus": 3,
+    "batteryGetTechnology": "Li-ion",
+    "batteryGetTemperature": 281,
+    "batteryGetVoltage": 4120,
+    "checkWifiState": True,
+    "environment": {"SDK": "19", "download": "/sdcard/Download",
+                    "appcache": "/data/data/com.googlecode.android_scripting"
+                                "/cache"},
+    "getDeviceId": "000000000000000",
+    "getNetworkOperatorName": "Android",
+    "getPackageVersion": "6.1.1",
+    "getPackageVersionCode": 601,
+    "makeToast": None,
+    "readSensors": {"accuracy": 3, "time": 1500000000.0,
+                    "xforce": 0.1, "yforce": 9.7, "zforce": 0.3,
+                    "azimuth": 0.5, "pitch": -1.5, "roll": 0.0,
+                    "light": 120.0},
+    "startSensingTimed": None,
+    "stopSensing": None,
+    "vibrate": None,
+    "wifiGetConnectionInfo": {"ssid": "\"emulator\"", "rssi": -50,
+                              "link_speed": 65, "network_id": 0},
+    "wifiGetScanResults": [{"bssid": "00:00:00:00:00:%02x" % i,
+                            "ssid": "ap%d" % i, "level": -40 - i,
+                            "frequency": 2412, "capabilities": "[WPA2]"}
+                           for i in range(20)],
+    "smsGetMessages": [{"_id": i, "address": "+8190%08d" % i,
+                        "date": 1500000000000 + i, "read": 1,
+                        "body": "message body %d" % i}
+                       for i in range(100)],
+}
+
+
+class Emulator(object):
+    """state shared by all connections of a server.
+
+    results maps a facade name to its result or to a function called
+    with the request params.  facades are looked up as rpc_<name>
+    methods first, so subclasses can add behaviours.
+    """
+
+    def __init__(self, handshake=None, results=None):
+        self.handshake = handshake
+        self.results = dict(RESULTS)
+        if results:
+            self.results.update(results)
+        self.events = collections.deque()
+        self.cond = threading.Condition()
+        self.dispatchers = []
+        self.views = {}
+        self.title = ""
+        self.bluetooth = bytearray()
+        self.calls = collections.Counter()
+
+    def call(self, session, method, params):
+        """returns (result, error) for one request."""
+        self.calls[method] += 1
+        if method == "_authenticate":
+            if self.handshake is not None and params != [self.handshake]:
+                return None, "Authentication failed."
+            session["authenticated"] = True
+            return True, None
+        if not session.get("authenticated"):
+            return None, "Authentication failed."
+        fn = getattr(self, "rpc_" + method, None)
+        if fn is not None:
+            try:
+                return fn(*params), None
+            except TypeError as ex:
+                return None, "%s: %s" % (method, ex)
+        if method not in self.results:
+            return None, "Unknown RPC: %s" % method
+        ret = self.results[method]
+        if callable(ret):
+            ret = ret(*params)
+        return ret, None
+
+    # events {{{1
+    def post_event(self, name, data):
+        event = {"name": name, "data": data,
+                 "time": int(time.time() * 1000)}
+        line = (json.dumps(event) + "\n").encode("utf-8")
+        with self.cond:
+            self.events.append(event)
+            self.cond.notify_all()
+            dispatchers = list(self.dispatchers)
+        for conn in dispatchers:
+            try:
+                conn.sendall(line)
+            except socket.error:
+                self.dispatchers.remove(conn)
+        return event
+
+    def rpc_eventPost(self, name, data, enqueue=None):
+        self.post_event(name, data)
+
+    def rpc_eventClearBuffer(self):
+        with self.cond:
+            self.events.clear()
+
+    def rpc_eventPoll(self, number_of_events=1):
+        with self.cond:
+            ret = []
+            while self.events and len(ret) < number_of_events:
+                ret.append(self.events.popleft())
+        return ret
+
+    def _wait(self, match, timeout, remove):
+        deadline = None if timeout is None else time.time() + timeout / 1e3
+        with self.cond:
+            while True:
+                for event in self.events:
+                    if match(event):
+                        if remove:
+                            self.events.remove(event)
+                        return event
+                if deadline is None:
+                    self.cond.wait()
+                    continue
+                left = deadline - time.time()
+                if left <= 0:
+                    return None
+                self.cond.wait(left)
+
+    def rpc_eventWait(self, timeout=None):
+        return self._wait(lambda ev: True, timeout, True)
+
+    def rpc_eventWaitFor(self, eventName, timeout=None):
+        return self._wait(lambda ev: ev["name"] == eventName, timeout, False)
+
+    def rpc_startEventDispatcher(self, port=0):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("127.0.0.1", port))
+        sock.listen(1)
+
+        def accept():
+            conn, _ = sock.accept()
+            sock.close()
+            with self.cond:
+                self.dispatchers.append(conn)
+
+        th = threading.Thread(target=accept)
+        th.daemon = True
+        th.start()
+        return sock.getsockname()[1]
+
+    def rpc_stopEventDispatcher(self):
+        with self.cond:
+            dispatchers, self.dispatchers = self.dispatchers, []
+        for conn in dispatchers:
+            conn.close()
+
+    # Bluetooth, data written comes back to reads {{{1
+    def rpc_bluetoothWriteBinary(self, base64data, connID=''):
+        self.bluetooth.extend(base64.b64decode(base64data))
+
+    def rpc_bluetoothReadBinary(self, bufferSize=4096, connID=''):
+        data = bytes(self.bluetooth[:bufferSize])
+        del self.bluetooth[:bufferSize]
+        return base64.b64encode(data).decode("ascii")
+
+    # FullScreenUI {{{1
+    def rpc_fullShow(self, layout, title=None):
+        self.views = {}
+        for tag, attrs in re.findall(r"<(\w+)([^<>]*)>", layout):
+            m = re.search(r'android:id="@\+?id/(\w+)"', attrs)
+            if m is None:
+                continue
+            props = {"type": tag, "visibility": "0", "text": "",
+                     "enabled": "true", "checked": "false"}
+            for k, v in re.findall(r'android:(\w+)="([^"]*)"', attrs):
+                if k != "id":
+                    props[k] = v
+            self.views[m.group(1)] = props
+        if title is not None:
+            self.title = title
+        return []
+
+    def rpc_fullSetTitle(self, title):
+        self.title = title
+
+    def rpc_fullDismiss(self):
+        self.views = {}
+
+    def rpc_fullQuery(self):
+        return dict((k, dict(v)) for k, v in self.views.items())
+
+    def rpc_fullQueryDetail(self, id):
+        return dict(self.views[id])
+
+    def rpc_fullSetProperty(self, id, property, value):
+        self.views[id][property] = value
+        return "OK"
+
+    def rpc_fullSetList(self, id, list):
+        self.views[id]["list"] = list
+        return "OK"
+
+
+class Handler(socketserver.StreamRequestHandler):
+    # answer pipelined requests without waiting for delayed ACKs.
+    disable_nagle_algorithm = True
+
+    def handle(self):
+        emu = self.server.emulator
+        session = {"authenticated": emu.handshake is None}
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                break
+            req = json.loads(line.decode("utf-8"))
+            result, error = emu.call(session, req["method"],
+                                     req.get("params", []))
+            res = {"id": req["id"], "result": result, "error": error}
+            self.wfile.write((json.dumps(res) + "\n").encode("ascii"))
+            self.wfile.flush()
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.TCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, addr, emulator=None):
+        socketserver.TCPServer.__init__(self, addr, Handler)
+        self.emulator = emulator or Emulator()
+
+
+def start(port=0, handshake=None, results=None):
+    """runs a server in a background thread, returns it.
+
+    server.server_address is the address to give android.Android().
+    """
+    server = Server(("127.0.0.1", port), Emulator(handshake, results))
+    th = threading.Thread(target=server.serve_forever)
+    th.daemon = True
+    th.start()
+    return server
+
+
+def main():
+    logging.getLogger("").setLevel(logging.INFO)
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    handshake = sys.argv[2] if len(sys.argv) > 2 else None
+    server = Server(("127.0.0.1", port), Emulator(handshake))
+    host, port = server.server_address
+    print("export AP_HOST=%s AP_PORT=%d" % (host, port))
+    if handshake is not None:
+        print("export AP_HANDSHAKE=%s" % handshake)
+    info("serving, Ctrl-C to stop.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker
@@ -0,0 +1,86 @@
+#!env python3
+#
+# Copyright (C) 2026 shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy
+# of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+"""tests of the aioandroid.py client against sl4aserver.py.
+
+usage: python3 test_aioandroid.py
+"""
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "python3-alpha", "python-libs", "ase"))
+import aioandroid  # noqa: E402
+from test_android import EmulatorTestCase  # noqa: E402
+
+# a reply over the 64KiB line limit of asyncio streams.
+LONG_REPLY = ["x" * 1000] * 100
+
+
+class AsyncTest(EmulatorTestCase):
+    results = {"longReply": LONG_REPLY}
+
+    def run_async(self, fn):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            return loop.run_until_complete(fn())
+        finally:
+            loop.close()
+            asyncio.set_event_loop(None)
+
+    def test_gather(self):
+        async def main():
+            droid = await aioandroid.connect(self.addr)
+            ret = await asyncio.gather(droid.batteryGetLevel(),
+                                       droid.getDeviceId())
+            droid.close()
+            return [i.result for i in ret]
+        self.assertEqual(self.run_async(main), [87, "000000000000000"])
+
+    def test_longReply(self):
+        async def main():
+            droid = await aioandroid.connect(self.addr)
+            ret = await droid.longReply()
+            droid.close()
+            return ret.result
+        self.assertEqual(self.run_async(main), LONG_REPLY)
+
+    def test_overLimit(self):
+        """a reply over the limit fails its call only."""
+        async def main():
+            droid = await aioandroid.connect(self.addr)
+            ret = await asyncio.gather(droid.longReply(),
+                                       droid.batteryGetLevel(),
+                                       return_exceptions=True)
+            ret.append(await droid.getDeviceId())
+            droid.close()
+            return ret
+        limit, aioandroid.LIMIT = aioandroid.LIMIT, 1000
+        try:
+            over, level, devid = self.run_async(main)
+        finally:
+            aioandroid.LIMIT = limit
+        self.assertIsInstance(over, ValueError)
+        self.assertEqual(level.result, 87)
+        self.assertEqual(devid.result, "000000000000000")
+
+
+if __name__ == "__main__":
+    unittest.main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker
@@ -0,0 +1,362 @@
+#!env python
+#
+# Copyright (C) 2026 shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy
+# of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+"""tests of the android.py client against sl4aserver.py.
+
+usage: python test_android.py (python2 or python3)
+"""
+from __future__ import print_function
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                "..", "python-build", "python-libs", "ase"))
+import android  # noqa: E402
+import sl4aserver  # noqa: E402
+
+
+class EmulatorTestCase(unittest.TestCase):
+    """runs a sl4aserver for each test."""
+    results = None
+
+    def setUp(self):
+        self.server = sl4aserver.start(handshake=android.HANDSHAKE,
+                                       results=self.results)
+        self.addr = self.server.server_address
+        self.emulator = self.server.emulator
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class PoolTest(EmulatorTestCase):                           # {{{1
+
+    def test_call(self):
+        pool = android.AndroidPool(2, self.addr)
+        self.assertEqual(pool.batteryGetLevel().result, 87)
+        self.assertEqual(pool.getDeviceId().result, "000000000000000")
+        self.assertEqual(pool._opened, 1)
+        pool.close()
+
+    def test_threads(self):
+        pool = android.AndroidPool(2, self.addr)
+        results = []
+
+        def worker():
+            for i in range(20):
+                results.append(pool.batteryGetLevel().result)
+
+        threads = [threading.Thread(target=worker) for i in range(4)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        self.assertEqual(results, [87] * 80)
+        self.assertTrue(pool._opened <= 2)
+        pool.close()
+
+    def test_discardWakesWaiter(self):
+        """a thread waiting for a full pool gets a connection when the
+        one held is discarded."""
+        pool = android.AndroidPool(1, self.addr)
+        results = []
+        th = threading.Thread(
+            target=lambda: results.append(pool.batteryGetLevel().result))
+        th.daemon = True
+        try:
+            with pool.connection():
+                th.start()
+                time.sleep(0.1)
+                raise ValueError("broken response")
+        except ValueError:
+            pass
+        th.join(5)
+        self.assertFalse(th.is_alive())
+        self.assertEqual(results, [87])
+        self.assertEqual(pool._opened, 1)
+        pool.close()
+
+
+LAYOUT = """<LinearLayout>
+  <TextView android:id="@+id/text1" android:text="before" />
+</LinearLayout>"""
+
+
+class CacheTest(EmulatorTestCase):                          # {{{1
+
+    def setUp(self):
+        EmulatorTestCase.setUp(self)
+        self.droid = android.Android(self.addr)
+
+    def tearDown(self):
+        self.droid.close()
+        EmulatorTestCase.tearDown(self)
+
+    def test_cached(self):
+        self.droid.enable_cache()
+        for i in range(3):
+            self.assertEqual(self.droid.getDeviceId().result,
+                             "000000000000000")
+        self.assertEqual(self.emulator.calls["getDeviceId"], 1)
+        self.droid.invalidate("getDeviceId")
+        self.droid.getDeviceId()
+        self.assertEqual(self.emulator.calls["getDeviceId"], 2)
+
+    def test_fullQueryNotCached(self):
+        """the views change on the screen without facade calls."""
+        self.droid.enable_cache()
+        self.droid.fullShow(LAYOUT)
+        self.droid.fullQuery()
+        self.droid.fullQuery()
+        self.assertEqual(self.emulator.calls["fullQuery"], 2)
+
+    def test_invalidates(self):
+        self.droid.enable_cache(facades=["fullQuery"])
+        self.droid.fullShow(LAYOUT)
+        self.droid.fullQuery()
+        self.droid.fullSetProperty("text1", "text", "after")
+        self.assertEqual(self.droid.fullQuery().result["text1"]["text"],
+                         "after")
+
+    def test_batchInvalidates(self):
+        """a write in a batch drops the cached fullQuery too."""
+        self.droid.enable_cache(facades=["fullQuery"])
+        self.droid.fullShow(LAYOUT)
+        self.assertEqual(self.droid.fullQuery().result["text1"]["text"],
+                         "before")
+        with self.droid.batch() as b:
+            b.fullSetProperty("text1", "text", "after")
+        self.assertEqual(self.droid.fullQuery().result["text1"]["text"],
+                         "after")
+
+
+class LostReply(object):
+    """a socket file losing the connection when a reply is read."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def readline(self):
+        self._client.readline()
+        raise IOError("connection reset")
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class Replies(object):
+    """a socket file answering with the lines given."""
+
+    def __init__(self, client, lines):
+        self._client = client
+        self._lines = list(lines)
+
+    def readline(self):
+        return self._lines.pop(0)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+
+class ClientTest(EmulatorTestCase):                         # {{{1
+
+    def test_codecs(self):
+        for name in sorted(android.CODECS):
+            droid = android.Android(self.addr, name)
+            self.assertEqual(droid.batteryGetLevel().result, 87, name)
+            self.assertEqual(droid.getDeviceId().result, "000000000000000",
+                             name)
+            ret = droid.noSuchFacade()
+            self.assertTrue(ret.error.startswith("Unknown RPC"), name)
+            droid.close()
+
+    def test_codecName(self):
+        """a unicode name, as read from a config by python2."""
+        self.assertTrue(isinstance(android.get_codec(u"bytes"),
+                                   android.BytesCodec))
+        codec = android.JsonCodec()
+        self.assertTrue(android.get_codec(codec) is codec)
+
+    def test_batch(self):
+        droid = android.Android(self.addr)
+        with droid.batch() as b:
+            b.batteryGetLevel()
+            b.noSuchFacade()
+            b.getDeviceId()
+            self.assertEqual(len(b), 3)
+            self.assertEqual(self.emulator.calls["batteryGetLevel"], 0)
+        level, error, device = b.results
+        self.assertEqual(level.result, 87)
+        self.assertTrue(error.error is not None)
+        self.assertEqual(device.result, "000000000000000")
+        self.assertEqual(droid.batteryGetLevel().result, 87)
+        droid.close()
+
+    def test_batchClosed(self):
+        droid = android.Android(self.addr)
+        droid.client = Replies(droid.client, [
+            '{"id": 0, "result": 87, "error": null}\n', ''])
+        with self.assertRaises(IOError):
+            with droid.batch() as b:
+                b.batteryGetLevel()
+                b.batteryGetLevel()
+        droid.close()
+
+    def test_batchUnknownId(self):
+        for first in ("5", "0"):
+            droid = android.Android(self.addr)
+            droid.client = Replies(droid.client, [
+                '{"id": 0, "result": 87, "error": null}\n',
+                '{"id": %s, "result": 87, "error": null}\n' % first])
+            with self.assertRaises(IOError):
+                with droid.batch() as b:
+                    b.batteryGetLevel()
+                    b.batteryGetLevel()
+            droid.close()
+
+    def test_batchRaises(self):
+        droid = android.Android(self.addr)
+        try:
+            with droid.batch() as b:
+                b.batteryGetLevel()
+                raise ValueError("in the block")
+        except ValueError:
+            pass
+        self.assertEqual(self.emulator.calls["batteryGetLevel"], 0)
+        droid.close()
+
+    def test_reconnect(self):
+        droid = android.Android(self.addr, reconnect=True)
+        droid.conn.shutdown(socket.SHUT_RDWR)
+        self.assertEqual(droid.batteryGetLevel().result, 87)
+        self.assertEqual(droid.getDeviceId().result, "000000000000000")
+        droid.close()
+
+    def test_reconnectNotResent(self):
+        """a call lost after it was sent is not run twice."""
+        droid = android.Android(self.addr, reconnect=True)
+        droid.client = LostReply(droid.client)
+        self.assertRaises(IOError, droid.eventPost, "name", "data")
+        self.assertEqual(self.emulator.calls["eventPost"], 1)
+        self.assertEqual(droid.batteryGetLevel().result, 87)
+        droid.close()
+
+    def test_reconnectCacheable(self):
+        droid = android.Android(self.addr, reconnect=True)
+        droid.client = LostReply(droid.client)
+        self.assertEqual(droid.getDeviceId().result, "000000000000000")
+        self.assertEqual(self.emulator.calls["getDeviceId"], 2)
+        droid.close()
+
+    def test_noReconnect(self):
+        droid = android.Android(self.addr, reconnect=False)
+        droid.conn.shutdown(socket.SHUT_RDWR)
+        self.assertRaises((IOError, OSError), droid.batteryGetLevel)
+
+
+class EventTest(EmulatorTestCase):                          # {{{1
+
+    def setUp(self):
+        EmulatorTestCase.setUp(self)
+        self.droid = android.Android(self.addr)
+        self.posting = True
+        self.poster = threading.Thread(target=self.post)
+        self.poster.daemon = True
+
+    def tearDown(self):
+        self.posting = False
+        self.poster.join()
+        self.droid.close()
+        EmulatorTestCase.tearDown(self)
+
+    def post(self):
+        # after the dispatcher connected, it gets the events posted later.
+        time.sleep(0.1)
+        self.emulator.post_event("wanted", 1)
+        stop = time.time() + 3
+        while self.posting and time.time() < stop:
+            self.emulator.post_event("other", None)
+            time.sleep(0.02)
+
+    def check_timeout(self, dispatcher):
+        """the events dropped by names do not keep the stream alive."""
+        self.poster.start()
+        t = time.time()
+        events = list(self.droid.events("wanted", timeout=0.3,
+                                        dispatcher=dispatcher))
+        self.assertTrue(time.time() - t < 2)
+        self.assertEqual([event["data"] for event in events], [1])
+
+    def test_timeout(self):
+        self.check_timeout(False)
+
+    def test_timeoutDispatcher(self):
+        self.check_timeout(True)
+
+
+class BluetoothTest(EmulatorTestCase):                      # {{{1
+
+    def setUp(self):
+        EmulatorTestCase.setUp(self)
+        self.droid = android.Android(self.addr)
+
+    def tearDown(self):
+        self.droid.close()
+        EmulatorTestCase.tearDown(self)
+
+    def test_readinto(self):
+        data = bytes(bytearray(range(256))) * 4
+        self.assertTrue(self.droid.bluetooth_write(data, chunk_size=300))
+        buf = bytearray(1000)
+        self.assertEqual(self.droid.bluetooth_readinto(buf), 1000)
+        self.assertEqual(bytes(buf), data[:1000])
+        self.assertEqual(self.droid.bluetooth_readinto(buf), 24)
+        self.assertEqual(bytes(buf[:24]), data[1000:])
+        self.assertEqual(self.droid.bluetooth_readinto(buf), 0)
+
+    def test_stream(self):
+        data = b"0123456789" * 10
+        self.droid.bluetooth_write(data)
+        chunks = [view.tobytes() for view in self.droid.bluetooth_stream(30)]
+        self.assertEqual([len(chunk) for chunk in chunks], [30, 30, 30, 10])
+        self.assertEqual(b"".join(chunks), data)
+
+    def test_readError(self):
+        """a dropped connection is not an idle one."""
+        def read(bufferSize=4096, connID=''):
+            raise TypeError("Bluetooth connection closed")
+        self.emulator.rpc_bluetoothReadBinary = read
+        self.assertRaises(IOError, self.droid.bluetooth_readinto,
+                          bytearray(4))
+        self.assertRaises(IOError, list, self.droid.bluetooth_stream())
+
+    def test_longReply(self):
+        """a reply over the size asked for is an error, not a partial
+        copy."""
+        self.emulator.rpc_bluetoothReadBinary = (
+            lambda bufferSize=4096, connID='': "MDEyMzQ1Njc4OQ==")
+        self.assertRaises(IOError, self.droid.bluetooth_readinto,
+                          bytearray(4))
+
+
+if __name__ == "__main__":
+    unittest.main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker
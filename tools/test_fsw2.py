@@ -0,0 +1,113 @@
+#!env python
+#
+# Copyright (C) 2026 shimoda
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not
+# use this file except in compliance with the License. You may obtain a copy
+# of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+#
+"""tests of sl4atools/fullscreenwrapper2 against sl4aserver.py.
+
+usage: python test_fsw2.py (python2 or python3)
+"""
+from __future__ import print_function
+import os
+import sys
+import unittest
+
+_top = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(_top, "python-build", "python-libs", "ase"))
+import android  # noqa: E402
+from test_android import EmulatorTestCase  # noqa: E402
+if sys.version_info[0] == 2:
+    sys.path.insert(0, os.path.join(_top, "sl4atools", "fullscreenwrapper2"))
+    import fullscreenwrapper2 as fsw2
+else:
+    sys.path.insert(0, os.path.join(_top, "sl4atools", "fullscreenwrapper2",
+                                    "py3"))
+    import fullscreenwrapper2_py3 as fsw2
+
+
+class TextLayout(fsw2.Layout):
+    def __init__(self):
+        super(TextLayout, self).__init__(
+            '<LinearLayout><TextView android:id="@+id/text1" '
+            'android:text="shown"/></LinearLayout>', "test")
+
+    def on_show(self):
+        pass
+
+    def on_close(self):
+        pass
+
+
+class BatchTest(EmulatorTestCase):
+
+    def setUp(self):
+        EmulatorTestCase.setUp(self)
+        self.droid = android.Android(self.addr)
+        # as a script caching its queries.
+        self.droid.enable_cache(facades=["fullQuery"])
+        fsw2.FullScreenWrapper2App.initialize(self.droid)
+        self.layout = TextLayout()
+        fsw2.FullScreenWrapper2App.show_layout(self.layout)
+
+    def tearDown(self):
+        del fsw2.FullScreenWrapper2App._layouts[:]
+        self.droid.close()
+        EmulatorTestCase.tearDown(self)
+
+    def shown_text(self):
+        return self.emulator.views["text1"]["text"]
+
+    def test_batch(self):
+        with self.layout.batch():
+            self.layout.views.text1.text = "one"
+            self.layout.views.text1.text = "two"
+            self.assertEqual(self.shown_text(), "shown")
+        self.assertEqual(self.shown_text(), "two")
+        self.assertEqual(self.emulator.calls["fullSetProperty"], 1)
+
+    def test_snapshotAfterBatch(self):
+        """the property read after a batch is the one written, not a
+        cached fullQuery."""
+        self.assertEqual(self.layout.views.text1.text, "shown")
+        with self.layout.batch():
+            self.layout.views.text1.text = "two"
+        self.layout.invalidate_properties()
+        self.assertEqual(self.layout.views.text1.text, "two")
+
+    def test_batchRaises(self):
+        def update():
+            with self.layout.batch():
+                self.layout.views.text1.text = "broken"
+                raise ValueError("in the block")
+        self.assertRaises(ValueError, update)
+        self.assertEqual(self.shown_text(), "shown")
+        self.assertEqual(self.emulator.calls["fullSetProperty"], 0)
+        with self.layout.batch():
+            pass
+        self.assertEqual(self.emulator.calls["fullSetProperty"], 0)
+
+    def test_showDropsWrites(self):
+        """the writes held for the views of a layout shown before are
+        not sent to the views shown again."""
+        with self.layout.batch():
+            self.layout.views.text1.text = "old"
+            fsw2.FullScreenWrapper2App.show_layout(
+                self.layout, fsw2.FullScreenWrapper2App.
+                SHOW_LAYOUT_REPLACING_CURRENT)
+        self.assertEqual(self.shown_text(), "shown")
+
+
+if __name__ == "__main__":
+    unittest.main()
+# vi: ft=python:et:ts=4:nowrap:fdm=marker